@@ -53,6 +53,8 @@ def filter_statistics_output(output):
         r'API calls made:',
         r'Cache hits:',
         r'Cache hit rate:',
+        r'Local index hits:',
+        r'Entity memo hit rate:',
         r'Success rate:',
         r'Loading completed!',
         r'Textbook:',
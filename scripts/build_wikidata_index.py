@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Wikidata Dump Index Builder
+
+This script streams a local Wikidata JSON dump (the official latest-all.json
+format, or JSON-lines / a filtered subset, optionally .gz or .bz2) and builds
+an on-disk label/alias -> QID index with entity details. The concept
+extraction pipeline can then resolve entities locally instead of calling the
+Wikidata API.
+
+Features:
+- Streaming parse with bounded memory
+- Multi-process parsing
+- Incremental builds (resumes after interruption, skips unchanged entities)
+
+Usage:
+    python scripts/build_wikidata_index.py --dump latest-all.json.gz --index wikidata_index.sqlite
+    python scripts/build_wikidata_index.py --dump subset.jsonl --index wikidata_index.sqlite --workers 8
+    python scripts/build_wikidata_index.py --index wikidata_index.sqlite --stats
+
+    # Use the index during import
+    python scripts/load_textbooks.py --textbook-path textbooks/osbooks-biology-bundle --wikidata-dump-index wikidata_index.sqlite
+"""
+
+import sys
+import time
+import logging
+from pathlib import Path
+import click
+
+# Add src directory to Python path to enable imports
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+from textbook_parse.concept_extraction.dump_index import build_dump_index, WikidataDumpIndex
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+@click.command()
+@click.option('--dump', 'dump_path', default=None, help='Path to the Wikidata JSON dump (.json, .jsonl, .gz, .bz2)')
+@click.option('--index', 'index_path', default='wikidata_index.sqlite', help='Index file to create or update (default: wikidata_index.sqlite)')
+@click.option('--workers', type=int, default=4, help='Number of parser processes (default: 4)')
+@click.option('--chunk-lines', type=int, default=2000, help='Dump lines per parser task (default: 2000)')
+@click.option('--language', default='en', help='Language of labels and aliases to index (default: en)')
+@click.option('--restart', is_flag=True, help='Ignore the stored offset and re-scan the dump from the start')
+@click.option('--stats', is_flag=True, help='Show index statistics and exit')
+def main(dump_path: str, index_path: str, workers: int, chunk_lines: int, language: str, restart: bool, stats: bool):
+    """Build a local Wikidata lookup index from a dump file."""
+
+    print("WIKIDATA DUMP INDEX BUILDER")
+    print("=" * 50)
+
+    if stats:
+        try:
+            index_stats = WikidataDumpIndex(index_path).get_stats()
+        except FileNotFoundError as e:
+            print(f"ERROR: {e}")
+            return
+        print(f"Index: {index_path}")
+        print(f"Entities: {index_stats['entities']}")
+        print(f"Terms: {index_stats['terms']}")
+        print(f"Complete: {index_stats['complete']}")
+        return
+
+    if not dump_path:
+        print("ERROR: --dump is required to build an index")
+        print("Use --help to see available options")
+        return
+
+    if not Path(dump_path).exists():
+        print(f"ERROR: Dump file not found: {dump_path}")
+        return
+
+    print(f"Dump: {dump_path}")
+    print(f"Index: {index_path}")
+    print(f"Workers: {workers}")
+
+    start_time = time.time()
+    try:
+        build_stats = build_dump_index(dump_path, index_path, workers=workers, chunk_lines=chunk_lines,
+                                       language=language, restart=restart)
+    except KeyboardInterrupt:
+        print("\nBuild interrupted - re-run the same command to resume")
+        return
+
+    print("\n=== INDEX BUILD COMPLETE ===")
+    print(f"Entities seen: {build_stats['entities_seen']}")
+    print(f"Entities written: {build_stats['entities_written']}")
+    print(f"Entities unchanged: {build_stats['entities_unchanged']}")
+    print(f"Duration: {time.time() - start_time:.2f} seconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -33,6 +33,12 @@ Usage:
     # Use more workers for faster concept extraction
     python scripts/load_textbooks.py --textbook-path textbooks/osbooks-biology-bundle --workers 8
     
+    # Resolve concepts against a local Wikidata dump index instead of the API
+    python scripts/load_textbooks.py --textbook-path textbooks/osbooks-biology-bundle --wikidata-dump-index wikidata_index.sqlite
+    
+    # Re-run extraction matching only already-known concepts (no spaCy)
+    python scripts/load_textbooks.py --textbook-path textbooks/osbooks-biology-bundle --force --entity-extractor gazetteer
+    
     # Delete a specific collection
     python scripts/load_textbooks.py --delete-collection biology-2e
     
@@ -63,10 +69,12 @@ from textbook_parse.xml_parser import OpenStaxXMLParser
 from textbook_parse.bulk_import import create_bulk_importer
 from textbook_parse.concept_extraction.main import ConceptExtractionSystem
 from textbook_parse.concept_extraction.sequential_processor import SequentialCollectionProcessor
+from textbook_parse.concept_extraction.progress_journal import iter_sentences_progress
 from neo4j_utils.relationships import Neo4jRelationshipCreator
 from typing import List, Dict
 from datetime import datetime
 from neo4j_utils import Neo4jSchemaSetup, Neo4jNodeCreator, Neo4jRelationshipCreator
+from neo4j_utils.import_generation import bump_import_generation
 from neo4j import GraphDatabase
 
 # Configure logging - Show INFO level and above
@@ -87,7 +95,8 @@ def check_for_json_resume_files(textbook_dir: Path) -> List[Path]:
     """Check for existing JSON files that can be used for resume processing.
     
     This function looks for JSON files based on the actual collection names in the textbook.
-    It searches for files with the pattern [collection_name]_sentences.json.
+    It searches for progress journals named [collection_name]_sentences.jsonl and
+    falls back to legacy [collection_name]_sentences.json files.
     
     Args:
         textbook_dir: Path to the textbook directory
@@ -122,10 +131,12 @@ def check_for_json_resume_files(textbook_dir: Path) -> List[Path]:
         # Also remove any trailing periods that might be present
         collection_name = collection_name.rstrip('.')
         
-        # Look for [collection_name]_sentences.json file in the project root
+        # Look for [collection_name]_sentences.jsonl (or legacy .json) in the project root
         # (JSON files are typically in the same directory as the script)
         project_root = textbook_dir.parent.parent  # Go up from textbooks/ to project root
-        json_file = project_root / f"{collection_name}_sentences.json"
+        json_file = project_root / f"{collection_name}_sentences.jsonl"
+        if not json_file.exists():
+            json_file = project_root / f"{collection_name}_sentences.json"
         
         if json_file.exists():
             json_files.append(json_file)
@@ -252,6 +263,7 @@ def resume_from_json_files(sequential_processor, json_files: List[Path], force:
         'sentences_processed': 0,
         'relationships_created': 0,
         'concepts_imported': 0,
+        'missing_sentences': 0,
         'files_processed': 0
     }
     
@@ -259,12 +271,9 @@ def resume_from_json_files(sequential_processor, json_files: List[Path], force:
         print(f"\nProcessing resume file: {json_file.name}")
         
         try:
-            # First, ensure sentences have proper paragraph relationships
-            import json
-            with open(json_file, 'r', encoding='utf-8') as f:
-                sentences_data = json.load(f)
-            
-            sentence_ids = list(sentences_data.keys())
+            # First, ensure sentences have proper paragraph relationships; only the IDs
+            # are kept, the concept import below streams the file again
+            sentence_ids = [sentence_id for sentence_id, _ in iter_sentences_progress(json_file)]
             
             # Ensure proper sentence-to-paragraph relationships
             print(f"Ensuring proper relationships for {len(sentence_ids)} sentences...")
@@ -286,14 +295,20 @@ def resume_from_json_files(sequential_processor, json_files: List[Path], force:
                 print(f"Importing concepts from {json_file.name}...")
                 concept_stats = sequential_processor.import_concepts_from_sentence_file(json_file)
             
+            # Record the book as imported so extraction is not repeated for it
+            if concept_stats['concepts_imported'] > 0:
+                sequential_processor.mark_concepts_imported(json_file.name.split('_sentences')[0])
+            
             total_stats['sentences_processed'] += concept_stats['sentences_processed']
             total_stats['concepts_imported'] += concept_stats['concepts_imported']
+            total_stats['missing_sentences'] += concept_stats['missing_sentences']
             total_stats['files_processed'] += 1
             
             print(f"File {json_file.name} completed:")
             print(f"  Sentences: {concept_stats['sentences_processed']}")
             print(f"  Concepts: {concept_stats['concepts_imported']}")
             print(f"  Relationships: {concept_stats['relationships_created']}")
+            print(f"  Missing sentences: {concept_stats['missing_sentences']}")
             
         except Exception as e:
             print(f"Error processing {json_file.name}: {e}")
@@ -315,96 +330,13 @@ def force_import_concepts_from_sentence_file(sequential_processor, sentences_fil
     Returns:
         Dictionary with import statistics
     """
-    stats = {
-        'sentences_processed': 0,
-        'concepts_imported': 0,
-        'relationships_created': 0
-    }
-    
     try:
-        # Load sentences data
-        import json
-        with open(sentences_file, 'r', encoding='utf-8') as f:
-            sentences_data = json.load(f)
-        
         print(f"Force importing concepts from {sentences_file}")
-        
-        with sequential_processor.driver.session(database=sequential_processor.neo4j_database) as session:
-            for sentence_id, sentence_data in sentences_data.items():
-                entities = sentence_data.get('entities', {})
-                
-                if entities:
-                    # Process each entity with a Wikidata ID
-                    for entity_name, entity_data in entities.items():
-                        if entity_data.get('wikidata_id'):
-                            wikidata_id = entity_data['wikidata_id']
-                            
-                            # Force create/update concept node with all expected fields
-                            force_concept_query = """
-                            // First, verify the sentence exists
-                            MATCH (s:Sentence {sentence_id: $sentence_id})
-                            
-                            // Only proceed if sentence exists
-                            WITH s
-                            
-                            // Force create/update the concept node with all expected fields
-                            MERGE (c:Concept {wikidata_id: $wikidata_id})
-                            ON CREATE SET
-                                c.name = $name,
-                                c.wikidata_name = $name,
-                                c.label = $name,
-                                c.description = $description,
-                                c.aliases = $aliases,
-                                c.wikidata_url = $wikidata_url,
-                                c.created_at = datetime(),
-                                c.updated_at = datetime()
-                            ON MATCH SET
-                                c.name = $name,
-                                c.wikidata_name = $name,
-                                c.label = $name,
-                                c.description = $description,
-                                c.aliases = $aliases,
-                                c.wikidata_url = $wikidata_url,
-                                c.updated_at = datetime()
-                            
-                            // Force recreate bidirectional relationships
-                            MERGE (s)-[r1:SENTENCE_CONTAINS_CONCEPT]->(c)
-                            ON CREATE SET r1.created_at = datetime()
-                            ON MATCH SET r1.updated_at = datetime()
-                            
-                            MERGE (c)-[r2:CONCEPT_BELONGS_TO_SENTENCE]->(s)
-                            ON CREATE SET r2.created_at = datetime()
-                            ON MATCH SET r2.updated_at = datetime()
-                            
-                            RETURN c.wikidata_id as concept_id
-                            """
-                            
-                            # Apply standard property keys for missing fields
-                            description = entity_data.get('description', entity_name)
-                            aliases = entity_data.get('aliases', [entity_name])
-                            wikidata_url = f"https://www.wikidata.org/wiki/{wikidata_id}"
-                            
-                            result = session.run(force_concept_query, {
-                                'sentence_id': sentence_id,
-                                'name': entity_name,
-                                'wikidata_id': wikidata_id,
-                                'description': description,
-                                'aliases': aliases,
-                                'wikidata_url': wikidata_url
-                            })
-                            
-                            record = result.single()
-                            if record:
-                                stats['concepts_imported'] += 1
-                                stats['relationships_created'] += 2  # Bidirectional
-                
-                stats['sentences_processed'] += 1
-                
-                # Progress update
-                if stats['sentences_processed'] % 1000 == 0:
-                    print(f"  Force processed {stats['sentences_processed']} sentences, imported {stats['concepts_imported']} concepts")
+        stats = sequential_processor.import_concepts_from_sentence_file(sentences_file, force=True)
         
         print(f"Force concept import completed: {stats['concepts_imported']} concepts force imported for {stats['sentences_processed']} sentences")
+        if stats['missing_sentences']:
+            print(f"  Skipped {stats['missing_sentences']} sentences not found in the database")
         return stats
         
     except Exception as e:
@@ -436,6 +368,20 @@ def check_collection_exists(uri: str, username: str, password: str, database: st
             driver.close()
 
 
+def bump_graph_import_generation(uri: str, username: str, password: str, database: str) -> None:
+    """Record that textbook content changed so the LLM client drops its cached hierarchies."""
+    try:
+        driver = GraphDatabase.driver(uri, auth=(username, password))
+        with driver.session(database=database) as session:
+            generation = bump_import_generation(session)
+            logger.info(f"Import generation is now {generation}")
+    except Exception as e:
+        logger.warning(f"Could not bump import generation: {e}")
+    finally:
+        if 'driver' in locals():
+            driver.close()
+
+
 def list_available_textbooks_and_collections(uri: str, username: str, password: str, database: str) -> None:
     """List all available textbooks and collections in the database."""
     try:
@@ -793,11 +739,15 @@ def clear_entire_database(uri: str, username: str, password: str, database: str)
 @click.option('--list-textbooks', is_flag=True, help='List available textbooks and collections in database')
 @click.option('--no-concepts', is_flag=True, help='Skip concept extraction (concepts are extracted by default)')
 @click.option('--workers', type=int, default=4, help='Number of workers for concept extraction (default: 4)')
+@click.option('--wikidata-dump-index', default=None, help='Local Wikidata dump index to use instead of the Wikidata API (see scripts/build_wikidata_index.py)')
+@click.option('--entity-extractor', type=click.Choice(['spacy', 'gazetteer', 'hybrid']), default='spacy', help='Entity extraction: spacy (default), gazetteer (known concepts only, fast re-runs) or hybrid (gazetteer matches merged with spaCy)')
+@click.option('--nlp-processes', type=int, default=1, help='Number of processes for spaCy entity extraction (default: 1)')
+@click.option('--export-legacy-json', is_flag=True, help='Also write legacy [collection]_sentences.json files next to the progress journals')
 @click.option('--force', is_flag=True, help='Force re-import of concepts from JSON files, bypassing existing checks')
 @click.option('--delete-textbook', help='Delete all collections from a specific textbook (provide textbook name)')
 @click.option('--delete-collection', help='Delete a specific collection (provide collection name)')
 @click.option('--cleanup-orphans', is_flag=True, help='Clean up orphaned nodes (nodes without relationships)')
-def main(textbook_path: str, collection: str, cleanup: bool, dry_run: bool, list_collections: bool, list_textbooks: bool, no_concepts: bool, workers: int, force: bool, delete_textbook: str, delete_collection: str, cleanup_orphans: bool):
+def main(textbook_path: str, collection: str, cleanup: bool, dry_run: bool, list_collections: bool, list_textbooks: bool, no_concepts: bool, workers: int, wikidata_dump_index: str, entity_extractor: str, nlp_processes: int, export_legacy_json: bool, force: bool, delete_textbook: str, delete_collection: str, cleanup_orphans: bool):
     """Load OpenStax textbook content into Neo4j database with automatic concept extraction.
     
     This script loads textbook content and automatically extracts concepts using Wikidata.
@@ -849,6 +799,7 @@ def main(textbook_path: str, collection: str, cleanup: bool, dry_run: bool, list
     # Handle orphan cleanup
     if cleanup_orphans:
         success = cleanup_orphaned_nodes(uri, username, password, database)
+        bump_graph_import_generation(uri, username, password, database)
         if success:
             print(f"\nOrphan cleanup completed successfully")
             print(f"Neo4j Browser: http://20.29.35.132:7474")
@@ -865,6 +816,7 @@ def main(textbook_path: str, collection: str, cleanup: bool, dry_run: bool, list
         print("=" * 50)
         
         success = delete_textbook_collections(uri, username, password, database, delete_textbook)
+        bump_graph_import_generation(uri, username, password, database)
         if success:
             print(f"\nSuccessfully deleted textbook: {delete_textbook}")
             print(f"Neo4j Browser: http://20.29.35.132:7474")
@@ -880,6 +832,7 @@ def main(textbook_path: str, collection: str, cleanup: bool, dry_run: bool, list
         print("=" * 50)
         
         success = delete_single_collection(uri, username, password, database, delete_collection)
+        bump_graph_import_generation(uri, username, password, database)
         if success:
             print(f"\nSuccessfully deleted collection: {delete_collection}")
             print(f"Neo4j Browser: http://20.29.35.132:7474")
@@ -1089,7 +1042,11 @@ def main(textbook_path: str, collection: str, cleanup: bool, dry_run: bool, list
                 neo4j_password=password,
                 neo4j_database=database,
                 cache_file="wikidata_cache.json",
-                max_workers=workers
+                max_workers=workers,
+                wikidata_dump_index=wikidata_dump_index,
+                extraction_mode=entity_extractor,
+                nlp_processes=nlp_processes,
+                export_legacy_json=export_legacy_json
             )
             
             # Check for resume capability - look for existing JSON files
@@ -1119,6 +1076,9 @@ def main(textbook_path: str, collection: str, cleanup: bool, dry_run: bool, list
                 print(f"Entities extracted: {concept_stats['entities_extracted']}")
                 print(f"API calls made: {concept_stats.get('api_calls', 0)}")
                 print(f"Cache hits: {concept_stats.get('cache_hits', 0)}")
+                print(f"Local index hits: {concept_stats.get('index_hits', 0)}")
+                print(f"Entity memo hit rate: {concept_stats.get('memo_hit_rate', 0):.1f}% "
+                      f"({concept_stats.get('memo_hits', 0)} hits, {concept_stats.get('memo_misses', 0)} misses)")
                 print(f"Cache hit rate: {concept_stats.get('cache_hit_rate', 0):.1f}%")
                 
                 if concept_stats['sentences_processed'] > 0:
@@ -1179,6 +1139,9 @@ def main(textbook_path: str, collection: str, cleanup: bool, dry_run: bool, list
         print(f"Time before failure: {execution_timedelta}")
         print(f"Duration: {execution_time:.2f} seconds")
     finally:
+        # Content may have changed even if loading failed part-way
+        if not dry_run:
+            bump_graph_import_generation(uri, username, password, database)
         parser.close_connections()
         if bulk_importer:
             bulk_importer.close()
@@ -10,6 +10,8 @@ Features:
 - Performance indexes creation
 - Schema deletion (constraints and indexes)
 - Schema verification
+- book_id backfill for data imported before content nodes carried it
+- Ancestry backfill for data imported before sentences carried it
 - Error handling and reporting
 
 Usage:
@@ -19,6 +21,8 @@ Usage:
     python scripts/setup_neo4j_schema.py --clear-database
     python scripts/setup_neo4j_schema.py --delete-schema
     python scripts/setup_neo4j_schema.py --verify-schema
+    python scripts/setup_neo4j_schema.py --migrate-book-ids
+    python scripts/setup_neo4j_schema.py --materialize-ancestry
 """
 
 import sys
@@ -44,11 +48,14 @@ from config.config_loader import get_neo4j_connection_params
 @click.option('--reset-database', is_flag=True, help='Reset entire database (clear data + delete schema)')
 @click.option('--verify-schema', is_flag=True, help='Verify schema setup')
 @click.option('--show-schema', is_flag=True, help='Show detailed schema information')
+@click.option('--migrate-book-ids', is_flag=True, help='Create book_id indexes and backfill book_id on existing content nodes')
+@click.option('--materialize-ancestry', is_flag=True, help='Backfill book/chapter/document/section IDs and titles onto existing paragraphs and sentences')
 @click.option('--test', is_flag=True, help='Test connection only')
 def main(uri: str, username: str, password: str, database: str,
          setup_schema: bool, create_sample_data: bool, 
          delete_schema: bool, clear_database: bool, reset_database: bool,
-         verify_schema: bool, show_schema: bool, test: bool):
+         verify_schema: bool, show_schema: bool, migrate_book_ids: bool, materialize_ancestry: bool,
+         test: bool):
     
     # Load from config if parameters not provided
     if uri is None or username is None or password is None or database is None:
@@ -102,6 +109,20 @@ def main(uri: str, username: str, password: str, database: str,
                 return
             print("Complete schema setup finished successfully!")
         
+        # Backfill book_id on existing content nodes if requested
+        if migrate_book_ids:
+            print(f"\nMigrating book_id for database: {database}")
+            if not setup.migrate_book_ids():
+                return
+            print("book_id migration completed successfully!")
+        
+        # Backfill materialized ancestry on existing paragraphs and sentences if requested
+        if materialize_ancestry:
+            print(f"\nMaterializing ancestry for database: {database}")
+            if not setup.migrate_ancestry():
+                return
+            print("Ancestry materialization completed successfully!")
+        
         # Create sample data if requested
         if create_sample_data:
             print(f"\nCreating sample data for database: {database}")
@@ -139,7 +160,7 @@ def main(uri: str, username: str, password: str, database: str,
             print(f"\nDetailed schema information for database: {database}")
             setup.show_schema_info()
         
-        if not any([setup_schema, create_sample_data, delete_schema, clear_database, reset_database, verify_schema, show_schema]):
+        if not any([setup_schema, create_sample_data, delete_schema, clear_database, reset_database, verify_schema, show_schema, migrate_book_ids, materialize_ancestry]):
             print("\nNo schema operations specified.")
             print("Use --setup-schema to create complete schema (constraints, indexes, and relationships)")
             print("Use --create-sample-data to create sample nodes and relationships")
@@ -148,6 +169,8 @@ def main(uri: str, username: str, password: str, database: str,
             print("Use --reset-database to clear data and delete schema (complete reset)")
             print("Use --verify-schema to check schema status")
             print("Use --show-schema to display detailed schema information")
+            print("Use --migrate-book-ids to backfill book_id on data imported by older versions")
+            print("Use --materialize-ancestry to backfill sentence ancestry on data imported by older versions")
         
     except KeyboardInterrupt:
         print("\nSetup cancelled by user")
@@ -0,0 +1,252 @@
+"""
+Async Neo4j Graph Retriever Module
+
+This module provides the AsyncGraphRetriever class, an asyncio counterpart of
+GraphRetriever built on AsyncGraphDatabase so that independent retrieval
+queries can run concurrently. It runs the same Cypher as GraphRetriever and
+shares its parameter building, hierarchy caching and result shaping through
+GraphRetrieverBase.
+"""
+
+import asyncio
+from typing import List, Dict, Any, Optional
+from neo4j import AsyncGraphDatabase
+from neo4j.exceptions import ServiceUnavailable, AuthError
+
+from .graph_retriever import (
+    SENTENCE_FULLTEXT_INDEX, CONCEPT_FULLTEXT_INDEX,
+    CONCEPT_FULLTEXT_SEARCH_QUERY, CONCEPT_CONTAINS_SEARCH_QUERY,
+    SENTENCE_FULLTEXT_SEARCH_QUERY, SENTENCE_CONTAINS_SEARCH_QUERY,
+    SENTENCES_FOR_CONCEPTS_QUERY, HIERARCHICAL_CONTEXT_QUERY, RELATED_CONCEPTS_QUERY,
+    BATCHED_CONCEPTS_QUERY, BATCHED_TERM_SENTENCES_QUERY,
+    build_fulltext_query, build_batched_searches, assemble_batched_context, GraphRetrieverBase
+)
+
+
+class AsyncGraphRetriever(GraphRetrieverBase):
+    """Asyncio Neo4j graph retriever for educational content.
+
+    The driver is bound to the event loop it was created on, so an instance
+    must only be used from a single event loop. Pass the sync retriever's
+    hierarchy_cache to share cached hierarchies (and their statistics).
+    """
+
+    async def _connect(self) -> None:
+        """Establish connection to Neo4j database."""
+        if self.driver is None:
+            try:
+                # Use no-auth if no username/password provided
+                if not self.username and not self.password:
+                    self.driver = AsyncGraphDatabase.driver(self.uri)
+                else:
+                    self.driver = AsyncGraphDatabase.driver(self.uri, auth=(self.username, self.password))
+
+                # Test the connection
+                await self.driver.verify_connectivity()
+
+                self.logger.info(f"Connected to Neo4j (async) at {self.uri}")
+
+            except ServiceUnavailable:
+                self.driver = None
+                raise ServiceUnavailable(f"Neo4j is not running or not accessible at {self.uri}")
+            except AuthError:
+                self.driver = None
+                raise AuthError("Authentication failed. Check your Neo4j credentials.")
+            except Exception as e:
+                self.driver = None
+                raise Exception(f"Error connecting to Neo4j: {e}")
+
+    async def _fetch(self, cypher_query: str, **params) -> List[Dict[str, Any]]:
+        """Run a read query in its own session and return all records as dictionaries."""
+        if self.driver is None:
+            await self._connect()
+
+        async with self.driver.session(database=self.database) as session:
+            result = await session.run(cypher_query, **params)
+            return [dict(record) async for record in result]
+
+    async def _run_fulltext_search(self, fulltext_query: str, fallback_query: str, **params) -> List[Dict[str, Any]]:
+        """Run a full-text search, falling back to a CONTAINS scan if the index is missing."""
+        if self.fulltext_status.available and params.get('search'):
+            try:
+                return await self._fetch(fulltext_query, **params)
+            except Exception as e:
+                if not self.fulltext_status.record_error(e):
+                    raise
+                self.logger.warning(f"Full-text search unavailable, falling back to CONTAINS scans "
+                                    f"(run setup_neo4j_schema.py --setup-schema): {e}")
+
+        return await self._fetch(fallback_query, **params)
+
+    async def search_concepts(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search for concepts matching the query terms (see GraphRetriever.search_concepts).
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
+
+        Returns:
+            List of concept dictionaries
+        """
+        try:
+            concepts = await self._run_fulltext_search(
+                CONCEPT_FULLTEXT_SEARCH_QUERY, CONCEPT_CONTAINS_SEARCH_QUERY,
+                index_name=CONCEPT_FULLTEXT_INDEX, search=build_fulltext_query(query),
+                query=query, limit=limit
+            )
+            self.logger.info(f"Found {len(concepts)} concepts for query: {query}")
+            return concepts
+
+        except Exception as e:
+            self.logger.error(f"Error searching concepts: {e}")
+            return []
+
+    async def search_sentences_by_content(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Search for sentences containing the query text (see GraphRetriever.search_sentences_by_content).
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
+
+        Returns:
+            List of sentence dictionaries with context
+        """
+        try:
+            sentences = await self._run_fulltext_search(
+                SENTENCE_FULLTEXT_SEARCH_QUERY, SENTENCE_CONTAINS_SEARCH_QUERY,
+                index_name=SENTENCE_FULLTEXT_INDEX, search=build_fulltext_query(query),
+                query=query, limit=limit
+            )
+            self.logger.info(f"Found {len(sentences)} sentences for query: {query}")
+            return sentences
+
+        except Exception as e:
+            self.logger.error(f"Error searching sentences: {e}")
+            return []
+
+    async def get_sentences_for_concepts(self, concept_ids: List[str], limit: int = 30) -> List[Dict[str, Any]]:
+        """
+        Get sentences linked to specific concepts.
+
+        Args:
+            concept_ids: List of concept IDs
+            limit: Maximum number of results to return
+
+        Returns:
+            List of sentence dictionaries with context
+        """
+        if not concept_ids:
+            return []
+
+        try:
+            sentences = await self._fetch(SENTENCES_FOR_CONCEPTS_QUERY, concept_ids=concept_ids, limit=limit)
+            self.logger.info(f"Found {len(sentences)} sentences for {len(concept_ids)} concepts")
+            return sentences
+
+        except Exception as e:
+            self.logger.error(f"Error getting sentences for concepts: {e}")
+            return []
+
+    async def get_hierarchical_context(self, sentence_ids: List[str]) -> Dict[str, Any]:
+        """
+        Get hierarchical context for sentences (chapter, section, etc.).
+
+        Args:
+            sentence_ids: List of sentence IDs
+
+        Returns:
+            Dictionary containing hierarchical context information
+        """
+        if not sentence_ids:
+            return {}
+
+        try:
+            await self._refresh_hierarchy_cache()
+
+            # Organize context by sentence_id, querying only uncached sentences
+            context, missing_ids = self._split_cached_contexts(sentence_ids)
+            records = []
+            if missing_ids:
+                records = await self._fetch(HIERARCHICAL_CONTEXT_QUERY, sentence_ids=missing_ids)
+            return self._add_queried_contexts(context, records)
+
+        except Exception as e:
+            self.logger.error(f"Error getting hierarchical context: {e}")
+            return {}
+
+    async def _refresh_hierarchy_cache(self) -> None:
+        """Invalidate the hierarchy cache if the import generation changed since the last check."""
+        if not self.hierarchy_cache.generation_check_due():
+            return
+
+        try:
+            from neo4j_utils.import_generation import aget_import_generation
+            if self.driver is None:
+                await self._connect()
+            async with self.driver.session(database=self.database) as session:
+                self.hierarchy_cache.observe_generation(await aget_import_generation(session))
+        except Exception as e:
+            self._import_generation_unavailable(e)
+
+    async def get_related_concepts(self, concept_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get concepts that appear in the same sentences as the given concept.
+
+        Args:
+            concept_id: ID of the concept to find related concepts for
+            limit: Maximum number of related concepts to return
+
+        Returns:
+            List of related concept dictionaries
+        """
+        try:
+            related_concepts = await self._fetch(RELATED_CONCEPTS_QUERY, concept_id=concept_id, limit=limit)
+            self.logger.info(f"Found {len(related_concepts)} related concepts for {concept_id}")
+            return related_concepts
+
+        except Exception as e:
+            self.logger.error(f"Error getting related concepts: {e}")
+            return []
+
+    async def retrieve_for_terms(self, terms: List[str], concepts_per_term: int = 5, concept_limit: int = 10,
+                                 concept_sentence_limit: int = 20, sentences_per_term: int = 10,
+                                 sentence_limit: int = 25, related_limit: int = 5) -> Optional[Dict[str, Any]]:
+        """
+        Batched retrieval for many terms (see GraphRetriever.retrieve_for_terms).
+
+        The concept query and the sentence text search run concurrently.
+
+        Returns:
+            Dictionary with 'concepts', 'sentences', 'hierarchical_context' and
+            'related_concepts', or None if the full-text indexes are unavailable
+        """
+        searches = build_batched_searches(terms)
+
+        if not searches:
+            return assemble_batched_context([], [], [])
+        if not self.fulltext_status.available:
+            return None
+
+        concept_parameters, sentence_parameters = self._batched_parameters(
+            searches, concepts_per_term, concept_limit, concept_sentence_limit,
+            sentences_per_term, sentence_limit, related_limit
+        )
+        try:
+            concept_records, term_sentences = await asyncio.gather(
+                self._fetch(BATCHED_CONCEPTS_QUERY, **concept_parameters),
+                self._fetch(BATCHED_TERM_SENTENCES_QUERY, **sentence_parameters)
+            )
+        except Exception as e:
+            self._batched_search_unavailable(e)
+            return None
+
+        return self._assemble_batched_results(searches, concept_records, term_sentences, sentence_limit)
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        if self.driver:
+            await self.driver.close()
+            self.driver = None
+            self.logger.info("Neo4j async connection closed")
@@ -0,0 +1,214 @@
+"""
+Persistent cache of Cypher queries keyed by normalized question text.
+
+Only queries that executed and returned results are cached; a cached query
+that later returns nothing can be removed with delete().
+
+Lookups have two tiers: an exact match on the normalized question, then a
+similarity match over word unigram/bigram vectors of the questions cached
+under the same scope. A similar question's query is only reused when every
+string literal it searches for also appears in the new question. Scopes combine the LLM model, the Cypher prompt
+version and a fingerprint of the graph schema, so changing any of them
+never serves a stale query.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import sqlite3
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from .cypher_parameterizer import parameterize_cypher
+
+logger = logging.getLogger(__name__)
+
+# Words that carry no meaning for telling two questions apart
+_STOP_WORDS = {
+    'what', 'is', 'are', 'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'how', 'why', 'when', 'where', 'who', 'which', 'that', 'this', 'these', 'those', 'can', 'could',
+    'would', 'should', 'will', 'do', 'does', 'did', 'have', 'has', 'had', 'be', 'been', 'being', 'was',
+    'were', 'me', 'please', 'tell', 'about', 'show', 'give', 'list', 'find', 'all'
+}
+
+def normalize_question(question: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace so trivially different phrasings share an entry."""
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', ' ', question.lower())).strip()
+
+def question_hash(normalized_question: str) -> str:
+    """Stable hash of a normalized question."""
+    return hashlib.sha1(normalized_question.encode('utf-8')).hexdigest()
+
+def vectorize_question(normalized_question: str) -> Dict[str, float]:
+    """Unit-length term-frequency vector of content-word unigrams and bigrams."""
+    words = [word for word in normalized_question.split() if word not in _STOP_WORDS]
+    terms = Counter(words)
+    terms.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+
+    norm = math.sqrt(sum(count * count for count in terms.values()))
+    return {term: count / norm for term, count in terms.items()} if norm else {}
+
+def query_literals(cypher_query: str) -> List[str]:
+    """Normalized string literals of a Cypher query (e.g. the 'bones' of CONTAINS 'bones')."""
+    _, parameters = parameterize_cypher(cypher_query)
+    literals = (normalize_question(value) for value in parameters.values() if isinstance(value, str))
+    return [literal for literal in literals if literal]
+
+def cosine_similarity(first: Dict[str, float], second: Dict[str, float]) -> float:
+    """Cosine similarity of two unit-length sparse vectors."""
+    if len(first) > len(second):
+        first, second = second, first
+    return sum(weight * second.get(term, 0.0) for term, weight in first.items())
+
+class CypherQueryCache:
+    """Thread-safe SQLite cache mapping questions to validated Cypher queries.
+
+    Entries of the current scope are also kept in memory as vectors for the
+    similarity tier; the table is small (one row per distinct question).
+    """
+
+    def __init__(self, cache_file: str = "cypher_cache.sqlite", similarity_threshold: float = 0.9):
+        """
+        Args:
+            cache_file: SQLite file holding the cache
+            similarity_threshold: Minimum cosine similarity for a similarity-tier hit
+                (values above 1 disable the tier)
+        """
+        self.cache_file = cache_file
+        self.similarity_threshold = similarity_threshold
+        self._lock = threading.Lock()
+        self._vector_scope = None
+        # (question vector, question, cypher_query, string literals) per cached entry
+        self._vectors: List[Tuple[Dict[str, float], str, str, List[str]]] = []
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+
+        self._connection = sqlite3.connect(cache_file, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS cypher_cache (
+                scope TEXT NOT NULL,
+                question_hash TEXT NOT NULL,
+                question TEXT NOT NULL,
+                cypher_query TEXT NOT NULL,
+                PRIMARY KEY (scope, question_hash)
+            ) WITHOUT ROWID
+        """)
+        self._connection.commit()
+        logger.info(f"Cypher query cache opened: {cache_file}")
+
+    def get(self, scope: str, question: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Look up a cached Cypher query for a question.
+
+        Returns:
+            Tuple of (cypher_query, tier, cached_question) where tier is 'exact'
+            or 'similar' and cached_question is the normalized question the
+            query is stored under; (None, None, None) on a miss
+        """
+        normalized = normalize_question(question)
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT cypher_query FROM cypher_cache WHERE scope = ? AND question_hash = ?",
+                (scope, question_hash(normalized))
+            ).fetchone()
+            if row:
+                self.exact_hits += 1
+                return row[0], 'exact', normalized
+
+            if self.similarity_threshold <= 1:
+                vector = vectorize_question(normalized)
+                padded = f" {normalized} "
+                best_similarity, best_question, best_query = 0.0, None, None
+                for cached_vector, cached_question, cypher_query, literals in self._scope_vectors_unlocked(scope):
+                    similarity = cosine_similarity(vector, cached_vector)
+                    # A query written for another question must not search for that question's terms
+                    if (similarity > best_similarity
+                            and all(f" {literal} " in padded for literal in literals)):
+                        best_similarity, best_question, best_query = similarity, cached_question, cypher_query
+
+                if best_query is not None and best_similarity >= self.similarity_threshold:
+                    self.similar_hits += 1
+                    logger.info(f"Similar cached Cypher query found (similarity {best_similarity:.2f})")
+                    return best_query, 'similar', best_question
+
+            self.misses += 1
+            return None, None, None
+
+    def put(self, scope: str, question: str, cypher_query: str) -> None:
+        """Cache a Cypher query that returned results for a question."""
+        normalized = normalize_question(question)
+
+        with self._lock:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO cypher_cache (scope, question_hash, question, cypher_query) "
+                    "VALUES (?, ?, ?, ?)",
+                    (scope, question_hash(normalized), normalized, cypher_query)
+                )
+            if scope == self._vector_scope:
+                # Reloaded from the table on the next similarity lookup (the entry may replace one)
+                self._vector_scope = None
+                self._vectors = []
+
+    def delete(self, scope: str, question: str) -> bool:
+        """
+        Remove the cached query for a question (or a cached_question returned by get).
+
+        Returns:
+            True if an entry was removed
+        """
+        normalized = normalize_question(question)
+
+        with self._lock:
+            with self._connection:
+                deleted = self._connection.execute(
+                    "DELETE FROM cypher_cache WHERE scope = ? AND question_hash = ?",
+                    (scope, question_hash(normalized))
+                ).rowcount
+            if deleted and scope == self._vector_scope:
+                # Reloaded from the table on the next similarity lookup
+                self._vector_scope = None
+                self._vectors = []
+            return deleted > 0
+
+    def _scope_vectors_unlocked(self, scope: str) -> List[Tuple[Dict[str, float], str, str, List[str]]]:
+        """Vectors of the questions cached under scope - must be called within lock."""
+        if scope != self._vector_scope:
+            rows = self._connection.execute(
+                "SELECT question, cypher_query FROM cypher_cache WHERE scope = ?", (scope,)
+            ).fetchall()
+            self._vectors = [
+                (vectorize_question(question), question, cypher_query, query_literals(cypher_query))
+                for question, cypher_query in rows
+            ]
+            self._vector_scope = scope
+        return self._vectors
+
+    def clear(self) -> None:
+        """Remove all cached queries."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM cypher_cache")
+            self._vector_scope = None
+            self._vectors = []
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get cache hit/miss statistics."""
+        with self._lock:
+            total = self.exact_hits + self.similar_hits + self.misses
+            return {
+                'exact_hits': self.exact_hits,
+                'similar_hits': self.similar_hits,
+                'misses': self.misses,
+                'hit_rate': ((self.exact_hits + self.similar_hits) / total * 100) if total > 0 else 0
+            }
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,133 @@
+"""
+Literal parameterization for generated Cypher queries.
+
+LLM-generated Cypher embeds its literals (e.g. WHERE s.text CONTAINS 'bones'),
+so every question produces a new query string that Neo4j must plan from
+scratch. Moving string and number literals into parameters makes
+structurally identical queries share one query string, and with it one
+cached plan.
+"""
+
+import re
+from typing import Any, Dict, Tuple
+
+PARAMETER_PREFIX = 'literal_'
+
+_NUMBER_PATTERN = re.compile(r'(?:\d+(?:\.\d+)?|\.\d+)(?:[eE][-+]?\d+)?')
+
+_STRING_ESCAPES = {
+    '\\': '\\', "'": "'", '"': '"', 'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f'
+}
+
+
+def _scan_string(cypher_query: str, start: int) -> Tuple[int, Any]:
+    """
+    Scan a quoted string literal starting at start.
+
+    Returns:
+        Tuple of (end index, decoded value); value is None if the literal
+        is unterminated or uses an escape that is not understood
+    """
+    quote = cypher_query[start]
+    chars = []
+    index = start + 1
+
+    while index < len(cypher_query):
+        char = cypher_query[index]
+        if char == quote:
+            return index + 1, ''.join(chars)
+        if char == '\\':
+            escape = cypher_query[index + 1:index + 2]
+            if escape in _STRING_ESCAPES:
+                chars.append(_STRING_ESCAPES[escape])
+                index += 2
+                continue
+            if escape == 'u' and re.fullmatch(r'[0-9a-fA-F]{4}', cypher_query[index + 2:index + 6]):
+                chars.append(chr(int(cypher_query[index + 2:index + 6], 16)))
+                index += 6
+                continue
+            # Unknown escape: leave the literal as written
+            end = cypher_query.find(quote, index + 2)
+            return (end + 1 if end != -1 else len(cypher_query)), None
+        chars.append(char)
+        index += 1
+
+    return len(cypher_query), None
+
+
+def _skip_until(cypher_query: str, start: int, terminator: str) -> int:
+    """Index just past the next terminator (end of query if there is none)."""
+    end = cypher_query.find(terminator, start)
+    return end + len(terminator) if end != -1 else len(cypher_query)
+
+
+def parameterize_cypher(cypher_query: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Replace string and number literals in a Cypher query with parameters.
+
+    Comments, backtick-quoted names and identifiers are left alone, as are
+    numbers in variable-length relationship bounds (*1..3), where Cypher
+    does not accept parameters. Repeated literals share one parameter.
+
+    Args:
+        cypher_query: Cypher query with inline literals
+
+    Returns:
+        Tuple of (parameterized query, parameters)
+    """
+    parts = []
+    parameters = {}
+    names = {}
+    index = 0
+    copied = 0
+
+    def replace(start: int, end: int, value: Any) -> None:
+        nonlocal copied
+        key = (type(value), value)
+        if key not in names:
+            names[key] = f"{PARAMETER_PREFIX}{len(names)}"
+            parameters[names[key]] = value
+        parts.append(cypher_query[copied:start])
+        parts.append(f"${names[key]}")
+        copied = end
+
+    while index < len(cypher_query):
+        char = cypher_query[index]
+
+        if cypher_query.startswith('//', index):
+            index = _skip_until(cypher_query, index, '\n')
+        elif cypher_query.startswith('/*', index):
+            index = _skip_until(cypher_query, index + 2, '*/')
+        elif char == '`':
+            index = _skip_until(cypher_query, index + 1, '`')
+        elif char in ('"', "'"):
+            end, value = _scan_string(cypher_query, index)
+            if value is not None:
+                replace(index, end, value)
+            index = end
+        elif char.isalpha() or char in ('_', '$'):
+            # Identifier, keyword or parameter (may contain digits)
+            index += 1
+            while index < len(cypher_query) and (cypher_query[index].isalnum() or cypher_query[index] == '_'):
+                index += 1
+        elif char.isdigit() or (char == '.' and cypher_query[index + 1:index + 2].isdigit()
+                                and cypher_query[index - 1:index] != '.'):
+            # Number, including a leading-dot float (.5); the second dot of a range (1..3) is not one
+            match = _NUMBER_PATTERN.match(cypher_query, index)
+            end = match.end()
+            preceding = cypher_query[:index].rstrip()
+            in_range = preceding.endswith(('*', '..')) or cypher_query.startswith('..', end)
+            if in_range or (end < len(cypher_query) and (cypher_query[end].isalnum() or cypher_query[end] == '_')):
+                # Relationship length bound, or not a plain decimal (e.g. hex 0x1F)
+                while end < len(cypher_query) and (cypher_query[end].isalnum() or cypher_query[end] == '_'):
+                    end += 1
+            else:
+                literal = match.group()
+                is_float = '.' in literal or 'e' in literal.lower()
+                replace(index, end, float(literal) if is_float else int(literal))
+            index = end
+        else:
+            index += 1
+
+    parts.append(cypher_query[copied:])
+    return ''.join(parts), parameters
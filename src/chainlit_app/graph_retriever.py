@@ -6,18 +6,451 @@ to retrieve relevant educational content based on user questions.
 """
 
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import re
+import string
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, Hashable
 from neo4j import GraphDatabase
-from neo4j.exceptions import ServiceUnavailable, AuthError
+from neo4j.exceptions import ServiceUnavailable, AuthError, ClientError
 
+# Full-text indexes created by Neo4jSchemaSetup._get_fulltext_indexes
+SENTENCE_FULLTEXT_INDEX = "sentence_text_fulltext"
+CONCEPT_FULLTEXT_INDEX = "concept_fulltext"
 
-class GraphRetriever:
-    """Neo4j graph retriever for educational content."""
+# Raised by db.index.fulltext.queryNodes when the named index does not exist
+MISSING_FULLTEXT_INDEX_CODE = "Neo.ClientError.Procedure.ProcedureCallFailed"
+MISSING_FULLTEXT_INDEX_MESSAGE = "no such fulltext schema index"
+
+_LUCENE_SPECIAL_CHARS = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+
+def build_fulltext_query(text: str) -> Optional[str]:
+    """
+    Turn free text into a Lucene query for db.index.fulltext.queryNodes.
+    
+    Single words also match as a prefix; phrases rank exact phrase matches
+    above sentences that merely contain every word.
+    
+    Args:
+        text: Free-text search string
+        
+    Returns:
+        Lucene query string, or None if the text has no searchable words
+    """
+    # Lowercase so words like AND/OR are never read as operators; trailing
+    # punctuation ("dna?") would otherwise break prefix matching
+    words = [word.strip(string.punctuation) for word in text.lower().split()]
+    words = [_LUCENE_SPECIAL_CHARS.sub(r'\\\1', word) for word in words if word]
+    if not words:
+        return None
+    
+    if len(words) == 1:
+        return f"{words[0]}^2 OR {words[0]}*"
+    
+    phrase = ' '.join(words)
+    return f'"{phrase}"^2 OR ({" AND ".join(words)})'
+
+
+# Cypher shared by GraphRetriever and AsyncGraphRetriever
+
+CONCEPT_FULLTEXT_SEARCH_QUERY = """
+CALL db.index.fulltext.queryNodes($index_name, $search) YIELD node AS c, score
+RETURN c.concept_id as concept_id,
+       c.label as label,
+       c.text as text,
+       c.wikidata_id as wikidata_id,
+       c.wikidata_name as wikidata_name,
+       c.lens as lens,
+       score
+ORDER BY score DESC
+LIMIT $limit
+"""
+
+# Search concepts by label, text, or wikidata_name
+CONCEPT_CONTAINS_SEARCH_QUERY = """
+MATCH (c:Concept)
+WHERE toLower(c.label) CONTAINS toLower($query)
+   OR toLower(c.text) CONTAINS toLower($query)
+   OR toLower(c.wikidata_name) CONTAINS toLower($query)
+RETURN c.concept_id as concept_id,
+       c.label as label,
+       c.text as text,
+       c.wikidata_id as wikidata_id,
+       c.wikidata_name as wikidata_name,
+       c.lens as lens,
+       null as score
+ORDER BY 
+    CASE 
+        WHEN toLower(c.label) CONTAINS toLower($query) THEN 1
+        WHEN toLower(c.wikidata_name) CONTAINS toLower($query) THEN 2
+        ELSE 3
+    END
+LIMIT $limit
+"""
+
+# Sentence hierarchy is materialized onto Sentence nodes at import (neo4j_utils.ancestry)
+_SENTENCE_HIERARCHY_RETURN = """
+RETURN s.sentence_id as sentence_id,
+       s.text as text,
+       s.lens as lens,
+       s.paragraph_id as paragraph_id,
+       s.subsection_id as subsection_id,
+       s.subsection_title as subsection_title,
+       s.section_id as section_id,
+       s.section_title as section_title,
+       s.document_id as document_id,
+       s.document_title as document_title,
+       s.chapter_id as chapter_id,
+       s.chapter_title as chapter_title,
+       s.subchapter_id as subchapter_id,
+       s.subchapter_title as subchapter_title,
+       score
+"""
+
+SENTENCE_FULLTEXT_SEARCH_QUERY = """
+CALL db.index.fulltext.queryNodes($index_name, $search) YIELD node AS s, score
+WITH s, score
+ORDER BY score DESC
+LIMIT $limit
+""" + _SENTENCE_HIERARCHY_RETURN + """
+ORDER BY score DESC
+"""
+
+# Search sentences by text content
+SENTENCE_CONTAINS_SEARCH_QUERY = """
+MATCH (s:Sentence)
+WHERE toLower(s.text) CONTAINS toLower($query)
+WITH s, null as score
+ORDER BY s.text
+LIMIT $limit
+""" + _SENTENCE_HIERARCHY_RETURN + """
+ORDER BY text
+"""
+
+SENTENCES_FOR_CONCEPTS_QUERY = """
+MATCH (c:Concept)-[:CONCEPT_BELONGS_TO_SENTENCE]->(s:Sentence)
+WHERE c.concept_id IN $concept_ids
+RETURN DISTINCT
+       s.sentence_id as sentence_id,
+       s.text as text,
+       s.lens as lens,
+       c.concept_id as concept_id,
+       c.label as concept_label,
+       c.text as concept_text,
+       s.paragraph_id as paragraph_id,
+       s.subsection_id as subsection_id,
+       s.subsection_title as subsection_title,
+       s.section_id as section_id,
+       s.section_title as section_title,
+       s.document_id as document_id,
+       s.document_title as document_title,
+       s.chapter_id as chapter_id,
+       s.chapter_title as chapter_title,
+       s.subchapter_id as subchapter_id,
+       s.subchapter_title as subchapter_title
+ORDER BY c.label, s.text
+LIMIT $limit
+"""
+
+HIERARCHICAL_CONTEXT_QUERY = """
+MATCH (s:Sentence)
+WHERE s.sentence_id IN $sentence_ids
+RETURN s.sentence_id as sentence_id,
+       s.book_id as book_id,
+       s.book_title as book_title,
+       s.chapter_id as chapter_id,
+       s.chapter_title as chapter_title,
+       s.subchapter_id as subchapter_id,
+       s.subchapter_title as subchapter_title,
+       s.document_id as document_id,
+       s.document_title as document_title,
+       s.section_id as section_id,
+       s.section_title as section_title,
+       s.subsection_id as subsection_id,
+       s.subsection_title as subsection_title
+"""
+
+RELATED_CONCEPTS_QUERY = """
+MATCH (c1:Concept {concept_id: $concept_id})-[:CONCEPT_BELONGS_TO_SENTENCE]->(s:Sentence)<-[:CONCEPT_BELONGS_TO_SENTENCE]-(c2:Concept)
+WHERE c1.concept_id <> c2.concept_id
+RETURN DISTINCT
+       c2.concept_id as concept_id,
+       c2.label as label,
+       c2.text as text,
+       c2.wikidata_id as wikidata_id,
+       c2.wikidata_name as wikidata_name,
+       c2.lens as lens,
+       count(s) as co_occurrence_count
+ORDER BY co_occurrence_count DESC
+LIMIT $limit
+"""
+
+# Hierarchy columns of batched sentence rows, keyed by sentence in hierarchical_context
+BATCHED_HIERARCHY_KEYS = ('sentence_id', 'book_id', 'book_title', 'chapter_id', 'chapter_title',
+                          'subchapter_id', 'subchapter_title', 'document_id', 'document_title',
+                          'section_id', 'section_title', 'subsection_id', 'subsection_title')
+
+# Sentence properties returned by batched retrieval (materialized ancestry included)
+BATCHED_SENTENCE_KEYS = BATCHED_HIERARCHY_KEYS[:1] + ('text', 'lens', 'paragraph_id') + BATCHED_HIERARCHY_KEYS[1:]
+
+BATCHED_CONCEPTS_QUERY = """
+UNWIND range(0, size($searches) - 1) AS term_index
+CALL {
+    WITH term_index
+    CALL db.index.fulltext.queryNodes($concept_index, $searches[term_index]) YIELD node, score
+    RETURN node AS c, score
+    ORDER BY score DESC
+    LIMIT $concepts_per_term
+}
+WITH c, min(term_index) AS term_index, max(score) AS score
+ORDER BY term_index, score DESC
+LIMIT $concept_limit
+WITH collect(c) AS concept_nodes,
+     collect({concept_id: c.concept_id, label: c.label, text: c.text,
+              wikidata_id: c.wikidata_id, wikidata_name: c.wikidata_name,
+              lens: c.lens, score: score}) AS concepts
+
+// Sentences linked to the matched concepts
+CALL {
+    WITH concept_nodes
+    UNWIND concept_nodes AS c
+    MATCH (c)-[:CONCEPT_BELONGS_TO_SENTENCE]->(s:Sentence)
+    WITH DISTINCT s
+    ORDER BY s.text
+    LIMIT $concept_sentence_limit
+    RETURN collect(s {%s, score: null}) AS concept_sentences
+}
+
+// Concepts co-occurring with the top concept
+CALL {
+    WITH concept_nodes
+    WITH head(concept_nodes) AS top
+    OPTIONAL MATCH (top)-[:CONCEPT_BELONGS_TO_SENTENCE]->(s:Sentence)<-[:CONCEPT_BELONGS_TO_SENTENCE]-(c2:Concept)
+    WHERE c2 <> top
+    WITH c2, count(s) AS co_occurrence_count
+    ORDER BY co_occurrence_count DESC
+    LIMIT $related_limit
+    RETURN collect(CASE WHEN c2 IS NULL THEN null ELSE
+               {concept_id: c2.concept_id, label: c2.label, text: c2.text,
+                wikidata_id: c2.wikidata_id, wikidata_name: c2.wikidata_name,
+                lens: c2.lens, co_occurrence_count: co_occurrence_count} END) AS related_concepts
+}
+RETURN concepts, concept_sentences, related_concepts
+""" % ', '.join(f'.{key}' for key in BATCHED_SENTENCE_KEYS)
+
+# Independent of BATCHED_CONCEPTS_QUERY, so both can run at once
+BATCHED_TERM_SENTENCES_QUERY = """
+UNWIND range(0, size($searches) - 1) AS term_index
+CALL {
+    WITH term_index
+    CALL db.index.fulltext.queryNodes($sentence_index, $searches[term_index]) YIELD node, score
+    RETURN node AS s, score
+    ORDER BY score DESC
+    LIMIT $sentences_per_term
+}
+WITH s, min(term_index) AS term_index, max(score) AS score
+ORDER BY term_index, score DESC
+LIMIT $sentence_limit
+RETURN %s,
+       score
+ORDER BY term_index, score DESC
+""" % ',\n       '.join(f's.{key} as {key}' for key in BATCHED_SENTENCE_KEYS)
+
+
+def build_batched_searches(terms: List[str]) -> List[str]:
+    """Full-text queries for the searchable terms, in term order."""
+    return [search for search in (build_fulltext_query(term) for term in terms) if search]
+
+
+def merge_batched_sentences(concept_sentences: List[Dict[str, Any]], term_sentences: List[Dict[str, Any]],
+                            sentence_limit: int) -> List[Dict[str, Any]]:
+    """
+    Merge the sentences of the matched concepts with the sentences matched by text.
+    
+    Concept sentences rank first, then text matches in term order; a sentence
+    found both ways keeps its first position and its full-text score.
+    """
+    merged = {}
+    for sentence in concept_sentences + term_sentences:
+        kept = merged.setdefault(sentence['sentence_id'], dict(sentence))
+        if sentence['score'] is not None and (kept['score'] is None or sentence['score'] > kept['score']):
+            kept['score'] = sentence['score']
+    return list(merged.values())[:sentence_limit]
+
+
+def assemble_batched_context(concepts: List[Dict[str, Any]], sentences: List[Dict[str, Any]],
+                             related_concepts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Shape batched retrieval results like GraphRAGPipeline.retrieve_context."""
+    return {
+        'concepts': concepts,
+        'sentences': sentences,
+        'hierarchical_context': {
+            sentence['sentence_id']: {key: sentence[key] for key in BATCHED_HIERARCHY_KEYS}
+            for sentence in sentences
+        },
+        'related_concepts': related_concepts
+    }
+
+# Label and ID property of each node type trace_node_hierarchy supports, in lookup priority
+NODE_ID_PROPERTIES = (
+    ('Sentence', 'sentence_id'),
+    ('Paragraph', 'paragraph_id'),
+    ('Subsection', 'subsection_id'),
+    ('Section', 'section_id'),
+    ('Document', 'document_id'),
+    ('Subchapter', 'subchapter_id'),
+    ('Chapter', 'chapter_id'),
+    ('Book', 'book_id'),
+    ('Concept', 'wikidata_id')
+)
+
+# IDs whose type is evident from how OpenStaxXMLParser (or Wikidata) names them
+NODE_ID_PATTERNS = (
+    (re.compile(r'-sent-\d+$'), 'Sentence'),
+    (re.compile(r'-subchapter_\d+$'), 'Subchapter'),
+    (re.compile(r'-chapter_\d+$'), 'Chapter'),
+    (re.compile(r'^Q\d+$'), 'Concept')
+)
+
+# One index seek per label instead of an unlabeled scan over every ID property
+NODE_TYPE_QUERY = "\nUNION ALL\n".join(
+    f"MATCH (n:{label} {{{id_property}: $node_id}}) RETURN '{label}' AS node_type LIMIT 1"
+    for label, id_property in NODE_ID_PROPERTIES
+)
+
+
+def is_missing_fulltext_index_error(error: Exception) -> bool:
+    """True if a query failed because a full-text index it names does not exist."""
+    return (isinstance(error, ClientError) and error.code == MISSING_FULLTEXT_INDEX_CODE
+            and MISSING_FULLTEXT_INDEX_MESSAGE in (error.message or '').lower())
+
+
+class FulltextIndexStatus:
+    """Whether the full-text indexes can be queried.
+
+    A missing index switches searches to CONTAINS scans for retry_interval
+    seconds, after which the indexes are tried again (they may have been
+    created by setup_neo4j_schema.py --setup-schema in the meantime). Any
+    other error is left to the caller.
+    """
+
+    def __init__(self, retry_interval: float = 300.0):
+        self.retry_interval = retry_interval
+        self._retry_at = 0.0
+
+    @property
+    def available(self) -> bool:
+        """True unless an index was found missing less than retry_interval seconds ago."""
+        return time.monotonic() >= self._retry_at
+
+    def record_error(self, error: Exception) -> bool:
+        """
+        Record a failed full-text query.
+
+        Returns:
+            True if the error means an index is missing (fall back), False otherwise (re-raise)
+        """
+        if not is_missing_fulltext_index_error(error):
+            return False
+        self._retry_at = time.monotonic() + self.retry_interval
+        return True
+
+
+class HierarchyCache:
+    """
+    Bounded LRU cache for hierarchy lookups, keyed by node ID.
+    
+    Hierarchies only change when textbooks are (re)imported, and every import
+    bumps the generation stored in the graph (neo4j_utils.import_generation).
+    Retrievers re-read the generation at most every check_interval seconds and
+    pass it to observe_generation, which empties the cache when it changed.
+    """
+    
+    def __init__(self, max_size: int = 10000, check_interval: float = 30.0):
+        self.max_size = max_size
+        self.check_interval = check_interval
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = None
+        self._checked_at = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+    
+    def generation_check_due(self) -> bool:
+        """Whether the import generation should be re-read from the graph."""
+        return self._checked_at is None or time.monotonic() - self._checked_at >= self.check_interval
+    
+    def observe_generation(self, generation: Hashable) -> None:
+        """Record the current import generation, dropping all entries if it changed."""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if generation != self._generation:
+                if self._entries:
+                    self.invalidations += 1
+                self._entries.clear()
+                self._generation = generation
+    
+    def clear(self) -> None:
+        """Drop all entries and forget the observed generation."""
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._generation = None
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+    
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache value under key, evicting the least recently used entries beyond max_size."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size, hit/miss counts and the generation the entries belong to."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups * 100 if lookups else 0.0,
+            'invalidations': self.invalidations,
+            'generation': self._generation
+        }
+
+
+
+class GraphRetrieverBase:
+    """
+    State and driver-independent logic shared by GraphRetriever and AsyncGraphRetriever.
+    
+    Subclasses only run the queries; building parameters, the hierarchy cache
+    and shaping results happen here so both retrievers behave the same.
+    """
     
     def __init__(self, uri: str = None, 
                  username: str = None, 
                  password: str = None,
-                 database: str = None):
+                 database: str = None,
+                 hierarchy_cache_size: int = 10000,
+                 hierarchy_cache: HierarchyCache = None):
         """
         Initialize the graph retriever.
         
@@ -26,6 +459,8 @@ class GraphRetriever:
             username: Neo4j username (if None, loads from config)
             password: Neo4j password (if None, loads from config)
             database: Neo4j database name (if None, loads from config)
+            hierarchy_cache_size: Maximum number of cached hierarchy lookups (0 disables caching)
+            hierarchy_cache: Cache shared with another retriever (if None, a new one is created)
         """
         # Load from config if parameters not provided
         if uri is None or username is None or password is None or database is None:
@@ -42,9 +477,91 @@ class GraphRetriever:
             self.database = database
         self.driver = None
         
+        # Falls back to CONTAINS scans when the full-text indexes have not been created
+        self.fulltext_status = FulltextIndexStatus()
+        
+        # Hierarchies are immutable between imports
+        self.hierarchy_cache = hierarchy_cache if hierarchy_cache is not None else HierarchyCache(hierarchy_cache_size)
+        
         # Setup logging
         self.logger = logging.getLogger(__name__)
     
+    def get_hierarchy_cache_stats(self) -> Dict[str, Any]:
+        """Get hierarchy cache statistics (size, hits, misses, hit rate, invalidations)."""
+        return self.hierarchy_cache.get_stats()
+    
+    def _import_generation_unavailable(self, error: Exception) -> None:
+        """Clear the hierarchy cache after the import generation could not be read."""
+        # Without a generation we cannot tell whether entries are stale
+        self.logger.warning(f"Could not read import generation, clearing hierarchy cache: {error}")
+        self.hierarchy_cache.clear()
+    
+    def _split_cached_contexts(self, sentence_ids: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Look up hierarchical contexts in the cache.
+        
+        Returns:
+            Tuple of (context by sentence_id for cached sentences, IDs to query)
+        """
+        context = {}
+        missing_ids = []
+        for sentence_id in dict.fromkeys(sentence_ids):
+            cached = self.hierarchy_cache.get(('context', sentence_id))
+            if cached is not None:
+                context[sentence_id] = cached
+            else:
+                missing_ids.append(sentence_id)
+        return context, missing_ids
+    
+    def _add_queried_contexts(self, context: Dict[str, Any], records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add HIERARCHICAL_CONTEXT_QUERY records to context and the cache."""
+        cached_count = len(context)
+        for record in records:
+            sentence_id = record['sentence_id']
+            if sentence_id not in context:
+                context[sentence_id] = record
+                self.hierarchy_cache.put(('context', sentence_id), record)
+        
+        self.logger.info(f"Retrieved context for {len(context)} sentences ({cached_count} cached)")
+        return context
+    
+    def _batched_parameters(self, searches: List[str], concepts_per_term: int, concept_limit: int,
+                            concept_sentence_limit: int, sentences_per_term: int, sentence_limit: int,
+                            related_limit: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Parameters of BATCHED_CONCEPTS_QUERY and BATCHED_TERM_SENTENCES_QUERY."""
+        concept_parameters = {
+            'searches': searches, 'concept_index': CONCEPT_FULLTEXT_INDEX,
+            'concepts_per_term': concepts_per_term, 'concept_limit': concept_limit,
+            'concept_sentence_limit': concept_sentence_limit, 'related_limit': related_limit
+        }
+        sentence_parameters = {
+            'searches': searches, 'sentence_index': SENTENCE_FULLTEXT_INDEX,
+            'sentences_per_term': sentences_per_term, 'sentence_limit': sentence_limit
+        }
+        return concept_parameters, sentence_parameters
+    
+    def _assemble_batched_results(self, searches: List[str], concept_records: List[Dict[str, Any]],
+                                  term_sentences: List[Dict[str, Any]], sentence_limit: int) -> Dict[str, Any]:
+        """Merge the results of the two batched queries into a retrieval context."""
+        record = concept_records[0] if concept_records else {}
+        concepts = record.get('concepts', [])
+        related_concepts = record.get('related_concepts', [])
+        sentences = merge_batched_sentences(record.get('concept_sentences', []), term_sentences, sentence_limit)
+        
+        self.logger.info(f"Batched retrieval for {len(searches)} terms: {len(concepts)} concepts, "
+                         f"{len(sentences)} sentences, {len(related_concepts)} related concepts")
+        return assemble_batched_context(concepts, sentences, related_concepts)
+    
+    def _batched_search_unavailable(self, error: Exception) -> None:
+        """Re-raise error unless it means a full-text index is missing."""
+        if not self.fulltext_status.record_error(error):
+            raise error
+        self.logger.warning(f"Full-text search unavailable for batched retrieval: {error}")
+
+
+class GraphRetriever(GraphRetrieverBase):
+    """Neo4j graph retriever for educational content."""
+    
     def _connect(self) -> None:
         """Establish connection to Neo4j database."""
         if self.driver is None:
@@ -68,10 +585,26 @@ class GraphRetriever:
             except Exception as e:
                 raise Exception(f"Error connecting to Neo4j: {e}")
     
+    def _run_fulltext_search(self, session, fulltext_query: str, fallback_query: str, **params) -> List[Dict[str, Any]]:
+        """Run a full-text search, falling back to a CONTAINS scan if the index is missing."""
+        if self.fulltext_status.available and params.get('search'):
+            try:
+                return [dict(record) for record in session.run(fulltext_query, **params)]
+            except Exception as e:
+                if not self.fulltext_status.record_error(e):
+                    raise
+                self.logger.warning(f"Full-text search unavailable, falling back to CONTAINS scans "
+                                    f"(run setup_neo4j_schema.py --setup-schema): {e}")
+        
+        return [dict(record) for record in session.run(fallback_query, **params)]
+    
     def search_concepts(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         Search for concepts matching the query terms.
         
+        Uses the concept full-text index (label, name, wikidata_name, description,
+        aliases) and returns results ordered by relevance score.
+        
         Args:
             query: Search query string
             limit: Maximum number of results to return
@@ -84,29 +617,11 @@ class GraphRetriever:
         
         try:
             with self.driver.session(database=self.database) as session:
-                # Search concepts by label, text, or wikidata_name
-                cypher_query = """
-                MATCH (c:Concept)
-                WHERE toLower(c.label) CONTAINS toLower($query)
-                   OR toLower(c.text) CONTAINS toLower($query)
-                   OR toLower(c.wikidata_name) CONTAINS toLower($query)
-                RETURN c.concept_id as concept_id,
-                       c.label as label,
-                       c.text as text,
-                       c.wikidata_id as wikidata_id,
-                       c.wikidata_name as wikidata_name,
-                       c.lens as lens
-                ORDER BY 
-                    CASE 
-                        WHEN toLower(c.label) CONTAINS toLower($query) THEN 1
-                        WHEN toLower(c.wikidata_name) CONTAINS toLower($query) THEN 2
-                        ELSE 3
-                    END
-                LIMIT $limit
-                """
-                
-                result = session.run(cypher_query, query=query, limit=limit)
-                concepts = [dict(record) for record in result]
+                concepts = self._run_fulltext_search(
+                    session, CONCEPT_FULLTEXT_SEARCH_QUERY, CONCEPT_CONTAINS_SEARCH_QUERY,
+                    index_name=CONCEPT_FULLTEXT_INDEX, search=build_fulltext_query(query),
+                    query=query, limit=limit
+                )
                 
                 self.logger.info(f"Found {len(concepts)} concepts for query: {query}")
                 return concepts
@@ -119,6 +634,9 @@ class GraphRetriever:
         """
         Search for sentences containing the query text.
         
+        Uses the sentence full-text index and returns results ordered by
+        relevance score; the hierarchy is only expanded for the top matches.
+        
         Args:
             query: Search query string
             limit: Maximum number of results to return
@@ -131,36 +649,11 @@ class GraphRetriever:
         
         try:
             with self.driver.session(database=self.database) as session:
-                # Search sentences by text content
-                cypher_query = """
-                MATCH (s:Sentence)
-                WHERE toLower(s.text) CONTAINS toLower($query)
-                OPTIONAL MATCH (s)-[:SENTENCE_BELONGS_TO_PARAGRAPH]->(p:Paragraph)
-                OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SUBSECTION]->(ss:Subsection)
-                OPTIONAL MATCH (ss)-[:SUBSECTION_BELONGS_TO_SECTION]->(sec:Section)
-                OPTIONAL MATCH (sec)-[:SECTION_BELONGS_TO_DOCUMENT]->(d:Document)
-                OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_CHAPTER]->(c:Chapter)
-                OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc:Subchapter)
-                RETURN s.sentence_id as sentence_id,
-                       s.text as text,
-                       s.lens as lens,
-                       p.paragraph_id as paragraph_id,
-                       ss.subsection_id as subsection_id,
-                       ss.title as subsection_title,
-                       sec.section_id as section_id,
-                       sec.title as section_title,
-                       d.document_id as document_id,
-                       d.title as document_title,
-                       c.chapter_id as chapter_id,
-                       c.title as chapter_title,
-                       sc.subchapter_id as subchapter_id,
-                       sc.title as subchapter_title
-                ORDER BY s.text
-                LIMIT $limit
-                """
-                
-                result = session.run(cypher_query, query=query, limit=limit)
-                sentences = [dict(record) for record in result]
+                sentences = self._run_fulltext_search(
+                    session, SENTENCE_FULLTEXT_SEARCH_QUERY, SENTENCE_CONTAINS_SEARCH_QUERY,
+                    index_name=SENTENCE_FULLTEXT_INDEX, search=build_fulltext_query(query),
+                    query=query, limit=limit
+                )
                 
                 self.logger.info(f"Found {len(sentences)} sentences for query: {query}")
                 return sentences
@@ -188,38 +681,7 @@ class GraphRetriever:
         
         try:
             with self.driver.session(database=self.database) as session:
-                cypher_query = """
-                MATCH (c:Concept)-[:CONCEPT_BELONGS_TO_SENTENCE]->(s:Sentence)
-                WHERE c.concept_id IN $concept_ids
-                OPTIONAL MATCH (s)-[:SENTENCE_BELONGS_TO_PARAGRAPH]->(p:Paragraph)
-                OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SUBSECTION]->(ss:Subsection)
-                OPTIONAL MATCH (ss)-[:SUBSECTION_BELONGS_TO_SECTION]->(sec:Section)
-                OPTIONAL MATCH (sec)-[:SECTION_BELONGS_TO_DOCUMENT]->(d:Document)
-                OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_CHAPTER]->(c:Chapter)
-                OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc:Subchapter)
-                RETURN DISTINCT
-                       s.sentence_id as sentence_id,
-                       s.text as text,
-                       s.lens as lens,
-                       c.concept_id as concept_id,
-                       c.label as concept_label,
-                       c.text as concept_text,
-                       p.paragraph_id as paragraph_id,
-                       ss.subsection_id as subsection_id,
-                       ss.title as subsection_title,
-                       sec.section_id as section_id,
-                       sec.title as section_title,
-                       d.document_id as document_id,
-                       d.title as document_title,
-                       c.chapter_id as chapter_id,
-                       c.title as chapter_title,
-                       sc.subchapter_id as subchapter_id,
-                       sc.title as subchapter_title
-                ORDER BY c.label, s.text
-                LIMIT $limit
-                """
-                
-                result = session.run(cypher_query, concept_ids=concept_ids, limit=limit)
+                result = session.run(SENTENCES_FOR_CONCEPTS_QUERY, concept_ids=concept_ids, limit=limit)
                 sentences = [dict(record) for record in result]
                 
                 self.logger.info(f"Found {len(sentences)} sentences for {len(concept_ids)} concepts")
@@ -247,44 +709,15 @@ class GraphRetriever:
         
         try:
             with self.driver.session(database=self.database) as session:
-                cypher_query = """
-                MATCH (s:Sentence)
-                WHERE s.sentence_id IN $sentence_ids
-                OPTIONAL MATCH (s)-[:SENTENCE_BELONGS_TO_PARAGRAPH]->(p:Paragraph)
-                OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SUBSECTION]->(ss:Subsection)
-                OPTIONAL MATCH (ss)-[:SUBSECTION_BELONGS_TO_SECTION]->(sec:Section)
-                OPTIONAL MATCH (sec)-[:SECTION_BELONGS_TO_DOCUMENT]->(d:Document)
-                OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_CHAPTER]->(c:Chapter)
-                OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc:Subchapter)
-                OPTIONAL MATCH (c)-[:CHAPTER_BELONGS_TO_BOOK]->(b:Book)
-                RETURN DISTINCT
-                       s.sentence_id as sentence_id,
-                       b.book_id as book_id,
-                       b.title as book_title,
-                       c.chapter_id as chapter_id,
-                       c.title as chapter_title,
-                       sc.subchapter_id as subchapter_id,
-                       sc.title as subchapter_title,
-                       d.document_id as document_id,
-                       d.title as document_title,
-                       sec.section_id as section_id,
-                       sec.title as section_title,
-                       ss.subsection_id as subsection_id,
-                       ss.title as subsection_title
-                """
+                self._refresh_hierarchy_cache(session)
                 
-                result = session.run(cypher_query, sentence_ids=sentence_ids)
-                context_data = [dict(record) for record in result]
-                
-                # Organize context by sentence_id
-                context = {}
-                for record in context_data:
-                    sentence_id = record['sentence_id']
-                    if sentence_id not in context:
-                        context[sentence_id] = record
-                
-                self.logger.info(f"Retrieved context for {len(context)} sentences")
-                return context
+                # Organize context by sentence_id, querying only uncached sentences
+                context, missing_ids = self._split_cached_contexts(sentence_ids)
+                records = []
+                if missing_ids:
+                    records = [dict(record) for record in
+                               session.run(HIERARCHICAL_CONTEXT_QUERY, sentence_ids=missing_ids)]
+                return self._add_queried_contexts(context, records)
                 
         except Exception as e:
             self.logger.error(f"Error getting hierarchical context: {e}")
@@ -306,22 +739,7 @@ class GraphRetriever:
         
         try:
             with self.driver.session(database=self.database) as session:
-                cypher_query = """
-                MATCH (c1:Concept {concept_id: $concept_id})-[:CONCEPT_BELONGS_TO_SENTENCE]->(s:Sentence)<-[:CONCEPT_BELONGS_TO_SENTENCE]-(c2:Concept)
-                WHERE c1.concept_id <> c2.concept_id
-                RETURN DISTINCT
-                       c2.concept_id as concept_id,
-                       c2.label as label,
-                       c2.text as text,
-                       c2.wikidata_id as wikidata_id,
-                       c2.wikidata_name as wikidata_name,
-                       c2.lens as lens,
-                       count(s) as co_occurrence_count
-                ORDER BY co_occurrence_count DESC
-                LIMIT $limit
-                """
-                
-                result = session.run(cypher_query, concept_id=concept_id, limit=limit)
+                result = session.run(RELATED_CONCEPTS_QUERY, concept_id=concept_id, limit=limit)
                 related_concepts = [dict(record) for record in result]
                 
                 self.logger.info(f"Found {len(related_concepts)} related concepts for {concept_id}")
@@ -331,6 +749,68 @@ class GraphRetriever:
             self.logger.error(f"Error getting related concepts: {e}")
             return []
     
+    def retrieve_for_terms(self, terms: List[str], concepts_per_term: int = 5, concept_limit: int = 10,
+                           concept_sentence_limit: int = 20, sentences_per_term: int = 10,
+                           sentence_limit: int = 25, related_limit: int = 5) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve concepts, sentences with hierarchy and related concepts for many terms at once.
+        
+        Replaces one search_concepts/search_sentences_by_content call per term plus the
+        follow-up lookups with two independent queries: one for concepts (with their
+        sentences and the concepts related to the top match) and one for sentences
+        matching the terms. Results are deduplicated keeping the first term that found
+        them, and the two sentence lists are merged with concept sentences first.
+        
+        Args:
+            terms: Search terms, most important first
+            concepts_per_term: Concepts matched per term
+            concept_limit: Maximum number of distinct concepts
+            concept_sentence_limit: Maximum number of sentences linked to those concepts
+            sentences_per_term: Sentences matched per term by text
+            sentence_limit: Maximum number of distinct sentences
+            related_limit: Maximum number of concepts related to the top concept
+            
+        Returns:
+            Dictionary with 'concepts', 'sentences', 'hierarchical_context' and
+            'related_concepts', or None if the full-text indexes are unavailable
+        """
+        searches = build_batched_searches(terms)
+        
+        if not searches:
+            return assemble_batched_context([], [], [])
+        if not self.fulltext_status.available:
+            return None
+        
+        if self.driver is None:
+            self._connect()
+        
+        concept_parameters, sentence_parameters = self._batched_parameters(
+            searches, concepts_per_term, concept_limit, concept_sentence_limit,
+            sentences_per_term, sentence_limit, related_limit
+        )
+        try:
+            with self.driver.session(database=self.database) as session:
+                concept_records = [dict(record) for record in
+                                   session.run(BATCHED_CONCEPTS_QUERY, **concept_parameters)]
+                term_sentences = [dict(record) for record in
+                                  session.run(BATCHED_TERM_SENTENCES_QUERY, **sentence_parameters)]
+        except Exception as e:
+            self._batched_search_unavailable(e)
+            return None
+        
+        return self._assemble_batched_results(searches, concept_records, term_sentences, sentence_limit)
+    
+    def _refresh_hierarchy_cache(self, session) -> None:
+        """Invalidate the hierarchy cache if the import generation changed since the last check."""
+        if not self.hierarchy_cache.generation_check_due():
+            return
+        
+        try:
+            from neo4j_utils.import_generation import get_import_generation
+            self.hierarchy_cache.observe_generation(get_import_generation(session))
+        except Exception as e:
+            self._import_generation_unavailable(e)
+    
     def test_connection(self) -> bool:
         """
         Test the Neo4j connection.
@@ -358,27 +838,22 @@ class GraphRetriever:
         """
         try:
             with self.driver.session(database=self.database) as session:
-                # First, determine the node type if not provided
+                self._refresh_hierarchy_cache(session)
+                
+                # Determine the node type if not provided: first from the parser's ID
+                # conventions, otherwise with one index seek per label
+                guessed = False
                 if not node_type:
-                    node_type_query = """
-                    MATCH (n) 
-                    WHERE n.sentence_id = $node_id 
-                       OR n.paragraph_id = $node_id 
-                       OR n.subsection_id = $node_id 
-                       OR n.section_id = $node_id 
-                       OR n.document_id = $node_id 
-                       OR n.subchapter_id = $node_id 
-                       OR n.chapter_id = $node_id 
-                       OR n.book_id = $node_id
-                       OR n.concept_id = $node_id
-                    RETURN labels(n) as labels
-                    """
-                    result = session.run(node_type_query, node_id=node_id)
-                    record = result.single()
-                    if record:
-                        node_type = record['labels'][0] if record['labels'] else 'Unknown'
-                    else:
-                        return {'error': f'Node with ID {node_id} not found'}
+                    node_type = self._guess_node_type(node_id)
+                    guessed = node_type is not None
+                    if not guessed:
+                        node_type = self._resolve_node_type(session, node_id)
+                        if not node_type:
+                            return {'error': f'Node with ID {node_id} not found'}
+                
+                cached = self.hierarchy_cache.get(('trace', node_type, node_id))
+                if cached is not None:
+                    return cached
                 
                 # Build the hierarchy trace query based on node type
                 hierarchy_query = self._build_hierarchy_query(node_type, node_id)
@@ -390,11 +865,22 @@ class GraphRetriever:
                 result = session.run(hierarchy_query, node_id=node_id)
                 record = result.single()
                 
+                # An ID that only looks conventional is resolved by label and retried
+                if not record and guessed:
+                    resolved_type = self._resolve_node_type(session, node_id)
+                    if not resolved_type:
+                        return {'error': f'Node with ID {node_id} not found'}
+                    if resolved_type != node_type:
+                        node_type = resolved_type
+                        hierarchy_query = self._build_hierarchy_query(node_type, node_id)
+                        record = session.run(hierarchy_query, node_id=node_id).single()
+                
                 if not record:
                     return {'error': f'No hierarchy found for {node_type} with ID {node_id}'}
                 
                 # Build the hierarchy path
                 hierarchy = self._build_hierarchy_path(record, node_type)
+                self.hierarchy_cache.put(('trace', node_type, node_id), hierarchy)
                 
                 self.logger.info(f"Successfully traced hierarchy for {node_type} {node_id}")
                 return hierarchy
@@ -403,42 +889,135 @@ class GraphRetriever:
             self.logger.error(f"Error tracing hierarchy for {node_id}: {e}")
             return {'error': str(e)}
     
+    def _guess_node_type(self, node_id: str) -> Optional[str]:
+        """Infer a node type from the ID conventions of OpenStaxXMLParser, if the ID follows one."""
+        for pattern, node_type in NODE_ID_PATTERNS:
+            if pattern.search(node_id):
+                return node_type
+        return None
+    
+    def _resolve_node_type(self, session, node_id: str) -> Optional[str]:
+        """Find the type of the node with this ID using label-specific index seeks."""
+        node_types = {record['node_type'] for record in session.run(NODE_TYPE_QUERY, node_id=node_id)}
+        return next((label for label, _ in NODE_ID_PROPERTIES if label in node_types), None)
+    
+    def trace_node_hierarchies(self, node_ids: List[str], node_type: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Trace the hierarchies of many nodes of one type in a single query.
+        
+        Args:
+            node_ids: IDs of the nodes to trace (wikidata_id for concepts)
+            node_type: 'Sentence' or 'Concept'
+            
+        Returns:
+            Dictionary mapping each found node ID to its hierarchy (as returned
+            by trace_node_hierarchy); IDs that are not found are omitted
+        """
+        hierarchy_query = self._build_batched_hierarchy_query(node_type)
+        if not hierarchy_query:
+            raise ValueError(f"Unsupported node type for batched tracing: {node_type}")
+        
+        node_ids = list(dict.fromkeys(node_id for node_id in node_ids if node_id))
+        if not node_ids:
+            return {}
+        
+        try:
+            hierarchies = {}
+            with self.driver.session(database=self.database) as session:
+                self._refresh_hierarchy_cache(session)
+                
+                missing_ids = []
+                for node_id in node_ids:
+                    cached = self.hierarchy_cache.get(('trace', node_type, node_id))
+                    if cached is not None:
+                        hierarchies[node_id] = cached
+                    else:
+                        missing_ids.append(node_id)
+                
+                if missing_ids:
+                    for record in session.run(hierarchy_query, node_ids=missing_ids):
+                        node_id = record['node_id']
+                        if node_id not in hierarchies:
+                            hierarchies[node_id] = self._build_hierarchy_path(record, node_type)
+                            self.hierarchy_cache.put(('trace', node_type, node_id), hierarchies[node_id])
+            
+            self.logger.info(f"Traced hierarchy for {len(hierarchies)}/{len(node_ids)} {node_type} nodes "
+                             f"({len(node_ids) - len(missing_ids)} cached)")
+            return hierarchies
+            
+        except Exception as e:
+            self.logger.error(f"Error tracing {node_type} hierarchies: {e}")
+            return {}
+    
+    def _build_batched_hierarchy_query(self, node_type: str) -> Optional[str]:
+        """Build the Cypher query for tracing many hierarchies of one node type at once."""
+        ancestor_seeks = """
+            CALL {
+                WITH s
+                OPTIONAL MATCH (p:Paragraph {paragraph_id: s.paragraph_id})
+                OPTIONAL MATCH (ss:Subsection {subsection_id: s.subsection_id})
+                OPTIONAL MATCH (sec:Section {section_id: s.section_id})
+                OPTIONAL MATCH (d:Document {document_id: s.document_id})
+                OPTIONAL MATCH (sc:Subchapter {subchapter_id: s.subchapter_id})
+                OPTIONAL MATCH (c:Chapter {chapter_id: s.chapter_id})
+                OPTIONAL MATCH (b:Book {book_id: s.book_id})
+                RETURN p, ss, sec, d, sc, c, b
+                LIMIT 1
+            }"""
+        
+        if node_type == 'Sentence':
+            return """
+            UNWIND $node_ids AS node_id
+            MATCH (s:Sentence {sentence_id: node_id})""" + ancestor_seeks + """
+            RETURN node_id, s, p, ss, sec, d, sc, c, b
+            """
+        
+        elif node_type == 'Concept':
+            return """
+            UNWIND $node_ids AS node_id
+            MATCH (concept:Concept {wikidata_id: node_id})
+            CALL {
+                WITH concept
+                OPTIONAL MATCH (concept)-[:CONCEPT_BELONGS_TO_SENTENCE]->(s:Sentence)
+                RETURN s
+                LIMIT 1
+            }""" + ancestor_seeks + """
+            RETURN node_id, concept, s, p, ss, sec, d, sc, c, b
+            """
+        
+        return None
+    
     def _build_hierarchy_query(self, node_type: str, node_id: str) -> str:
         """Build the appropriate Cypher query for hierarchy tracing based on node type."""
         
         # Build the query based on node type
+        # Sentences and paragraphs carry their ancestors' IDs (neo4j_utils.ancestry),
+        # so each ancestor is a single index seek instead of a multi-path walk
         if node_type == 'Sentence':
             return """
             MATCH (s:Sentence {sentence_id: $node_id})
-            OPTIONAL MATCH (s)-[:SENTENCE_BELONGS_TO_PARAGRAPH]->(p:Paragraph)
-            OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SUBSECTION]->(ss:Subsection)
-            OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SECTION]->(sec:Section)
-            OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_DOCUMENT]->(d:Document)
-            OPTIONAL MATCH (ss)-[:SUBSECTION_BELONGS_TO_SECTION]->(sec2:Section)
-            OPTIONAL MATCH (sec)-[:SECTION_BELONGS_TO_DOCUMENT]->(d2:Document)
-            OPTIONAL MATCH (sec2)-[:SECTION_BELONGS_TO_DOCUMENT]->(d3:Document)
-            OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc:Subchapter)
-            OPTIONAL MATCH (d2)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc2:Subchapter)
-            OPTIONAL MATCH (d3)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc3:Subchapter)
-            OPTIONAL MATCH (sc)-[:SUBCHAPTER_BELONGS_TO_CHAPTER]->(c:Chapter)
-            OPTIONAL MATCH (sc2)-[:SUBCHAPTER_BELONGS_TO_CHAPTER]->(c2:Chapter)
-            OPTIONAL MATCH (sc3)-[:SUBCHAPTER_BELONGS_TO_CHAPTER]->(c3:Chapter)
-            OPTIONAL MATCH (c)-[:CHAPTER_BELONGS_TO_BOOK]->(b:Book)
-            OPTIONAL MATCH (c2)-[:CHAPTER_BELONGS_TO_BOOK]->(b2:Book)
-            OPTIONAL MATCH (c3)-[:CHAPTER_BELONGS_TO_BOOK]->(b3:Book)
-            RETURN s, p, ss, sec, sec2, d, d2, d3, sc, sc2, sc3, c, c2, c3, b, b2, b3
+            OPTIONAL MATCH (p:Paragraph {paragraph_id: s.paragraph_id})
+            OPTIONAL MATCH (ss:Subsection {subsection_id: s.subsection_id})
+            OPTIONAL MATCH (sec:Section {section_id: s.section_id})
+            OPTIONAL MATCH (d:Document {document_id: s.document_id})
+            OPTIONAL MATCH (sc:Subchapter {subchapter_id: s.subchapter_id})
+            OPTIONAL MATCH (c:Chapter {chapter_id: s.chapter_id})
+            OPTIONAL MATCH (b:Book {book_id: s.book_id})
+            RETURN s, p, ss, sec, d, sc, c, b
+            LIMIT 1
             """
         
         elif node_type == 'Paragraph':
             return """
             MATCH (p:Paragraph {paragraph_id: $node_id})
-            OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SUBSECTION]->(ss:Subsection)
-            OPTIONAL MATCH (ss)-[:SUBSECTION_BELONGS_TO_SECTION]->(sec:Section)
-            OPTIONAL MATCH (sec)-[:SECTION_BELONGS_TO_DOCUMENT]->(d:Document)
-            OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc:Subchapter)
-            OPTIONAL MATCH (sc)-[:SUBCHAPTER_BELONGS_TO_CHAPTER]->(c:Chapter)
-            OPTIONAL MATCH (c)-[:CHAPTER_BELONGS_TO_BOOK]->(b:Book)
+            OPTIONAL MATCH (ss:Subsection {subsection_id: p.subsection_id})
+            OPTIONAL MATCH (sec:Section {section_id: p.section_id})
+            OPTIONAL MATCH (d:Document {document_id: p.document_id})
+            OPTIONAL MATCH (sc:Subchapter {subchapter_id: p.subchapter_id})
+            OPTIONAL MATCH (c:Chapter {chapter_id: p.chapter_id})
+            OPTIONAL MATCH (b:Book {book_id: p.book_id})
             RETURN p, ss, sec, d, sc, c, b
+            LIMIT 1
             """
         
         elif node_type == 'Subsection':
@@ -496,23 +1075,17 @@ class GraphRetriever:
             return """
             MATCH (concept:Concept {wikidata_id: $node_id})
             OPTIONAL MATCH (concept)-[:CONCEPT_BELONGS_TO_SENTENCE]->(s:Sentence)
-            OPTIONAL MATCH (s)-[:SENTENCE_BELONGS_TO_PARAGRAPH]->(p:Paragraph)
-            OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SUBSECTION]->(ss:Subsection)
-            OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SECTION]->(sec:Section)
-            OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_DOCUMENT]->(d:Document)
-            OPTIONAL MATCH (ss)-[:SUBSECTION_BELONGS_TO_SECTION]->(sec2:Section)
-            OPTIONAL MATCH (sec)-[:SECTION_BELONGS_TO_DOCUMENT]->(d2:Document)
-            OPTIONAL MATCH (sec2)-[:SECTION_BELONGS_TO_DOCUMENT]->(d3:Document)
-            OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc:Subchapter)
-            OPTIONAL MATCH (d2)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc2:Subchapter)
-            OPTIONAL MATCH (d3)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc3:Subchapter)
-            OPTIONAL MATCH (sc)-[:SUBCHAPTER_BELONGS_TO_CHAPTER]->(c:Chapter)
-            OPTIONAL MATCH (sc2)-[:SUBCHAPTER_BELONGS_TO_CHAPTER]->(c2:Chapter)
-            OPTIONAL MATCH (sc3)-[:SUBCHAPTER_BELONGS_TO_CHAPTER]->(c3:Chapter)
-            OPTIONAL MATCH (c)-[:CHAPTER_BELONGS_TO_BOOK]->(b:Book)
-            OPTIONAL MATCH (c2)-[:CHAPTER_BELONGS_TO_BOOK]->(b2:Book)
-            OPTIONAL MATCH (c3)-[:CHAPTER_BELONGS_TO_BOOK]->(b3:Book)
-            RETURN concept, s, p, ss, sec, sec2, d, d2, d3, sc, sc2, sc3, c, c2, c3, b, b2, b3
+            WITH concept, s
+            LIMIT 1
+            OPTIONAL MATCH (p:Paragraph {paragraph_id: s.paragraph_id})
+            OPTIONAL MATCH (ss:Subsection {subsection_id: s.subsection_id})
+            OPTIONAL MATCH (sec:Section {section_id: s.section_id})
+            OPTIONAL MATCH (d:Document {document_id: s.document_id})
+            OPTIONAL MATCH (sc:Subchapter {subchapter_id: s.subchapter_id})
+            OPTIONAL MATCH (c:Chapter {chapter_id: s.chapter_id})
+            OPTIONAL MATCH (b:Book {book_id: s.book_id})
+            RETURN concept, s, p, ss, sec, d, sc, c, b
+            LIMIT 1
             """
         
         return None
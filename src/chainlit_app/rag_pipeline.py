@@ -5,26 +5,46 @@ This module provides the GraphRAGPipeline class that orchestrates graph retrieva
 with LLM response generation for educational content Q&A.
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
 import json
 import logging
+import threading
+import time
 from typing import List, Dict, Any, Optional, Tuple
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from .azure_config import AzureConfig
 from .graph_retriever import GraphRetriever
+from .async_graph_retriever import AsyncGraphRetriever
+from .cypher_cache import CypherQueryCache
+from .cypher_parameterizer import parameterize_cypher
+
+# Fingerprints the labels, relationship types and property keys the generated Cypher depends on
+SCHEMA_FINGERPRINT_QUERY = """
+CALL db.labels() YIELD label
+WITH collect(label) AS labels
+CALL db.relationshipTypes() YIELD relationshipType
+WITH labels, collect(relationshipType) AS relationship_types
+CALL db.propertyKeys() YIELD propertyKey
+RETURN labels, relationship_types, collect(propertyKey) AS property_keys
+"""
 
 
 class GraphRAGPipeline:
     """GraphRAG pipeline for educational content Q&A."""
     
-    def __init__(self, neo4j_params: Dict[str, str], azure_config_file: str = "src/config/azure_llm_lite.json"):
+    def __init__(self, neo4j_params: Dict[str, str], azure_config_file: str = "src/config/azure_llm_lite.json",
+                 cypher_cache_file: Optional[str] = "cypher_cache.sqlite"):
         """
         Initialize the GraphRAG pipeline.
         
         Args:
             neo4j_params: Dictionary containing Neo4j connection parameters
             azure_config_file: Path to Azure configuration file
+            cypher_cache_file: SQLite file caching validated Cypher queries (None disables caching)
         """
         # Initialize components
         self.azure_config = AzureConfig(azure_config_file)
@@ -38,6 +58,19 @@ class GraphRAGPipeline:
         # Ensure Neo4j connection is established
         self.graph_retriever._connect()
         
+        # Context retrieval runs on the async driver in a background event loop
+        self.async_graph_retriever = None
+        self.retrieval_concurrency = 4  # Max concurrent queries per retrieval request
+        self._retrieval_loop = None
+        self._retrieval_thread = None
+        self._retrieval_lock = threading.Lock()
+        
+        # Validated Cypher queries are reused for repeated and near-duplicate questions
+        self.cypher_cache = CypherQueryCache(cypher_cache_file) if cypher_cache_file else None
+        self.schema_check_interval = 60.0  # Seconds between schema fingerprint refreshes
+        self._schema_fingerprint = None
+        self._schema_checked_at = 0.0
+        
         # Setup logging
         self.logger = logging.getLogger(__name__)
         
@@ -46,6 +79,9 @@ class GraphRAGPipeline:
         self.temperature = 0.1
         self.max_results = 10
         self.max_cypher_attempts = 3
+        self.cypher_candidates = 1  # Candidate queries generated concurrently per attempt (1 = sequential)
+        self.cypher_candidate_selection = "first_valid"  # "first_valid", "estimated_rows"
+        self.cypher_candidate_max_temperature = 0.8  # Temperature of the last candidate (spread from temperature)
         self.include_cypher_in_response = True
         self.include_metadata = True
         self.response_style = "educational"  # "educational", "concise", "detailed"
@@ -53,14 +89,16 @@ class GraphRAGPipeline:
         # Initialize LLM
         self.llm = self.azure_config.get_chat_llm(self.default_model, self.temperature)
         
-        # Setup prompt templates
+        # Setup prompt templates (the Cypher prompt version is set alongside its template)
+        self.cypher_prompt_version = None
         self.cypher_prompt_template = self._create_cypher_prompt_template()
         self.rag_prompt_template = self._create_rag_prompt_template()
     
     def update_parameters(self, model: str = None, temperature: float = None, 
                          max_results: int = None, max_cypher_attempts: int = None,
                          include_cypher_in_response: bool = None, include_metadata: bool = None,
-                         response_style: str = None):
+                         response_style: str = None, cypher_candidates: int = None,
+                         cypher_candidate_selection: str = None):
         """
         Update pipeline parameters dynamically.
         
@@ -72,6 +110,8 @@ class GraphRAGPipeline:
             include_cypher_in_response: Whether to include Cypher query in response
             include_metadata: Whether to include metadata in response
             response_style: Style of response ("educational", "concise", "detailed")
+            cypher_candidates: Candidate Cypher queries generated concurrently per attempt
+            cypher_candidate_selection: How to pick among valid candidates ("first_valid", "estimated_rows")
         """
         if model is not None and model != self.default_model:
             self.default_model = model
@@ -102,6 +142,14 @@ class GraphRAGPipeline:
         if response_style is not None and response_style in ["educational", "concise", "detailed"]:
             self.response_style = response_style
             self.logger.info(f"Updated response_style to: {response_style}")
+        
+        if cypher_candidates is not None and cypher_candidates >= 1:
+            self.cypher_candidates = cypher_candidates
+            self.logger.info(f"Updated cypher_candidates to: {cypher_candidates}")
+        
+        if cypher_candidate_selection is not None and cypher_candidate_selection in ["first_valid", "estimated_rows"]:
+            self.cypher_candidate_selection = cypher_candidate_selection
+            self.logger.info(f"Updated cypher_candidate_selection to: {cypher_candidate_selection}")
     
     def get_available_models(self) -> List[str]:
         """
@@ -125,13 +173,13 @@ class GraphRAGPipeline:
 
 ### Node Types:
 - **Book**: Represents books with properties: book_id, title, created_at, updated_at
-- **Chapter**: Book chapters with properties: chapter_id, title, order, created_at, updated_at
-- **Subchapter**: Chapter subdivisions with properties: subchapter_id, title, order, created_at, updated_at
-- **Document**: Content documents with properties: document_id, title, text, abstract, created_at, updated_at
-- **Section**: Document sections with properties: section_id, title, order, created_at, updated_at
-- **Subsection**: Section subdivisions with properties: subsection_id, title, order, created_at, updated_at
-- **Paragraph**: Text paragraphs with properties: paragraph_id, text, order, created_at, updated_at
-- **Sentence**: Individual sentences with properties: sentence_id, text, order, created_at, updated_at
+- **Chapter**: Book chapters with properties: chapter_id, book_id, title, order, created_at, updated_at
+- **Subchapter**: Chapter subdivisions with properties: subchapter_id, book_id, title, order, created_at, updated_at
+- **Document**: Content documents with properties: document_id, book_id, title, text, abstract, created_at, updated_at
+- **Section**: Document sections with properties: section_id, book_id, title, order, created_at, updated_at
+- **Subsection**: Section subdivisions with properties: subsection_id, book_id, title, order, created_at, updated_at
+- **Paragraph**: Text paragraphs with properties: paragraph_id, book_id, text, order, created_at, updated_at, plus the IDs and titles of every ancestor (book_title, chapter_id, chapter_title, subchapter_id, subchapter_title, document_id, document_title, section_id, section_title, subsection_id, subsection_title)
+- **Sentence**: Individual sentences with properties: sentence_id, book_id, text, order, created_at, updated_at, plus paragraph_id and the same ancestor IDs and titles as Paragraph (read these instead of traversing up the hierarchy)
 - **Concept**: Knowledge concepts with properties: concept_id, wikidata_id, wikidata_name, title, label, description, aliases, wikidata_url, lens, uuid, created_at, updated_at
 
 ### Relationship Types:
@@ -260,6 +308,9 @@ User Request: {question}
 
 Cypher Query:"""
         
+        # Editing the prompt changes its version, so cached queries from the old prompt are not reused
+        self.cypher_prompt_version = hashlib.sha1(template.encode('utf-8')).hexdigest()[:12]
+        
         return ChatPromptTemplate.from_template(template)
     
     def _create_rag_prompt_template(self) -> ChatPromptTemplate:
@@ -307,28 +358,116 @@ Response:"""
         """
         Retrieve relevant context from the knowledge graph.
         
+        Blocking wrapper around aretrieve_context for synchronous callers.
+        
+        Args:
+            question: User's question
+            
+        Returns:
+            Dictionary containing retrieved context
+        """
+        return self._submit_retrieval(self._retrieve_context_async(question)).result()
+    
+    async def aretrieve_context(self, question: str) -> Dict[str, Any]:
+        """
+        Retrieve relevant context from the knowledge graph without blocking the caller's event loop.
+        
+        Independent queries are issued concurrently, at most retrieval_concurrency
+        at a time per request.
+        
         Args:
             question: User's question
             
         Returns:
             Dictionary containing retrieved context
         """
+        return await asyncio.wrap_future(self._submit_retrieval(self._retrieve_context_async(question)))
+    
+    def _submit_retrieval(self, coroutine) -> concurrent.futures.Future:
+        """Schedule a retrieval coroutine on the pipeline's retrieval event loop."""
+        with self._retrieval_lock:
+            if self._retrieval_loop is None:
+                # The async driver is bound to one event loop, so all retrieval runs on a
+                # dedicated loop thread that both sync and async callers can submit to
+                self._retrieval_loop = asyncio.new_event_loop()
+                self._retrieval_thread = threading.Thread(target=self._retrieval_loop.run_forever,
+                                                          name="graph-retrieval", daemon=True)
+                self._retrieval_thread.start()
+        
+        return asyncio.run_coroutine_threadsafe(coroutine, self._retrieval_loop)
+    
+    async def _retrieve_context_async(self, question: str) -> Dict[str, Any]:
+        """Retrieve context on the retrieval event loop (see retrieve_context)."""
         self.logger.info(f"Retrieving context for question: {question}")
         
+        await self._get_async_graph_retriever()
+        
         # Extract key terms from the question for concept search
         question_terms = self._extract_key_terms(question)
         
+        # All terms in two round trips when the full-text indexes exist
+        try:
+            context = await self.async_graph_retriever.retrieve_for_terms(question_terms)
+            if context is not None:
+                self.logger.info(f"Retrieved context: {len(context['concepts'])} concepts, {len(context['sentences'])} sentences")
+                return context
+        except Exception as e:
+            self.logger.error(f"Error retrieving context: {e}")
+            return {'concepts': [], 'sentences': [], 'hierarchical_context': {},
+                    'related_concepts': [], 'error': str(e)}
+        
+        return await self._retrieve_context_per_term(question_terms)
+    
+    async def _get_async_graph_retriever(self) -> AsyncGraphRetriever:
+        """The async retriever, created and connected on first use on the retrieval event loop."""
+        if self.async_graph_retriever is None:
+            self.async_graph_retriever = AsyncGraphRetriever(
+                uri=self.graph_retriever.uri,
+                username=self.graph_retriever.username,
+                password=self.graph_retriever.password,
+                database=self.graph_retriever.database,
+                hierarchy_cache=self.graph_retriever.hierarchy_cache
+            )
+        if self.async_graph_retriever.driver is None:
+            await self.async_graph_retriever._connect()
+        return self.async_graph_retriever
+    
+    async def _retrieve_context_per_term(self, question_terms: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve context with one query per term (used without full-text indexes).
+        
+        Queries that do not depend on each other run concurrently, capped at
+        retrieval_concurrency in flight.
+        
+        Args:
+            question_terms: Key terms extracted from the question
+            
+        Returns:
+            Dictionary containing retrieved context
+        """
         context = {
             'concepts': [],
             'sentences': [],
             'hierarchical_context': {},
             'related_concepts': []
         }
+        retriever = self.async_graph_retriever
+        semaphore = asyncio.Semaphore(self.retrieval_concurrency)
+        
+        async def limited(coroutine):
+            async with semaphore:
+                return await coroutine
         
         try:
-            # 1. Search for relevant concepts
-            for term in question_terms:
-                concepts = self.graph_retriever.search_concepts(term, limit=5)
+            # 1. Search for relevant concepts and for sentences containing question terms
+            searches = await asyncio.gather(
+                *(limited(retriever.search_concepts(term, limit=5)) for term in question_terms),
+                *(limited(retriever.search_sentences_by_content(term, limit=10)) for term in question_terms)
+            )
+            concept_results = searches[:len(question_terms)]
+            term_sentence_results = searches[len(question_terms):]
+            
+            for concepts in concept_results:
                 context['concepts'].extend(concepts)
             
             # Remove duplicates
@@ -340,15 +479,17 @@ Response:"""
                     seen_concept_ids.add(concept['concept_id'])
             context['concepts'] = unique_concepts[:10]  # Limit to top 10
             
-            # 2. Get sentences for the found concepts
+            # 2. Get sentences for the found concepts and related concepts for the most relevant one
             if context['concepts']:
                 concept_ids = [c['concept_id'] for c in context['concepts']]
-                sentences = self.graph_retriever.get_sentences_for_concepts(concept_ids, limit=20)
-                context['sentences'].extend(sentences)
+                concept_sentences, related = await asyncio.gather(
+                    limited(retriever.get_sentences_for_concepts(concept_ids, limit=20)),
+                    limited(retriever.get_related_concepts(context['concepts'][0]['concept_id'], limit=5))
+                )
+                context['sentences'].extend(concept_sentences)
+                context['related_concepts'] = related
             
-            # 3. Search for sentences containing question terms
-            for term in question_terms:
-                sentences = self.graph_retriever.search_sentences_by_content(term, limit=10)
+            for sentences in term_sentence_results:
                 context['sentences'].extend(sentences)
             
             # Remove duplicate sentences
@@ -360,16 +501,10 @@ Response:"""
                     seen_sentence_ids.add(sentence['sentence_id'])
             context['sentences'] = unique_sentences[:25]  # Limit to top 25
             
-            # 4. Get hierarchical context for sentences
+            # 3. Get hierarchical context for sentences
             if context['sentences']:
                 sentence_ids = [s['sentence_id'] for s in context['sentences']]
-                context['hierarchical_context'] = self.graph_retriever.get_hierarchical_context(sentence_ids)
-            
-            # 5. Get related concepts for the most relevant concepts
-            if context['concepts']:
-                top_concept = context['concepts'][0]
-                related = self.graph_retriever.get_related_concepts(top_concept['concept_id'], limit=5)
-                context['related_concepts'] = related
+                context['hierarchical_context'] = await retriever.get_hierarchical_context(sentence_ids)
             
             self.logger.info(f"Retrieved context: {len(context['concepts'])} concepts, {len(context['sentences'])} sentences")
             
@@ -459,12 +594,13 @@ Response:"""
         
         return "\n".join(context_parts)
     
-    def generate_cypher_query(self, question: str) -> str:
+    def generate_cypher_query(self, question: str, temperature: float = None) -> str:
         """
         Generate Cypher query using the LLM.
         
         Args:
             question: User's question
+            temperature: Sampling temperature for this call (if None, uses temperature)
             
         Returns:
             Generated Cypher query
@@ -476,49 +612,236 @@ Response:"""
             )
             
             # Generate response
-            response = self.llm.invoke(prompt)
-            
-            # Extract Cypher query from response (remove markdown formatting if present)
-            cypher_query = response.content.strip()
+            response = self._cypher_llm(temperature).invoke(prompt)
+            return self._extract_cypher_query(response.content)
             
-            # Remove markdown code blocks if present
-            if cypher_query.startswith('```cypher'):
-                cypher_query = cypher_query[9:]  # Remove ```cypher
-            if cypher_query.startswith('```'):
-                cypher_query = cypher_query[3:]   # Remove ```
-            if cypher_query.endswith('```'):
-                cypher_query = cypher_query[:-3]  # Remove trailing ```
-            
-            return cypher_query.strip()
+        except Exception as e:
+            self.logger.error(f"Error generating Cypher query: {e}")
+            return f"// Error generating Cypher query: {str(e)}"
+    
+    async def agenerate_cypher_query(self, question: str, temperature: float = None) -> str:
+        """Generate a Cypher query without blocking the event loop (see generate_cypher_query)."""
+        try:
+            prompt = self.cypher_prompt_template.format_messages(question=question)
+            response = await self._cypher_llm(temperature).ainvoke(prompt)
+            return self._extract_cypher_query(response.content)
             
         except Exception as e:
             self.logger.error(f"Error generating Cypher query: {e}")
             return f"// Error generating Cypher query: {str(e)}"
     
-    def validate_cypher_query(self, cypher_query: str) -> bool:
+    def _cypher_llm(self, temperature: float = None):
+        """The LLM, bound to temperature if it differs from the configured one."""
+        return self.llm if temperature is None else self.llm.bind(temperature=temperature)
+    
+    def _extract_cypher_query(self, content: str) -> str:
+        """Extract the Cypher query from an LLM response (remove markdown formatting if present)."""
+        cypher_query = content.strip()
+        
+        # Remove markdown code blocks if present
+        if cypher_query.startswith('```cypher'):
+            cypher_query = cypher_query[9:]  # Remove ```cypher
+        if cypher_query.startswith('```'):
+            cypher_query = cypher_query[3:]   # Remove ```
+        if cypher_query.endswith('```'):
+            cypher_query = cypher_query[:-3]  # Remove trailing ```
+        
+        return cypher_query.strip()
+    
+    def prepare_cypher_query(self, cypher_query: str, limit: int = None) -> Tuple[str, Dict[str, Any]]:
+        """
+        Rewrite a generated Cypher query into the exact form that is validated and executed.
+        
+        Literals are moved into parameters and a parameterized LIMIT is added
+        if the query has none, so structurally identical queries share one
+        query string and Neo4j reuses its cached plan.
+        
+        Args:
+            cypher_query: The generated Cypher query
+            limit: Maximum number of results to return
+            
+        Returns:
+            Tuple of (parameterized query, parameters)
+        """
+        # Use instance max_results if limit not provided
+        if limit is None:
+            limit = self.max_results
+        
+        cypher_query, parameters = parameterize_cypher(cypher_query.strip().rstrip(';'))
+        
+        # Add LIMIT if not already present (checked after literals are removed)
+        if 'LIMIT' not in cypher_query.upper():
+            cypher_query = f"{cypher_query} LIMIT $result_limit"
+            parameters['result_limit'] = limit
+        
+        return cypher_query, parameters
+    
+    def validate_cypher_query(self, cypher_query: str, limit: int = None) -> bool:
         """
         Validate a Cypher query by attempting to explain it.
         
+        The prepared form is explained, so the plan Neo4j builds and caches
+        here is the one execute_cypher_query reuses.
+        
         Args:
             cypher_query: The Cypher query to validate
+            limit: Maximum number of results to return
             
         Returns:
             True if valid, False otherwise
         """
+        return self._explain_cypher_query(cypher_query, limit) is not None
+    
+    def _explain_cypher_query(self, cypher_query: str, limit: int = None) -> Optional[float]:
+        """
+        Explain a Cypher query without executing it.
+        
+        Args:
+            cypher_query: The Cypher query to explain
+            limit: Maximum number of results to return
+            
+        Returns:
+            The planner's estimated result rows (0.0 if not reported), or None if the query is invalid
+        """
         if not cypher_query or cypher_query.startswith('// Error'):
-            return False
+            return None
         
         try:
+            prepared_query, parameters = self.prepare_cypher_query(cypher_query, limit)
+            
             # Use Neo4j's EXPLAIN to validate the query
             with self.graph_retriever.driver.session(database=self.graph_retriever.database) as session:
                 # Try to explain the query (this validates syntax without executing)
-                explain_query = f"EXPLAIN {cypher_query}"
-                session.run(explain_query)
-                return True
+                explain_query = f"EXPLAIN {prepared_query}"
+                summary = session.run(explain_query, parameters).consume()
+                return self._estimated_rows(summary)
+                
+        except Exception as e:
+            self.logger.warning(f"Cypher query validation failed: {e}")
+            return None
+    
+    async def _aexplain_cypher_query(self, cypher_query: str, limit: int = None) -> Optional[float]:
+        """Explain a Cypher query on the async driver (see _explain_cypher_query)."""
+        if not cypher_query or cypher_query.startswith('// Error'):
+            return None
+        
+        try:
+            prepared_query, parameters = self.prepare_cypher_query(cypher_query, limit)
+            
+            retriever = await self._get_async_graph_retriever()
+            async with retriever.driver.session(database=retriever.database) as session:
+                result = await session.run(f"EXPLAIN {prepared_query}", parameters)
+                return self._estimated_rows(await result.consume())
                 
         except Exception as e:
             self.logger.warning(f"Cypher query validation failed: {e}")
-            return False
+            return None
+    
+    def _estimated_rows(self, summary) -> float:
+        """The planner's estimated result rows of an EXPLAIN summary (0.0 if not reported)."""
+        plan = summary.plan or {}
+        return float(plan.get('args', {}).get('EstimatedRows', 0.0))
+    
+    def generate_cypher_candidates(self, question: str, candidates: int = None) -> Optional[str]:
+        """
+        Generate candidate Cypher queries concurrently and pick a valid one.
+        
+        Each candidate is generated and explained as a task on the retrieval
+        event loop, all of them starting at once. Candidate temperatures are
+        spread evenly from temperature to cypher_candidate_max_temperature so
+        that the candidates differ; the first keeps the configured temperature.
+        With "first_valid" selection the first candidate to pass validation
+        wins and the LLM calls and EXPLAINs still running are cancelled; with
+        "estimated_rows" all candidates are awaited and the valid one with the
+        smallest non-zero estimated row count wins (queries the planner
+        expects to return nothing rank last).
+        
+        Args:
+            question: User's question
+            candidates: Number of candidates (if None, uses cypher_candidates)
+            
+        Returns:
+            The selected Cypher query, or None if no candidate is valid
+        """
+        if candidates is None:
+            candidates = self.cypher_candidates
+        
+        return self._submit_retrieval(self._generate_cypher_candidates_async(question, candidates)).result()
+    
+    async def _generate_cypher_candidates_async(self, question: str, candidates: int) -> Optional[str]:
+        """Generate and select candidates on the retrieval event loop (see generate_cypher_candidates)."""
+        async def generate_and_explain(temperature: float) -> Tuple[str, Optional[float]]:
+            cypher_query = await self.agenerate_cypher_query(question, temperature)
+            return cypher_query, await self._aexplain_cypher_query(cypher_query)
+        
+        temperature_step = ((max(self.cypher_candidate_max_temperature, self.temperature) - self.temperature)
+                            / max(candidates - 1, 1))
+        temperatures = [self.temperature + index * temperature_step for index in range(candidates)]
+        
+        tasks = [asyncio.create_task(generate_and_explain(temperature)) for temperature in temperatures]
+        try:
+            valid_candidates = []
+            
+            for next_candidate in asyncio.as_completed(tasks):
+                cypher_query, estimated_rows = await next_candidate
+                if estimated_rows is None:
+                    continue
+                if self.cypher_candidate_selection == "first_valid":
+                    return cypher_query
+                valid_candidates.append((estimated_rows <= 0, estimated_rows, cypher_query))
+            
+            if not valid_candidates:
+                return None
+            
+            _, estimated_rows, cypher_query = min(valid_candidates, key=lambda candidate: candidate[:2])
+            self.logger.info(f"Selected Cypher candidate with {estimated_rows:.0f} estimated rows "
+                             f"({len(valid_candidates)}/{candidates} valid)")
+            return cypher_query
+        
+        finally:
+            # Candidates still generating or explaining are no longer needed
+            for task in tasks:
+                task.cancel()
+    
+    def _get_schema_fingerprint(self) -> Optional[str]:
+        """
+        Get a fingerprint of the graph schema, refreshed at most every schema_check_interval seconds.
+        
+        Returns:
+            Fingerprint string, or None if the schema could not be read
+        """
+        now = time.monotonic()
+        if self._schema_fingerprint is not None and now - self._schema_checked_at < self.schema_check_interval:
+            return self._schema_fingerprint
+        
+        try:
+            with self.graph_retriever.driver.session(database=self.graph_retriever.database) as session:
+                record = session.run(SCHEMA_FINGERPRINT_QUERY).single()
+            schema = {key: sorted(record[key]) for key in ('labels', 'relationship_types', 'property_keys')}
+            self._schema_fingerprint = hashlib.sha1(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+            self._schema_checked_at = now
+            return self._schema_fingerprint
+        
+        except Exception as e:
+            self.logger.warning(f"Could not read graph schema, bypassing Cypher cache: {e}")
+            self._schema_fingerprint = None
+            return None
+    
+    def _get_cypher_cache_scope(self) -> Optional[str]:
+        """
+        Get the Cypher cache scope for the current model, prompt version and schema.
+        
+        Returns:
+            Scope string, or None if the cache is disabled or the schema is unknown
+        """
+        if self.cypher_cache is None:
+            return None
+        
+        schema_fingerprint = self._get_schema_fingerprint()
+        if schema_fingerprint is None:
+            return None
+        
+        return f"{self.default_model}:{self.cypher_prompt_version}:{schema_fingerprint}"
     
     def execute_cypher_query(self, cypher_query: str, limit: int = None) -> List[Dict[str, Any]]:
         """
@@ -532,16 +855,11 @@ Response:"""
             List of query results with enhanced hierarchy information
         """
         try:
-            # Use instance max_results if limit not provided
-            if limit is None:
-                limit = self.max_results
-            
-            # Add LIMIT if not already present
-            if 'LIMIT' not in cypher_query.upper():
-                cypher_query = f"{cypher_query} LIMIT {limit}"
+            # Same rewrite as validation, so the plan cached by EXPLAIN is reused
+            prepared_query, parameters = self.prepare_cypher_query(cypher_query, limit)
             
             with self.graph_retriever.driver.session(database=self.graph_retriever.database) as session:
-                result = session.run(cypher_query)
+                result = session.run(prepared_query, parameters)
                 records = []
                 
                 for record in result:
@@ -554,70 +872,75 @@ Response:"""
                             record_dict[key] = dict(value.items())
                         else:
                             record_dict[key] = value
-                    
-                    # Enhance with hierarchy information
-                    enhanced_record = self._enhance_record_with_hierarchy(record_dict)
-                    records.append(enhanced_record)
-                
-                self.logger.info(f"Executed query returned {len(records)} results")
-                return records
+                    records.append(record_dict)
+            
+            # Enhance with hierarchy information (one batched lookup per node type)
+            records = self._enhance_records_with_hierarchy(records)
+            
+            self.logger.info(f"Executed query returned {len(records)} results")
+            return records
                 
         except Exception as e:
             self.logger.error(f"Error executing Cypher query: {e}")
             return []
     
-    def _enhance_record_with_hierarchy(self, record: Dict[str, Any]) -> Dict[str, Any]:
+    def _enhance_records_with_hierarchy(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Enhance a query result record with full hierarchy information.
+        Enhance query result records with full hierarchy information.
+        
+        Sentence and concept IDs are collected from all records first and each
+        node type is traced in one batched query.
         
         Args:
-            record: The original query result record
+            records: The original query result records
             
         Returns:
-            Enhanced record with hierarchy information
+            Enhanced records with hierarchy information
         """
         try:
-            # Look for sentence_id in the record
-            sentence_id = None
-            if 's.sentence_id' in record:
-                sentence_id = record['s.sentence_id']
-            elif 'sentence_id' in record:
-                sentence_id = record['sentence_id']
-            
-            if sentence_id:
-                # Trace the hierarchy for this sentence
-                hierarchy = self.graph_retriever.trace_node_hierarchy(sentence_id, 'Sentence')
-                if 'error' not in hierarchy:
-                    record['hierarchy'] = hierarchy
-                    self.logger.debug(f"Enhanced record with hierarchy for sentence {sentence_id}")
-                else:
-                    self.logger.warning(f"Failed to trace hierarchy for sentence {sentence_id}: {hierarchy.get('error')}")
-            
-            # Look for concept_id in the record (try different field names)
-            concept_id = None
-            if 'c.concept_id' in record:
-                concept_id = record['c.concept_id']
-            elif 'c.wikidata_id' in record:
-                concept_id = record['c.wikidata_id']
-            elif 'concept_id' in record:
-                concept_id = record['concept_id']
-            elif 'wikidata_id' in record:
-                concept_id = record['wikidata_id']
-            
-            if concept_id:
-                # Trace the hierarchy for this concept
-                hierarchy = self.graph_retriever.trace_node_hierarchy(concept_id, 'Concept')
-                if 'error' not in hierarchy:
-                    record['hierarchy'] = hierarchy
-                    self.logger.debug(f"Enhanced record with hierarchy for concept {concept_id}")
-                else:
-                    self.logger.warning(f"Failed to trace hierarchy for concept {concept_id}: {hierarchy.get('error')}")
+            record_ids = []
+            for record in records:
+                # Look for sentence_id in the record
+                sentence_id = None
+                if 's.sentence_id' in record:
+                    sentence_id = record['s.sentence_id']
+                elif 'sentence_id' in record:
+                    sentence_id = record['sentence_id']
+                
+                # Look for concept_id in the record (try different field names)
+                concept_id = None
+                if 'c.concept_id' in record:
+                    concept_id = record['c.concept_id']
+                elif 'c.wikidata_id' in record:
+                    concept_id = record['c.wikidata_id']
+                elif 'concept_id' in record:
+                    concept_id = record['concept_id']
+                elif 'wikidata_id' in record:
+                    concept_id = record['wikidata_id']
+                
+                record_ids.append((sentence_id, concept_id))
+            
+            sentence_ids = [sentence_id for sentence_id, _ in record_ids if sentence_id]
+            concept_ids = [concept_id for _, concept_id in record_ids if concept_id]
+            sentence_hierarchies = self.graph_retriever.trace_node_hierarchies(sentence_ids, 'Sentence') if sentence_ids else {}
+            concept_hierarchies = self.graph_retriever.trace_node_hierarchies(concept_ids, 'Concept') if concept_ids else {}
+            
+            for record, (sentence_id, concept_id) in zip(records, record_ids):
+                # A concept's hierarchy takes precedence over its sentence's
+                for node_id, hierarchies, node_type in ((sentence_id, sentence_hierarchies, 'sentence'),
+                                                        (concept_id, concept_hierarchies, 'concept')):
+                    if not node_id:
+                        continue
+                    if node_id in hierarchies:
+                        record['hierarchy'] = hierarchies[node_id]
+                    else:
+                        self.logger.warning(f"Failed to trace hierarchy for {node_type} {node_id}")
             
-            return record
+            return records
             
         except Exception as e:
-            self.logger.warning(f"Error enhancing record with hierarchy: {e}")
-            return record
+            self.logger.warning(f"Error enhancing records with hierarchy: {e}")
+            return records
     
     def generate_rag_response(self, question: str, query_results: List[Dict[str, Any]]) -> str:
         """
@@ -666,16 +989,40 @@ Response:"""
         self.logger.info(f"Processing question: {question}")
         
         try:
-            # Step 1: Generate and validate Cypher query
-            cypher_query = None
-            max_attempts = self.max_cypher_attempts
+            # Step 1: Reuse a cached Cypher query, or generate and validate one
+            cache_scope = self._get_cypher_cache_scope()
+            cypher_query, cypher_cache_tier, cached_question = (
+                self.cypher_cache.get(cache_scope, question) if cache_scope else (None, None, None)
+            )
+            query_results = None
+            if cypher_query:
+                self.logger.info(f"Using cached Cypher query ({cypher_cache_tier} match)")
+                query_results = self.execute_cypher_query(cypher_query)
+                if not query_results:
+                    # Only queries that returned rows are cached, so the entry is stale
+                    self.logger.info("Cached Cypher query returned no results, removing it and regenerating")
+                    self.cypher_cache.delete(cache_scope, cached_question)
+                    cypher_query, cypher_cache_tier, query_results = None, None, None
+                elif cypher_cache_tier == 'similar':
+                    # Repeats of this question then hit the exact tier
+                    self.cypher_cache.put(cache_scope, question, cypher_query)
+            max_attempts = 0 if cypher_query else self.max_cypher_attempts
             
             for attempt in range(max_attempts):
-                self.logger.info(f"Generating Cypher query (attempt {attempt + 1}/{max_attempts})")
-                cypher_query = self.generate_cypher_query(question)
+                if self.cypher_candidates > 1:
+                    # Generate and validate several candidates concurrently
+                    self.logger.info(f"Generating {self.cypher_candidates} candidate Cypher queries "
+                                     f"(attempt {attempt + 1}/{max_attempts})")
+                    cypher_query = self.generate_cypher_candidates(question)
+                    is_valid = cypher_query is not None
+                else:
+                    self.logger.info(f"Generating Cypher query (attempt {attempt + 1}/{max_attempts})")
+                    cypher_query = self.generate_cypher_query(question)
+                    
+                    # Validate the query
+                    is_valid = self.validate_cypher_query(cypher_query)
                 
-                # Validate the query
-                if self.validate_cypher_query(cypher_query):
+                if is_valid:
                     self.logger.info("Cypher query validation successful")
                     break
                 else:
@@ -693,9 +1040,15 @@ Response:"""
                             }
                         }
             
-            # Step 2: Execute the validated Cypher query
-            self.logger.info("Executing Cypher query against Neo4j database")
-            query_results = self.execute_cypher_query(cypher_query)
+            # Step 2: Execute the validated Cypher query (a cache hit has already run)
+            if query_results is None:
+                self.logger.info("Executing Cypher query against Neo4j database")
+                query_results = self.execute_cypher_query(cypher_query)
+                
+                # Cache only queries that ran and found something: EXPLAIN accepts
+                # queries that fail at execution or match nothing
+                if cache_scope and query_results:
+                    self.cypher_cache.put(cache_scope, question, cypher_query)
             
             # Step 3: Generate RAG response based on query results
             self.logger.info("Generating RAG response based on query results")
@@ -712,7 +1065,11 @@ Response:"""
                     'model_used': self.default_model if self.include_metadata else None,
                     'temperature': self.temperature if self.include_metadata else None,
                     'response_style': self.response_style if self.include_metadata else None,
-                    'query_results': query_results if self.include_metadata else None
+                    'query_results': query_results if self.include_metadata else None,
+                    # Shared by the sync and async retrievers
+                    'hierarchy_cache': self.graph_retriever.get_hierarchy_cache_stats() if self.include_metadata else None,
+                    'cypher_cache_tier': cypher_cache_tier if self.include_metadata else None,
+                    'cypher_cache': self.cypher_cache.get_stats() if self.cypher_cache and self.include_metadata else None
                 }
             }
             
@@ -771,4 +1128,15 @@ Response:"""
         """Close all connections and cleanup resources."""
         if self.graph_retriever:
             self.graph_retriever.close()
+        if self.cypher_cache:
+            self.cypher_cache.close()
+            self.cypher_cache = None
+        if self._retrieval_loop is not None:
+            if self.async_graph_retriever:
+                self._submit_retrieval(self.async_graph_retriever.close()).result()
+                self.async_graph_retriever = None
+            self._retrieval_loop.call_soon_threadsafe(self._retrieval_loop.stop)
+            self._retrieval_thread.join()
+            self._retrieval_loop.close()
+            self._retrieval_loop = None
         self.logger.info("GraphRAG pipeline closed")
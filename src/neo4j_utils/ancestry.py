@@ -0,0 +1,92 @@
+"""
+Materialized ancestry for the OpenStax Knowledge Graph.
+
+The textbook hierarchy never changes after import, so the IDs and titles of a
+Paragraph's ancestors (Book down to Subsection) are copied onto the Paragraph
+and its Sentences. Retrieval can then read a sentence's full context as plain
+properties instead of walking six or more BELONGS_TO hops per query.
+
+Materialization runs at the end of every collection import and, for data
+imported before it existed, as a backfill (setup_neo4j_schema.py
+--materialize-ancestry). Both run the same queries.
+"""
+
+from typing import List, Optional
+
+# Properties written onto Paragraph and Sentence nodes
+ANCESTRY_PROPERTIES = (
+    'book_id', 'book_title',
+    'chapter_id', 'chapter_title',
+    'subchapter_id', 'subchapter_title',
+    'document_id', 'document_title',
+    'section_id', 'section_title',
+    'subsection_id', 'subsection_title'
+)
+
+# Resolve each paragraph's ancestors once, covering every parent path the importer creates
+PARAGRAPH_ANCESTRY_QUERY = """
+MATCH (p:Paragraph)
+WHERE ($book_id IS NULL OR p.book_id = $book_id)
+  AND ($paragraph_ids IS NULL OR p.paragraph_id IN $paragraph_ids)
+CALL {
+    WITH p
+    OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SUBSECTION]->(ss:Subsection)
+    OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_SECTION]->(p_sec:Section)
+    OPTIONAL MATCH (ss)-[:SUBSECTION_BELONGS_TO_SECTION]->(ss_sec:Section)
+    WITH p, ss, coalesce(p_sec, ss_sec) AS sec
+    OPTIONAL MATCH (p)-[:PARAGRAPH_BELONGS_TO_DOCUMENT]->(p_d:Document)
+    OPTIONAL MATCH (sec)-[:SECTION_BELONGS_TO_DOCUMENT]->(sec_d:Document)
+    OPTIONAL MATCH (ss)-[:SUBSECTION_BELONGS_TO_DOCUMENT]->(ss_d:Document)
+    WITH p, ss, sec, coalesce(p_d, sec_d, ss_d) AS d
+    OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_SUBCHAPTER]->(sc:Subchapter)
+    OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_CHAPTER]->(d_c:Chapter)
+    OPTIONAL MATCH (sc)-[:SUBCHAPTER_BELONGS_TO_CHAPTER]->(sc_c:Chapter)
+    WITH p, ss, sec, d, sc, coalesce(d_c, sc_c) AS c
+    OPTIONAL MATCH (c)-[:CHAPTER_BELONGS_TO_BOOK]->(c_b:Book)
+    OPTIONAL MATCH (d)-[:DOCUMENT_BELONGS_TO_BOOK]->(d_b:Book)
+    WITH p, ss, sec, d, sc, c, coalesce(c_b, d_b) AS b
+    LIMIT 1
+    SET p += {
+        book_id: coalesce(b.book_id, p.book_id), book_title: b.title,
+        chapter_id: c.chapter_id, chapter_title: c.title,
+        subchapter_id: sc.subchapter_id, subchapter_title: sc.title,
+        document_id: d.document_id, document_title: d.title,
+        section_id: sec.section_id, section_title: sec.title,
+        subsection_id: ss.subsection_id, subsection_title: ss.title
+    }
+} IN TRANSACTIONS OF 10000 ROWS
+"""
+
+# Sentences copy their paragraph's ancestry (one hop)
+SENTENCE_ANCESTRY_QUERY = """
+MATCH (s:Sentence)-[:SENTENCE_BELONGS_TO_PARAGRAPH]->(p:Paragraph)
+WHERE ($book_id IS NULL OR p.book_id = $book_id)
+  AND ($paragraph_ids IS NULL OR p.paragraph_id IN $paragraph_ids)
+CALL {
+    WITH s, p
+    SET s += p {.paragraph_id, %s}
+} IN TRANSACTIONS OF 10000 ROWS
+""" % ', '.join(f'.{name}' for name in ANCESTRY_PROPERTIES)
+
+
+def materialize_ancestry(session, book_id: Optional[str] = None,
+                         paragraph_ids: Optional[List[str]] = None) -> int:
+    """
+    Copy ancestor IDs and titles onto Paragraph and Sentence nodes.
+
+    Must run in an auto-commit session (session.run), since the writes are
+    batched with CALL { ... } IN TRANSACTIONS.
+
+    Args:
+        session: Neo4j session
+        book_id: Only materialize nodes of this book (all books if None)
+        paragraph_ids: Only materialize these paragraphs and their sentences (all if None)
+
+    Returns:
+        Number of properties set
+    """
+    properties_set = 0
+    for query in (PARAGRAPH_ANCESTRY_QUERY, SENTENCE_ANCESTRY_QUERY):
+        summary = session.run(query, book_id=book_id, paragraph_ids=paragraph_ids).consume()
+        properties_set += summary.counters.properties_set
+    return properties_set
@@ -0,0 +1,72 @@
+"""
+Import generation counter for the OpenStax Knowledge Graph.
+
+Textbook content only changes when it is (re)imported, so readers may cache
+anything derived from it. A single ImportGeneration node records a counter
+and timestamp that every import bumps; readers compare it with the
+generation their cache was filled under. The timestamp distinguishes
+generations across a database reset, where the counter starts over.
+"""
+
+from typing import Optional, Tuple
+
+IMPORT_GENERATION_NAME = 'textbooks'
+
+BUMP_IMPORT_GENERATION_QUERY = """
+MERGE (g:ImportGeneration {name: $name})
+SET g.generation = coalesce(g.generation, 0) + 1,
+    g.updated_at = datetime()
+RETURN g.generation AS generation, toString(g.updated_at) AS updated_at
+"""
+
+GET_IMPORT_GENERATION_QUERY = """
+OPTIONAL MATCH (g:ImportGeneration {name: $name})
+RETURN coalesce(g.generation, 0) AS generation, toString(g.updated_at) AS updated_at
+"""
+
+
+def bump_import_generation(session) -> int:
+    """
+    Mark the textbook content as changed, invalidating readers' caches.
+
+    Args:
+        session: Neo4j session
+
+    Returns:
+        The new generation number
+    """
+    record = session.run(BUMP_IMPORT_GENERATION_QUERY, name=IMPORT_GENERATION_NAME).single()
+    return record['generation']
+
+
+def get_import_generation(session) -> Tuple[int, Optional[str]]:
+    """
+    Read the current import generation.
+
+    Args:
+        session: Neo4j session
+
+    Returns:
+        Tuple of (generation, updated_at); (0, None) before the first import
+    """
+    record = session.run(GET_IMPORT_GENERATION_QUERY, name=IMPORT_GENERATION_NAME).single()
+    return _generation_from_record(record)
+
+
+async def aget_import_generation(session) -> Tuple[int, Optional[str]]:
+    """
+    Read the current import generation with an async session (see get_import_generation).
+
+    Args:
+        session: Neo4j async session
+
+    Returns:
+        Tuple of (generation, updated_at); (0, None) before the first import
+    """
+    result = await session.run(GET_IMPORT_GENERATION_QUERY, name=IMPORT_GENERATION_NAME)
+    return _generation_from_record(await result.single())
+
+
+def _generation_from_record(record) -> Tuple[int, Optional[str]]:
+    """Generation key of a GET_IMPORT_GENERATION_QUERY record."""
+    return record['generation'], record['updated_at']
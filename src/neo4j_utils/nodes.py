@@ -112,6 +112,7 @@ class Neo4jNodeCreator:
                 query = """
                 CREATE (sc:Subchapter {
                     subchapter_id: $subchapter_id,
+                    book_id: $book_id,
                     chapter_id: $chapter_id,
                     title: $title,
                     uuid: $uuid,
@@ -155,6 +156,7 @@ class Neo4jNodeCreator:
                 query = """
                 CREATE (s:Section {
                     section_id: $section_id,
+                    book_id: $book_id,
                     subchapter_id: $subchapter_id,
                     document_id: $document_id,
                     title: $title,
@@ -178,6 +180,7 @@ class Neo4jNodeCreator:
                 query = """
                 CREATE (ss:Subsection {
                     subsection_id: $subsection_id,
+                    book_id: $book_id,
                     section_id: $section_id,
                     title: $title,
                     uuid: $uuid,
@@ -200,6 +203,7 @@ class Neo4jNodeCreator:
                 query = """
                 CREATE (p:Paragraph {
                     paragraph_id: $paragraph_id,
+                    book_id: $book_id,
                     subsection_id: $subsection_id,
                     text: $text,
                     uuid: $uuid,
@@ -222,6 +226,7 @@ class Neo4jNodeCreator:
                 query = """
                 CREATE (sent:Sentence {
                     sentence_id: $sentence_id,
+                    book_id: $book_id,
                     paragraph_id: $paragraph_id,
                     text: $text,
                     uuid: $uuid,
@@ -8,6 +8,8 @@ with dual labeling schema.
 Features:
 - Database constraints creation
 - Performance indexes creation
+- Full-text indexes for sentence and concept search
+- Ancestry backfill onto Paragraph and Sentence nodes
 - Schema verification
 - Error handling and reporting
 """
@@ -21,6 +23,8 @@ from neo4j.exceptions import ServiceUnavailable, AuthError
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 from config.config_loader import get_neo4j_connection_params
+from .ancestry import materialize_ancestry
+from .import_generation import bump_import_generation
 
 
 class Neo4jSchemaSetup:
@@ -330,6 +334,12 @@ class Neo4jSchemaSetup:
             "CREATE INDEX sentence_id_index IF NOT EXISTS FOR (s:Sentence) ON (s.sentence_id)",
             "CREATE INDEX concept_id_index IF NOT EXISTS FOR (c:Concept) ON (c.concept_id)",
 
+            # Book scoping indexes for collection-level queries
+            *self._get_book_id_indexes(),
+
+            # Full-text (Lucene) indexes for retriever search
+            *self._get_fulltext_indexes(),
+
             # Concept/semantic indexes
             "CREATE INDEX concept_wikidata_id_index IF NOT EXISTS FOR (c:Concept) ON (c.wikidata_id)",
             "CREATE INDEX concept_wikidata_name_index IF NOT EXISTS FOR (c:Concept) ON (c.wikidata_name)",
@@ -346,6 +356,94 @@ class Neo4jSchemaSetup:
              "CREATE INDEX concept_lens_index IF NOT EXISTS FOR (c:Concept) ON (c.lens)"
         ]
 
+    def _get_book_id_indexes(self) -> List[str]:
+        """Get Cypher scripts for the book_id indexes on content nodes."""
+        return [
+            "CREATE INDEX chapter_book_id_index IF NOT EXISTS FOR (c:Chapter) ON (c.book_id)",
+            "CREATE INDEX subchapter_book_id_index IF NOT EXISTS FOR (sc:Subchapter) ON (sc.book_id)",
+            "CREATE INDEX document_book_id_index IF NOT EXISTS FOR (d:Document) ON (d.book_id)",
+            "CREATE INDEX section_book_id_index IF NOT EXISTS FOR (s:Section) ON (s.book_id)",
+            "CREATE INDEX subsection_book_id_index IF NOT EXISTS FOR (ss:Subsection) ON (ss.book_id)",
+            "CREATE INDEX paragraph_book_id_index IF NOT EXISTS FOR (p:Paragraph) ON (p.book_id)",
+            "CREATE INDEX sentence_book_id_index IF NOT EXISTS FOR (s:Sentence) ON (s.book_id)"
+        ]
+
+    def _get_fulltext_indexes(self) -> List[str]:
+        """Get Cypher scripts for the full-text indexes queried by GraphRetriever."""
+        return [
+            "CREATE FULLTEXT INDEX sentence_text_fulltext IF NOT EXISTS FOR (s:Sentence) ON EACH [s.text]",
+            "CREATE FULLTEXT INDEX concept_fulltext IF NOT EXISTS FOR (c:Concept) "
+            "ON EACH [c.label, c.name, c.wikidata_name, c.description, c.aliases]"
+        ]
+
+    def _get_book_id_backfill(self) -> List[str]:
+        """Get Cypher scripts that copy book_id down the CONTAINS hierarchy, one level at a time."""
+        levels = [
+            ('Chapter', 'CHAPTER_CONTAINS_SUBCHAPTER', 'Subchapter'),
+            ('Book', 'BOOK_CONTAINS_DOCUMENT', 'Document'),
+            ('Chapter', 'CHAPTER_CONTAINS_DOCUMENT', 'Document'),
+            ('Subchapter', 'SUBCHAPTER_CONTAINS_DOCUMENT', 'Document'),
+            ('Document', 'DOCUMENT_CONTAINS_SECTION', 'Section'),
+            ('Document', 'DOCUMENT_CONTAINS_SUBSECTION', 'Subsection'),
+            ('Section', 'SECTION_CONTAINS_SUBSECTION', 'Subsection'),
+            ('Document', 'DOCUMENT_CONTAINS_PARAGRAPH', 'Paragraph'),
+            ('Section', 'SECTION_CONTAINS_PARAGRAPH', 'Paragraph'),
+            ('Subsection', 'SUBSECTION_CONTAINS_PARAGRAPH', 'Paragraph'),
+            ('Paragraph', 'PARAGRAPH_CONTAINS_SENTENCE', 'Sentence')
+        ]
+        return [
+            f"MATCH (parent:{parent})-[:{rel_type}]->(child:{child}) "
+            f"WHERE child.book_id IS NULL AND parent.book_id IS NOT NULL "
+            f"CALL {{ WITH parent, child SET child.book_id = parent.book_id }} IN TRANSACTIONS OF 10000 ROWS"
+            for parent, rel_type, child in levels
+        ]
+
+    def migrate_book_ids(self) -> bool:
+        """Create the book_id indexes and backfill book_id on content nodes imported before it existed."""
+        try:
+            print("Migrating book_id onto content nodes...")
+            
+            # Ensure connection is established
+            if self.driver is None:
+                self._connect()
+            
+            with self.driver.session(database=self.database) as session:
+                for index in self._get_book_id_indexes():
+                    session.run(index)
+                
+                for backfill in self._get_book_id_backfill():
+                    summary = session.run(backfill).consume()
+                    print(f"   Backfilled {summary.counters.properties_set} nodes: {backfill[:60]}...")
+                bump_import_generation(session)
+                
+                print("book_id migration completed")
+                return True
+                
+        except Exception as e:
+            print(f"Error migrating book_id: {e}")
+            return False
+
+    def migrate_ancestry(self) -> bool:
+        """Backfill materialized ancestry (book to subsection IDs and titles) onto Paragraph and Sentence nodes."""
+        try:
+            print("Materializing ancestry onto paragraphs and sentences...")
+            
+            # Ensure connection is established
+            if self.driver is None:
+                self._connect()
+            
+            with self.driver.session(database=self.database) as session:
+                properties_set = materialize_ancestry(session)
+                print(f"   Set {properties_set} ancestry properties")
+                bump_import_generation(session)
+                
+                print("Ancestry materialization completed")
+                return True
+                
+        except Exception as e:
+            print(f"Error materializing ancestry: {e}")
+            return False
+
     def _get_relationships(self) -> List[str]:
         """Get Cypher scripts for creating relationship hierarchies."""
         return [
@@ -482,6 +580,7 @@ class Neo4jSchemaSetup:
             # Create sample subchapter
             subchapter_data = {
                 "subchapter_id": "sc01-01-sample",
+                "book_id": "bio-2e-sample",
                 "chapter_id": "ch01-sample",
                 "title": "What is Biology?",
                 "uuid": "subchapter-uuid-001",
@@ -507,6 +606,7 @@ class Neo4jSchemaSetup:
             # Create sample section
             section_data = {
                 "section_id": "sec01-sample",
+                "book_id": "bio-2e-sample",
                 "subchapter_id": "sc01-01-sample",
                 "document_id": "doc01-sample",
                 "title": "Definition of Biology",
@@ -521,6 +621,7 @@ class Neo4jSchemaSetup:
             # Create sample subsection
             subsection_data = {
                 "subsection_id": "subsec01-sample",
+                "book_id": "bio-2e-sample",
                 "section_id": "sec01-sample",
                 "title": "Scientific Study of Life",
                 "uuid": "subsection-uuid-001",
@@ -534,6 +635,7 @@ class Neo4jSchemaSetup:
             # Create sample paragraph
             paragraph_data = {
                 "paragraph_id": "para01-sample",
+                "book_id": "bio-2e-sample",
                 "subsection_id": "subsec01-sample",
                 "text": "Biology is the scientific study of life. It encompasses all living organisms and their interactions with the environment.",
                 "uuid": "paragraph-uuid-001",
@@ -547,6 +649,7 @@ class Neo4jSchemaSetup:
             # Create sample sentence
             sentence_data = {
                 "sentence_id": "sent01-sample",
+                "book_id": "bio-2e-sample",
                 "paragraph_id": "para01-sample",
                 "text": "Biology is the scientific study of life.",
                 "uuid": "sentence-uuid-001",
@@ -5,6 +5,11 @@ from .cache_manager import CacheManager
 from .entity_extractor import EntityExtractor
 from .wikidata_client import WikidataClient, WikidataEntity
 from .concept_manager import ConceptManager
+from .entity_linker import LocalEntityLinker
+from .dump_index import WikidataDumpIndex, build_dump_index
+from .gazetteer_extractor import GazetteerExtractor
+from .entity_memo import EntityMemoCache
+from .progress_journal import ProgressJournal, load_sentences_progress
 
 __all__ = [
     'ConceptExtractionSystem',
@@ -12,5 +17,12 @@ __all__ = [
     'EntityExtractor',
     'WikidataClient',
     'WikidataEntity',
-    'ConceptManager'
+    'ConceptManager',
+    'LocalEntityLinker',
+    'WikidataDumpIndex',
+    'build_dump_index',
+    'GazetteerExtractor',
+    'EntityMemoCache',
+    'ProgressJournal',
+    'load_sentences_progress'
 ]
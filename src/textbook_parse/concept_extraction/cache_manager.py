@@ -9,7 +9,7 @@ import tempfile
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
@@ -37,6 +37,7 @@ class CacheManager:
                  max_retries: int = 10, retry_delay: float = 0.1):
         self.cache_file = Path(cache_file_path)
         self.cache = {}
+        self._qid_index = {}  # QID -> cache record, rebuilt whenever the cache is replaced
         self._loaded = False
         self._lock = threading.RLock()  # Reentrant lock for nested locking
         self.max_retries = max_retries
@@ -61,8 +62,7 @@ class CacheManager:
             with self._lock:
                 # Double-check pattern
                 if not self._loaded:
-                    self.cache = self._load_cache()
-                    self._loaded = True
+                    self._set_cache_unsafe(self._load_cache())
     
     def get_cached_concept(self, entity_text: str) -> Optional[Dict[str, Any]]:
         """Thread-safe get cached Wikidata info for entity."""
@@ -71,6 +71,12 @@ class CacheManager:
         with self._lock:
             return self.cache.get(entity_text.lower())
     
+    def get_all_entries(self) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Thread-safe snapshot of every cache entry."""
+        self._ensure_loaded()
+        with self._lock:
+            return dict(self.cache)
+    
     def cache_concept(self, entity_text: str, wikidata_info: Optional[Dict[str, Any]]) -> None:
         """Thread-safe cache Wikidata info for entity (or None if not found)."""
         cache_entry = None
@@ -83,23 +89,61 @@ class CacheManager:
         # Atomic read-modify-write operation
         self._atomic_update_cache(entity_text.lower(), cache_entry)
     
+    def cache_concepts(self, entries: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Thread-safe cache many entities with a single disk write."""
+        if not entries:
+            return
+        
+        cached_at = datetime.now().isoformat()
+        updates = {
+            entity_text.lower(): ({**wikidata_info, 'cached_at': cached_at} if wikidata_info else None)
+            for entity_text, wikidata_info in entries.items()
+        }
+        
+        self._atomic_update_cache_many(updates)
+    
+    def find_by_qids(self, qids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Find cached records for the given QIDs (one record per QID)."""
+        self._ensure_loaded()
+        
+        with self._lock:
+            return {qid: self._qid_index[qid] for qid in qids if qid in self._qid_index}
+    
+    def _set_cache_unsafe(self, cache_data: Dict[str, Any]) -> None:
+        """Replace the in-memory cache and rebuild the QID index - must be called within lock."""
+        qid_index = {}
+        for record in cache_data.values():
+            if record and record.get('qid'):
+                qid = record['qid']
+                # Prefer records that carry wbgetentities details
+                if qid not in qid_index or 'instance_of' in record:
+                    qid_index[qid] = record
+        
+        self.cache = cache_data
+        self._qid_index = qid_index
+        self._loaded = True
+    
     def _atomic_update_cache(self, key: str, value: Any) -> None:
         """Atomic read-modify-write operation to prevent race conditions."""
+        self._atomic_update_cache_many({key: value})
+    
+    def _atomic_update_cache_many(self, updates: Dict[str, Any]) -> None:
+        """Atomic read-modify-write of several keys to prevent race conditions."""
+        key = next(iter(updates)) if len(updates) == 1 else f"{len(updates)} keys"
         for attempt in range(self.max_retries):
             try:
                 # Always read fresh data from disk to get latest state
                 current_cache = self._load_cache_from_disk()
                 
                 # Update the cache
-                current_cache[key] = value
+                current_cache.update(updates)
                 
                 # Atomic write back to disk
                 self._atomic_write_cache(current_cache)
                 
                 # Update in-memory cache for consistency
                 with self._lock:
-                    self.cache = current_cache
-                    self._loaded = True
+                    self._set_cache_unsafe(current_cache)
                 
                 logger.debug(f"Successfully updated cache for key: {key}")
                 return
@@ -163,8 +207,7 @@ class CacheManager:
             
             # Update in-memory cache
             with self._lock:
-                self.cache = sorted_cache
-                self._loaded = True
+                self._set_cache_unsafe(sorted_cache)
             
             logger.info(f"Cache file optimized and sorted with {len(sorted_cache)} entries")
             
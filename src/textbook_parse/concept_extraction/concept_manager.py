@@ -1,11 +1,30 @@
 """Neo4j concept node and relationship management."""
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Iterable, Iterator, Any
 from datetime import datetime
 
+from neo4j_utils.import_generation import bump_import_generation
+
 logger = logging.getLogger(__name__)
 
+# Concept properties written by every Concept MERGE; {concept} is the Cypher map holding
+# wikidata_id, name, description, aliases and wikidata_url
+CONCEPT_PROPERTIES_SET = """
+            c.name = {concept}.name,
+            c.wikidata_name = {concept}.name,
+            c.label = {concept}.name,
+            c.description = {concept}.description,
+            c.aliases = {concept}.aliases,
+            c.wikidata_url = {concept}.wikidata_url,"""
+
+def concept_merge_clause(concept: str) -> str:
+    """MERGE a Concept by wikidata_id and write its properties from the map expression concept."""
+    properties = CONCEPT_PROPERTIES_SET.format(concept=concept)
+    return (f"MERGE (c:Concept {{wikidata_id: {concept}.wikidata_id}})\n"
+            f"        ON CREATE SET{properties}\n            c.created_at = datetime()\n"
+            f"        ON MATCH SET{properties}\n            c.updated_at = datetime()")
+
 class ConceptManager:
     """Manages concept nodes and relationships in Neo4j."""
     
@@ -40,34 +59,66 @@ class ConceptManager:
         with self.driver.session() as session:
             result = session.run(query)
             return [dict(record) for record in result]
+
+    def iter_sentence_pages_without_concepts(self, page_size: int = 1000) -> Iterator[List[Dict]]:
+        """Page through sentences without concept relationships in sentence_id order.
+
+        Uses keyset pagination on the indexed sentence_id (``sentence_id > $cursor``)
+        rather than SKIP, so every page is an index range seek and memory stays
+        bounded by ``page_size``. Each page runs in its own short session.
+        """
+        query = """
+        MATCH (s:Sentence)
+        WHERE s.sentence_id > $cursor
+        AND NOT (s)-[:SENTENCE_CONTAINS_CONCEPT]->(:Concept)
+        AND s.text IS NOT NULL
+        RETURN s.sentence_id as sentence_id,
+               s.text as content
+        ORDER BY s.sentence_id
+        LIMIT $page_size
+        """
+
+        cursor = ''
+        while True:
+            with self.driver.session() as session:
+                result = session.run(query, cursor=cursor, page_size=page_size)
+                page = [dict(record) for record in result]
+
+            if not page:
+                return
+
+            yield page
+
+            if len(page) < page_size:
+                return
+            cursor = page[-1]['sentence_id']
+
+    def get_concept_terms(self) -> List[str]:
+        """Get labels, names and aliases of all concept nodes (for gazetteer matching)."""
+        query = """
+        MATCH (c:Concept)
+        RETURN c.label as label, c.name as name, c.aliases as aliases
+        """
+        
+        terms = []
+        with self.driver.session() as session:
+            result = session.run(query)
+            for record in result:
+                terms.extend(term for term in (record['label'], record['name']) if term)
+                terms.extend(record['aliases'] or [])
+        return terms
     
     def create_concept_with_relationship(self, sentence_id: str, wikidata_entity) -> bool:
         """Create concept node and establish bidirectional relationship with sentence."""
-        query = """
+        query = f"""
         // First, verify the sentence exists
-        MATCH (s:Sentence {sentence_id: $sentence_id})
+        MATCH (s:Sentence {{sentence_id: $sentence_id}})
         
         // Only proceed if sentence exists
         WITH s
         
         // Create or merge the concept node (use wikidata_id as unique identifier)
-        MERGE (c:Concept {wikidata_id: $wikidata_id})
-        ON CREATE SET 
-            c.name = $name,
-            c.wikidata_name = $wikidata_name,
-            c.label = $label,
-            c.description = $description,
-            c.aliases = $aliases,
-            c.wikidata_url = $wikidata_url,
-            c.created_at = datetime()
-        ON MATCH SET
-            c.name = $name,
-            c.wikidata_name = $wikidata_name,
-            c.label = $label,
-            c.description = $description,
-            c.aliases = $aliases,
-            c.wikidata_url = $wikidata_url,
-            c.updated_at = datetime()
+        {concept_merge_clause('$concept')}
         
         // Create bidirectional relationships
         MERGE (s)-[r1:SENTENCE_CONTAINS_CONCEPT]->(c)
@@ -84,13 +135,13 @@ class ConceptManager:
                 result = session.run(
                     query,
                     sentence_id=sentence_id,
-                    name=wikidata_entity.label,
-                    wikidata_id=wikidata_entity.qid,
-                    wikidata_name=wikidata_entity.label,
-                    label=wikidata_entity.label,
-                    description=wikidata_entity.description,
-                    aliases=wikidata_entity.aliases,
-                    wikidata_url=wikidata_entity.wikidata_url
+                    concept={
+                        'wikidata_id': wikidata_entity.qid,
+                        'name': wikidata_entity.label,
+                        'description': wikidata_entity.description,
+                        'aliases': wikidata_entity.aliases,
+                        'wikidata_url': wikidata_entity.wikidata_url
+                    }
                 )
                 
                 record = result.single()  # Get the single record from the result
@@ -102,6 +153,127 @@ class ConceptManager:
             logger.error(f"Error creating concept for sentence {sentence_id}: {e}")
             return False
     
+    def create_concepts_batch(self, concept_links: List[Dict], chunk_size: int = 500) -> int:
+        """Create concepts and their sentence relationships with chunked UNWIND writes.
+        
+        Args:
+            concept_links: List of {'entity': WikidataEntity, 'sentence_ids': [...]} groups,
+                one per QID
+            chunk_size: Number of concept groups written per transaction
+            
+        Returns:
+            Number of (sentence, concept) links written
+        """
+        query = f"""
+        UNWIND $concepts AS concept
+        
+        // Only link sentences that exist
+        MATCH (s:Sentence)
+        WHERE s.sentence_id IN concept.sentence_ids
+        WITH concept, collect(s) AS sentences
+        
+        // Create or merge the concept node once per QID
+        {concept_merge_clause('concept')}
+        
+        // Create bidirectional relationships for all sentences of this concept
+        WITH c, sentences
+        UNWIND sentences AS s
+        MERGE (s)-[r1:SENTENCE_CONTAINS_CONCEPT]->(c)
+        ON CREATE SET r1.created_at = datetime()
+        
+        MERGE (c)-[r2:CONCEPT_BELONGS_TO_SENTENCE]->(s)
+        ON CREATE SET r2.created_at = datetime()
+        
+        RETURN count(s) as links_created
+        """
+        
+        concepts = [
+            {
+                'wikidata_id': link['entity'].qid,
+                'name': link['entity'].label,
+                'description': link['entity'].description,
+                'aliases': link['entity'].aliases,
+                'wikidata_url': link['entity'].wikidata_url,
+                'sentence_ids': list(link['sentence_ids'])
+            }
+            for link in concept_links if link['sentence_ids']
+        ]
+        
+        links_created = 0
+        for start in range(0, len(concepts), chunk_size):
+            chunk = concepts[start:start + chunk_size]
+            try:
+                with self.driver.session() as session:
+                    record = session.run(query, concepts=chunk).single()
+                    links_created += record['links_created'] if record else 0
+            except Exception as e:
+                logger.error(f"Error writing batch of {len(chunk)} concepts: {e}")
+        
+        return links_created
+    
+    def import_concept_links(self, rows: Iterable[Dict[str, Any]], chunk_size: int = 5000,
+                             touch_existing: bool = False) -> Dict[str, Any]:
+        """Bulk-write (sentence, concept) links with chunked UNWIND batches.
+        
+        Rows whose sentence does not exist are skipped inside the query and
+        reported back in aggregate instead of being verified one by one.
+        
+        Args:
+            rows: Iterable of {'sentence_id', 'wikidata_id', 'name', 'description',
+                'aliases', 'wikidata_url'} dictionaries (consumed lazily)
+            chunk_size: Number of rows written per transaction
+            touch_existing: Also stamp updated_at on relationships that already exist
+            
+        Returns:
+            Dictionary with 'links_created', 'rows_processed' and 'missing_sentence_ids'
+        """
+        relationship_update = """
+            ON MATCH SET r1.updated_at = datetime()""" if touch_existing else ""
+        reverse_relationship_update = """
+            ON MATCH SET r2.updated_at = datetime()""" if touch_existing else ""
+        
+        query = f"""
+        UNWIND $rows AS row
+        OPTIONAL MATCH (s:Sentence {{sentence_id: row.sentence_id}})
+        
+        // Missing sentences fall through without writing anything
+        FOREACH (_ IN CASE WHEN s IS NULL THEN [] ELSE [1] END |
+            {concept_merge_clause('row')}
+            
+            MERGE (s)-[r1:SENTENCE_CONTAINS_CONCEPT]->(c)
+            ON CREATE SET r1.created_at = datetime(){relationship_update}
+            
+            MERGE (c)-[r2:CONCEPT_BELONGS_TO_SENTENCE]->(s)
+            ON CREATE SET r2.created_at = datetime(){reverse_relationship_update}
+        )
+        
+        RETURN count(s) AS links_created,
+               collect(DISTINCT CASE WHEN s IS NULL THEN row.sentence_id END) AS missing_sentence_ids
+        """
+        
+        stats = {'links_created': 0, 'rows_processed': 0, 'missing_sentence_ids': set()}
+        
+        def write_chunk(chunk: List[Dict[str, Any]]) -> None:
+            with self.driver.session() as session:
+                record = session.run(query, rows=chunk).single()
+            stats['rows_processed'] += len(chunk)
+            if record:
+                stats['links_created'] += record['links_created']
+                stats['missing_sentence_ids'].update(record['missing_sentence_ids'])
+            logger.info(f"  Imported {stats['links_created']} concept links ({stats['rows_processed']} rows)")
+        
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                write_chunk(chunk)
+                chunk = []
+        if chunk:
+            write_chunk(chunk)
+        
+        stats['missing_sentence_ids'] = sorted(stats['missing_sentence_ids'])
+        return stats
+    
     def get_concept_count(self) -> int:
         """Get total number of concept nodes."""
         query = "MATCH (c:Concept) RETURN count(c) as total"
@@ -123,6 +295,15 @@ class ConceptManager:
             record = result.single()  # Get the single record from the result
             return record['total'] if record else 0
     
+    def record_concepts_changed(self) -> None:
+        """Bump the import generation so readers drop hierarchies cached before these concept links existed."""
+        try:
+            with self.driver.session() as session:
+                generation = bump_import_generation(session)
+            logger.info(f"Import generation is now {generation}")
+        except Exception as e:
+            logger.warning(f"Could not bump import generation: {e}")
+    
     def cleanup_orphaned_concepts(self) -> int:
         """Remove concept nodes that have no relationships to sentences."""
         query = """
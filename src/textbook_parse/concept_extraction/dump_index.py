@@ -0,0 +1,291 @@
+"""Local Wikidata lookup service built from a Wikidata JSON dump.
+
+The index is a SQLite database with two tables:
+
+- ``entities``: one row per item (label, description, aliases, P31/P279, sitelink count)
+- ``terms``: normalized label/alias forms pointing at QIDs
+
+Building streams the dump line by line, parses chunks in worker processes and
+commits each chunk together with the byte offset reached, so an interrupted
+build resumes where it stopped and re-running on a newer dump only rewrites
+entities whose ``lastrevid`` changed.
+"""
+
+import bz2
+import gzip
+import json
+import logging
+import sqlite3
+import threading
+from collections import deque
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, List, Iterator, Tuple, Any
+
+from .entity_linker import normalize_term
+from .wikidata_client import WikidataEntity, parse_entity_record
+
+logger = logging.getLogger(__name__)
+
+LABEL_PRIORITY = 2
+ALIAS_PRIORITY = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    qid TEXT PRIMARY KEY,
+    label TEXT NOT NULL,
+    description TEXT,
+    aliases TEXT,
+    instance_of TEXT,
+    subclass_of TEXT,
+    sitelinks INTEGER DEFAULT 0,
+    lastrevid INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS terms (
+    form TEXT NOT NULL,
+    qid TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    PRIMARY KEY (form, qid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS terms_qid ON terms (qid);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+def _open_dump(dump_path: Path):
+    """Open a (possibly compressed) dump file in binary mode."""
+    if dump_path.suffix == '.gz':
+        return gzip.open(dump_path, 'rb')
+    if dump_path.suffix == '.bz2':
+        return bz2.open(dump_path, 'rb')
+    return open(dump_path, 'rb')
+
+def _parse_lines(lines: List[bytes], language: str) -> List[Tuple]:
+    """Parse dump lines into entity rows and their normalized forms (runs in worker processes)."""
+    rows = []
+
+    for raw_line in lines:
+        line = raw_line.strip().rstrip(b',')
+        if not line or line in (b'[', b']'):
+            continue
+
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+
+        if not record.get('id', '').startswith('Q'):
+            continue
+
+        entity = parse_entity_record(record, language)
+        if entity is None or not entity.label:
+            continue
+
+        forms = {normalize_term(entity.label): LABEL_PRIORITY}
+        for alias in entity.aliases:
+            form = normalize_term(alias)
+            if form and form not in forms:
+                forms[form] = ALIAS_PRIORITY
+        forms.pop('', None)
+
+        rows.append((
+            entity.qid,
+            entity.label,
+            entity.description,
+            json.dumps(entity.aliases, ensure_ascii=False),
+            json.dumps(entity.instance_of),
+            json.dumps(entity.subclass_of),
+            len(record.get('sitelinks', {})),
+            record.get('lastrevid', 0),
+            list(forms.items())
+        ))
+
+    return rows
+
+def _read_chunks(dump_file, start_offset: int, chunk_lines: int) -> Iterator[Tuple[List[bytes], int]]:
+    """Yield (lines, end_offset) chunks from the dump starting at a byte offset."""
+    if start_offset:
+        dump_file.seek(start_offset)
+
+    lines = []
+    for line in iter(dump_file.readline, b''):
+        lines.append(line)
+        if len(lines) >= chunk_lines:
+            yield lines, dump_file.tell()
+            lines = []
+
+    if lines:
+        yield lines, dump_file.tell()
+
+def build_dump_index(dump_path: str, index_path: str, workers: int = 4, chunk_lines: int = 2000,
+                     language: str = 'en', restart: bool = False) -> Dict[str, int]:
+    """Build or incrementally update a dump index.
+
+    Args:
+        dump_path: Wikidata JSON dump (array-per-line or JSON-lines, optionally .gz/.bz2)
+        index_path: SQLite index file to create or update
+        workers: Number of parser processes
+        chunk_lines: Dump lines per parser task (bounds memory together with ``workers``)
+        language: Language of labels, descriptions and aliases to index; an
+            index built for another language is cleared and rebuilt
+        restart: Ignore the stored offset and re-scan the dump from the start
+
+    Returns:
+        Dictionary with build statistics
+    """
+    dump_file_path = Path(dump_path)
+    stats = {'chunks': 0, 'entities_seen': 0, 'entities_written': 0, 'entities_unchanged': 0}
+
+    connection = sqlite3.connect(index_path)
+    connection.executescript(_SCHEMA)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+
+    source_key = f"{dump_file_path.resolve()}:{dump_file_path.stat().st_size}"
+    meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+
+    # Rows hold one language's labels, and unchanged lastrevids would keep the old ones
+    if meta.get('language') not in (None, language):
+        logger.info(f"Index language changes from {meta['language']} to {language}, rebuilding from scratch")
+        with connection:
+            connection.execute("DELETE FROM terms")
+            connection.execute("DELETE FROM entities")
+            connection.execute("DELETE FROM meta")
+        meta = {}
+
+    start_offset = 0
+    if not restart and meta.get('source') == source_key and meta.get('language') == language:
+        start_offset = int(meta.get('offset', 0))
+        if start_offset:
+            logger.info(f"Resuming dump index build at byte offset {start_offset}")
+
+    # Bound in-flight chunks so memory stays constant regardless of dump size
+    max_in_flight = max(1, workers) * 2
+
+    try:
+        with _open_dump(dump_file_path) as dump_file, Pool(processes=max(1, workers)) as pool:
+            pending = deque()
+
+            for lines, end_offset in _read_chunks(dump_file, start_offset, chunk_lines):
+                pending.append((pool.apply_async(_parse_lines, (lines, language)), end_offset))
+
+                if len(pending) >= max_in_flight:
+                    result, offset = pending.popleft()
+                    _write_rows(connection, result.get(), offset, source_key, language, stats)
+
+            while pending:
+                result, offset = pending.popleft()
+                _write_rows(connection, result.get(), offset, source_key, language, stats)
+
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('complete', ?)", (source_key,))
+        connection.commit()
+    finally:
+        connection.close()
+
+    logger.info(f"Dump index build finished: {stats}")
+    return stats
+
+def _write_rows(connection: sqlite3.Connection, rows: List[Tuple], end_offset: int,
+                source_key: str, language: str, stats: Dict[str, int]) -> None:
+    """Write a parsed chunk and its end offset in one transaction."""
+    stats['chunks'] += 1
+    stats['entities_seen'] += len(rows)
+
+    existing = {}
+    qids = [row[0] for row in rows]
+    for start in range(0, len(qids), 500):
+        batch = qids[start:start + 500]
+        placeholders = ','.join('?' * len(batch))
+        existing.update(connection.execute(
+            f"SELECT qid, lastrevid FROM entities WHERE qid IN ({placeholders})", batch
+        ).fetchall())
+
+    with connection:
+        for row in rows:
+            qid, lastrevid, forms = row[0], row[7], row[8]
+            if qid in existing and existing[qid] >= lastrevid:
+                stats['entities_unchanged'] += 1
+                continue
+
+            connection.execute("INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row[:8])
+            connection.execute("DELETE FROM terms WHERE qid = ?", (qid,))
+            connection.executemany(
+                "INSERT OR REPLACE INTO terms (form, qid, priority) VALUES (?, ?, ?)",
+                [(form, qid, priority) for form, priority in forms]
+            )
+            stats['entities_written'] += 1
+
+        connection.executemany("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [
+            ('source', source_key),
+            ('language', language),
+            ('offset', str(end_offset))
+        ])
+
+    if stats['chunks'] % 100 == 0:
+        logger.info(f"  Indexed {stats['entities_seen']} entities ({stats['entities_written']} written)")
+
+class WikidataDumpIndex:
+    """Read-only lookups against an index built by ``build_dump_index``."""
+
+    def __init__(self, index_path: str):
+        self.index_path = Path(index_path)
+        if not self.index_path.exists():
+            raise FileNotFoundError(f"Wikidata dump index not found: {self.index_path}")
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(f"file:{self.index_path}?mode=ro", uri=True)
+            self._local.connection = connection
+        return connection
+
+    def search(self, term: str, limit: int = 3) -> List[str]:
+        """Find candidate QIDs for a term, labels before aliases, popular items first."""
+        form = normalize_term(term)
+        if not form:
+            return []
+
+        rows = self._connection().execute("""
+            SELECT t.qid FROM terms t JOIN entities e ON e.qid = t.qid
+            WHERE t.form = ?
+            ORDER BY t.priority DESC, e.sitelinks DESC
+            LIMIT ?
+        """, (form, limit)).fetchall()
+        return [row[0] for row in rows]
+
+    def get_entities(self, qids: List[str]) -> Dict[str, WikidataEntity]:
+        """Fetch entity details for QIDs present in the index."""
+        if not qids:
+            return {}
+
+        placeholders = ','.join('?' * len(qids))
+        rows = self._connection().execute(f"""
+            SELECT qid, label, description, aliases, instance_of, subclass_of
+            FROM entities WHERE qid IN ({placeholders})
+        """, qids).fetchall()
+
+        return {
+            qid: WikidataEntity(
+                qid=qid,
+                label=label,
+                description=description or '',
+                aliases=json.loads(aliases or '[]'),
+                instance_of=json.loads(instance_of or '[]'),
+                subclass_of=json.loads(subclass_of or '[]')
+            )
+            for qid, label, description, aliases, instance_of, subclass_of in rows
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index size and build metadata."""
+        connection = self._connection()
+        meta = dict(connection.execute("SELECT key, value FROM meta").fetchall())
+        return {
+            'entities': connection.execute("SELECT count(*) FROM entities").fetchone()[0],
+            'terms': connection.execute("SELECT count(*) FROM terms").fetchone()[0],
+            'complete': meta.get('complete') == meta.get('source')
+        }
@@ -2,28 +2,108 @@
 
 import logging
 import re
-from typing import List, Set
+from typing import Dict, Iterable, List, Set, Tuple, Any
 import spacy
 
 logger = logging.getLogger(__name__)
 
+GENERIC_TERMS = {
+    'sentence', 'paragraph', 'text', 'content', 'information', 'data',
+    'thing', 'way', 'time', 'year', 'work', 'case', 'group', 'number',
+    'system', 'process', 'method', 'result', 'study', 'research',
+    'analysis', 'example', 'type', 'kind', 'form', 'part', 'area',
+    'use', 'used', 'using', 'made', 'making', 'take', 'taken', 'taking'
+}
+
+# Bump when the extraction rules change so memoized results are not reused
+EXTRACTOR_VERSION = 1
+
+# Pipeline components whose output extract_entities depends on (NER, POS, lemmas,
+# and the dependency parse for noun chunks). Anything else is disabled when piping.
+REQUIRED_COMPONENTS = {
+    'tok2vec', 'transformer', 'tagger', 'morphologizer', 'attribute_ruler',
+    'lemmatizer', 'parser', 'ner'
+}
+
 class EntityExtractor:
     """Extracts named entities and key terms from sentence content using spaCy."""
     
-    def __init__(self, model_name: str = "en_core_web_sm"):
+    def __init__(self, model_name: str = "en_core_web_sm", memo=None):
+        """Load the spaCy model.
+        
+        Args:
+            model_name: spaCy model to load
+            memo: Optional EntityMemoCache shared between extractors
+        """
+        self.model_name = model_name
+        self.memo = memo
         try:
             self.nlp = spacy.load(model_name)
             logger.info(f"Loaded spaCy model: {model_name}")
         except OSError:
             logger.error(f"spaCy model {model_name} not found. Install with: python -m spacy download {model_name}")
             raise
+        
+        # Memo entries are only valid for this exact model and extraction logic
+        self.memo_scope = f"{model_name}:{self.nlp.meta.get('version', '')}:spacy-{spacy.__version__}:v{EXTRACTOR_VERSION}"
     
     def extract_entities(self, text: str) -> List[str]:
         """Extract meaningful entities from text."""
         if not text or not isinstance(text, str):
             return []
         
-        doc = self.nlp(text)
+        if self.memo is not None:
+            memoized = self.memo.get(self.memo_scope, text)
+            if memoized is not None:
+                return memoized
+        
+        entities = self._entities_from_doc(self.nlp(text))
+        
+        if self.memo is not None:
+            self.memo.put(self.memo_scope, text, entities)
+        return entities
+    
+    def extract_entities_batch(self, sentences: Iterable[Tuple[Any, str]], batch_size: int = 256,
+                               n_process: int = 1) -> Dict[Any, List[str]]:
+        """Extract entities for many sentences with nlp.pipe.
+        
+        Args:
+            sentences: Iterable of (sentence_id, text) pairs
+            batch_size: Number of texts spaCy processes per batch
+            n_process: Number of processes spaCy uses (1 = in-process)
+            
+        Returns:
+            Dictionary mapping sentence_id to the same list extract_entities returns
+        """
+        results = {}
+        to_parse = []
+        
+        for sentence_id, text in sentences:
+            if not text or not isinstance(text, str):
+                results[sentence_id] = []
+                continue
+            
+            memoized = self.memo.get(self.memo_scope, text) if self.memo is not None else None
+            if memoized is not None:
+                results[sentence_id] = memoized
+            else:
+                to_parse.append((text, sentence_id))
+        
+        if not to_parse:
+            return results
+        
+        disabled = [name for name in self.nlp.pipe_names if name not in REQUIRED_COMPONENTS]
+        docs = self.nlp.pipe(to_parse, as_tuples=True, batch_size=batch_size,
+                             n_process=n_process, disable=disabled)
+        for doc, sentence_id in docs:
+            results[sentence_id] = self._entities_from_doc(doc)
+            if self.memo is not None:
+                self.memo.put(self.memo_scope, doc.text, results[sentence_id])
+        
+        return results
+    
+    def _entities_from_doc(self, doc) -> List[str]:
+        """Collect entities, nouns and noun phrases from a parsed doc."""
         entities = set()
         
         # Extract named entities (expanded for educational content)
@@ -69,7 +149,8 @@ class EntityExtractor:
         
         return cleaned
     
-    def _is_valid_entity(self, entity: str) -> bool:
+    @staticmethod
+    def _is_valid_entity(entity: str) -> bool:
         """Check if entity is valid for Wikidata lookup."""
         if not entity or len(entity) < 2:
             return False
@@ -88,14 +169,7 @@ class EntityExtractor:
         
         return True
     
-    def _is_generic_term(self, entity: str) -> bool:
+    @staticmethod
+    def _is_generic_term(entity: str) -> bool:
         """Check if entity is a generic term to filter out."""
-        generic_terms = {
-            'sentence', 'paragraph', 'text', 'content', 'information', 'data',
-            'thing', 'way', 'time', 'year', 'work', 'case', 'group', 'number',
-            'system', 'process', 'method', 'result', 'study', 'research',
-            'analysis', 'example', 'type', 'kind', 'form', 'part', 'area',
-            'use', 'used', 'using', 'made', 'making', 'take', 'taken', 'taking'
-        }
-        
-        return entity.lower() in generic_terms
+        return entity.lower() in GENERIC_TERMS
@@ -0,0 +1,181 @@
+"""Offline entity linking against labels and aliases already in the Wikidata cache."""
+
+import json
+import logging
+import re
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Priority of the surface form a normalized key was derived from
+_PRIORITY_TERM = 3     # cache key (the text that was originally looked up)
+_PRIORITY_LABEL = 2
+_PRIORITY_ALIAS = 1
+
+def _singularize(token: str) -> str:
+    """Cheap rule-based singularization for the head word of a phrase."""
+    if len(token) <= 3:
+        return token
+    if token.endswith('ies') and len(token) > 4:
+        return token[:-3] + 'y'
+    if token.endswith(('sses', 'shes', 'ches', 'xes', 'zes')):
+        return token[:-2]
+    if token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+def normalize_term(text: str) -> str:
+    """Normalize a term for linking: strip accents, case fold, drop punctuation, singularize."""
+    if not text:
+        return ""
+
+    decomposed = unicodedata.normalize('NFKD', text)
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    folded = re.sub(r'[^\w]+', ' ', stripped.casefold()).strip()
+
+    tokens = folded.split()
+    if not tokens:
+        return ""
+
+    tokens[-1] = _singularize(tokens[-1])
+    return ' '.join(tokens)
+
+class LocalEntityLinker:
+    """Hash index from normalized labels/aliases to cached Wikidata records.
+
+    The index is built from every non-null record in the cache and persisted
+    as a compact JSON file next to it. Normalized forms that point at more
+    than one QID with the same priority are treated as ambiguous and never
+    linked.
+    """
+
+    def __init__(self, index_file: Optional[str] = None):
+        self.index_file = Path(index_file) if index_file else None
+        self._forms: Dict[str, Optional[str]] = {}
+        self._priorities: Dict[str, int] = {}
+        self._entities: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_cache(cls, cache_manager, index_file: Optional[str] = None) -> 'LocalEntityLinker':
+        """Load the persisted index, rebuilding it if missing or older than the cache."""
+        if index_file is None:
+            index_file = str(cache_manager.cache_file.with_suffix('.index.json'))
+
+        linker = cls(index_file)
+        cache_file = cache_manager.cache_file
+
+        index_is_fresh = (
+            linker.index_file.exists() and
+            (not cache_file.exists() or linker.index_file.stat().st_mtime >= cache_file.stat().st_mtime)
+        )
+
+        if index_is_fresh and linker.load():
+            return linker
+
+        linker.build(cache_manager.get_all_entries())
+        linker.save()
+        return linker
+
+    def build(self, cache_entries: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Build the index from cache entries (term -> record or None)."""
+        with self._lock:
+            self._forms = {}
+            self._priorities = {}
+            self._entities = {}
+
+            for term, record in cache_entries.items():
+                if record and record.get('qid'):
+                    self._add_unlocked(record, term)
+
+        logger.info(f"Built local entity index with {len(self._forms)} forms for {len(self._entities)} entities")
+
+    def add_entity(self, record: Dict[str, Any], term: Optional[str] = None) -> None:
+        """Add a newly resolved record to the in-memory index."""
+        if record and record.get('qid'):
+            with self._lock:
+                self._add_unlocked(record, term)
+
+    def _add_unlocked(self, record: Dict[str, Any], term: Optional[str]) -> None:
+        """Index one record - must be called within lock."""
+        qid = record['qid']
+        existing = self._entities.get(qid)
+        # Keep the richest record seen for a QID
+        if existing is None or ('instance_of' in record and 'instance_of' not in existing):
+            self._entities[qid] = {k: v for k, v in record.items() if k != 'cached_at'}
+
+        if term:
+            self._add_form(normalize_term(term), qid, _PRIORITY_TERM)
+        self._add_form(normalize_term(record.get('label', '')), qid, _PRIORITY_LABEL)
+        for alias in record.get('aliases', []):
+            self._add_form(normalize_term(alias), qid, _PRIORITY_ALIAS)
+
+    def _add_form(self, form: str, qid: str, priority: int) -> None:
+        """Register a normalized form, marking same-priority conflicts as ambiguous."""
+        if not form:
+            return
+
+        current_priority = self._priorities.get(form, 0)
+        if priority > current_priority:
+            self._forms[form] = qid
+            self._priorities[form] = priority
+        elif priority == current_priority and self._forms.get(form) != qid:
+            self._forms[form] = None
+
+    def lookup(self, term: str) -> Optional[Dict[str, Any]]:
+        """Return the cached record linked to a term, or None if there is no unambiguous match."""
+        form = normalize_term(term)
+        with self._lock:
+            qid = self._forms.get(form)
+            return self._entities.get(qid) if qid else None
+
+    def save(self) -> None:
+        """Persist the index as compact JSON."""
+        if not self.index_file:
+            return
+
+        with self._lock:
+            payload = {
+                'version': INDEX_VERSION,
+                'forms': self._forms,
+                'priorities': self._priorities,
+                'entities': self._entities
+            }
+            data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
+        try:
+            temp_file = self.index_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(data)
+            temp_file.replace(self.index_file)
+            logger.info(f"Saved local entity index to {self.index_file}")
+        except Exception as e:
+            logger.warning(f"Could not save local entity index: {e}")
+
+    def load(self) -> bool:
+        """Load a persisted index. Returns False if it is missing or outdated."""
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load local entity index: {e}")
+            return False
+
+        if payload.get('version') != INDEX_VERSION:
+            return False
+
+        with self._lock:
+            self._forms = payload.get('forms', {})
+            self._priorities = payload.get('priorities', {})
+            self._entities = payload.get('entities', {})
+
+        logger.info(f"Loaded local entity index with {len(self._forms)} forms from {self.index_file}")
+        return True
+
+    def __len__(self) -> int:
+        return len(self._forms)
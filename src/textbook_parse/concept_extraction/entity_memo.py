@@ -0,0 +1,107 @@
+"""Persistent memo of extracted entities keyed by normalized sentence text."""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+def normalize_sentence_text(text: str) -> str:
+    """Collapse whitespace so trivially different copies of a sentence share an entry."""
+    return re.sub(r'\s+', ' ', text).strip()
+
+def text_hash(text: str) -> str:
+    """Stable hash of normalized sentence text."""
+    return hashlib.sha1(normalize_sentence_text(text).encode('utf-8')).hexdigest()
+
+class EntityMemoCache:
+    """Thread-safe SQLite memo mapping sentence text hashes to entity lists.
+
+    Entries are scoped (model name, model version, extractor version) so a
+    model upgrade never serves stale results. Writes are buffered and
+    flushed in batches.
+    """
+
+    def __init__(self, memo_file: str = "entity_memo.sqlite", flush_every: int = 500):
+        self.memo_file = memo_file
+        self.flush_every = flush_every
+        self._lock = threading.Lock()
+        self._pending: Dict[tuple, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+        self._connection = sqlite3.connect(memo_file, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS entity_memo (
+                scope TEXT NOT NULL,
+                text_hash TEXT NOT NULL,
+                entities TEXT NOT NULL,
+                PRIMARY KEY (scope, text_hash)
+            ) WITHOUT ROWID
+        """)
+        self._connection.commit()
+        logger.info(f"Entity memo cache opened: {memo_file}")
+
+    def get(self, scope: str, text: str) -> Optional[List[str]]:
+        """Return memoized entities for a sentence, or None on a miss."""
+        key = (scope, text_hash(text))
+
+        with self._lock:
+            entities_json = self._pending.get(key)
+            if entities_json is None:
+                row = self._connection.execute(
+                    "SELECT entities FROM entity_memo WHERE scope = ? AND text_hash = ?", key
+                ).fetchone()
+                entities_json = row[0] if row else None
+
+            if entities_json is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return json.loads(entities_json)
+
+    def put(self, scope: str, text: str, entities: List[str]) -> None:
+        """Memoize the entities extracted from a sentence."""
+        with self._lock:
+            self._pending[(scope, text_hash(text))] = json.dumps(entities, ensure_ascii=False)
+            if len(self._pending) >= self.flush_every:
+                self._flush_unlocked()
+
+    def flush(self) -> None:
+        """Write buffered entries to disk."""
+        with self._lock:
+            self._flush_unlocked()
+
+    def _flush_unlocked(self) -> None:
+        """Write buffered entries - must be called within lock."""
+        if not self._pending:
+            return
+
+        rows = [(scope, hash_value, entities) for (scope, hash_value), entities in self._pending.items()]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entity_memo (scope, text_hash, entities) VALUES (?, ?, ?)", rows
+            )
+        self._pending = {}
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get memo hit/miss statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'memo_hits': self.hits,
+                'memo_misses': self.misses,
+                'memo_hit_rate': (self.hits / total * 100) if total > 0 else 0
+            }
+
+    def close(self) -> None:
+        """Flush pending entries and close the database."""
+        with self._lock:
+            self._flush_unlocked()
+            self._connection.close()
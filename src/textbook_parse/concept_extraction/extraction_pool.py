@@ -0,0 +1,91 @@
+"""Worker pool for spaCy entity extraction.
+
+Every worker process loads the spaCy model exactly once in the pool
+initializer and then serves extraction requests in sentence chunks, so the
+number of model copies is bounded by the number of processes (not threads)
+and the processes do not share a GIL. Results carry the worker's model load
+time and resident memory so callers can report them.
+"""
+
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from .entity_extractor import EntityExtractor
+
+logger = logging.getLogger(__name__)
+
+# Per-process extractor, set by init_extraction_worker
+_worker_extractor: Optional[EntityExtractor] = None
+_worker_startup_seconds = 0.0
+
+def resident_memory_mb() -> Optional[float]:
+    """Resident set size of the current process in MB (peak RSS where current RSS is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return max_rss / 2 ** 20 if sys.platform == 'darwin' else max_rss / 1024
+
+def init_extraction_worker(model_name: str) -> None:
+    """Pool initializer: load the spaCy model once for this worker."""
+    global _worker_extractor, _worker_startup_seconds
+
+    started = time.perf_counter()
+    _worker_extractor = EntityExtractor(model_name)
+    _worker_startup_seconds = time.perf_counter() - started
+
+def extraction_worker_info() -> Dict[str, Any]:
+    """Describe the current worker: pid, model load time, memory and memo scope."""
+    return {
+        'pid': os.getpid(),
+        'startup_seconds': _worker_startup_seconds,
+        'rss_mb': resident_memory_mb(),
+        'memo_scope': _worker_extractor.memo_scope
+    }
+
+def extract_entities_in_worker(sentences: List[Tuple[str, str]]) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
+    """Extract entities for a chunk of (sentence_id, text) pairs in the current worker.
+
+    Returns:
+        Tuple of (sentence_id -> entities, worker info)
+    """
+    return _worker_extractor.extract_entities_batch(sentences), extraction_worker_info()
+
+def create_extraction_executor(processes: int, model_name: str = "en_core_web_sm") -> Executor:
+    """Create an executor whose workers each hold one loaded spaCy model.
+
+    Workers are spawned rather than forked: the pool is created after the
+    Neo4j driver and the page producer thread exist, and a forked child could
+    inherit their locks (logging, driver pool) in a held state.
+
+    Args:
+        processes: Number of worker processes; 0 extracts in a single
+            background thread of the current process instead
+        model_name: spaCy model loaded by every worker
+
+    Returns:
+        Executor to submit extract_entities_in_worker / extraction_worker_info to
+    """
+    if processes > 0:
+        logger.info(f"Starting {processes} extraction processes ({model_name})")
+        return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=init_extraction_worker, initargs=(model_name,))
+
+    logger.info(f"Extracting in-process ({model_name})")
+    return ThreadPoolExecutor(max_workers=1, initializer=init_extraction_worker, initargs=(model_name,))
@@ -0,0 +1,182 @@
+"""Gazetteer entity extraction for already-known concepts using an Aho-Corasick automaton."""
+
+import json
+import logging
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Iterable, Optional
+
+from .entity_extractor import EntityExtractor
+
+logger = logging.getLogger(__name__)
+
+AUTOMATON_VERSION = 1
+
+# Longest phrase (in tokens) compiled into the automaton
+MAX_PATTERN_TOKENS = 6
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+def _tokenize(text: str) -> List[str]:
+    """Case-folded word tokens used for both patterns and sentences."""
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+class GazetteerExtractor:
+    """Finds known concept terms in sentences in a single linear pass.
+
+    Patterns are compiled into a token-level Aho-Corasick automaton, so
+    matches always fall on word boundaries. Each pattern reports the term it
+    was built from (a cache key, label or alias), which resolves through the
+    Wikidata cache or the local entity index without network calls.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._terms: List[str] = []
+
+    @classmethod
+    def from_terms(cls, terms: Iterable[str]) -> 'GazetteerExtractor':
+        """Compile an automaton from surface terms."""
+        extractor = cls()
+        seen = set()
+
+        for term in terms:
+            if not term or not isinstance(term, str):
+                continue
+            term = term.strip().lower()
+            tokens = tuple(_tokenize(term))
+            if (not tokens or len(tokens) > MAX_PATTERN_TOKENS or tokens in seen or
+                    not EntityExtractor._is_valid_entity(term) or EntityExtractor._is_generic_term(term)):
+                continue
+            seen.add(tokens)
+            extractor._add_pattern(tokens, term)
+
+        extractor._build_failure_links()
+        logger.info(f"Compiled gazetteer automaton with {len(extractor._terms)} terms "
+                    f"and {len(extractor._goto)} states")
+        return extractor
+
+    @classmethod
+    def from_sources(cls, cache_manager, concept_manager=None,
+                     automaton_file: str = "concept_gazetteer.json") -> 'GazetteerExtractor':
+        """Load a serialized automaton, rebuilding it from the cache (and Neo4j) when stale."""
+        path = Path(automaton_file)
+        cache_file = cache_manager.cache_file
+
+        is_fresh = path.exists() and (
+            not cache_file.exists() or path.stat().st_mtime >= cache_file.stat().st_mtime
+        )
+        if is_fresh:
+            extractor = cls.load(path)
+            if extractor is not None:
+                return extractor
+
+        terms = []
+        for key, record in cache_manager.get_all_entries().items():
+            if record:
+                terms.append(key)
+                terms.append(record.get('label', ''))
+                terms.extend(record.get('aliases', []))
+
+        if concept_manager is not None:
+            terms.extend(concept_manager.get_concept_terms())
+
+        extractor = cls.from_terms(terms)
+        extractor.save(path)
+        return extractor
+
+    def _add_pattern(self, tokens: tuple, term: str) -> None:
+        """Insert a token sequence into the trie."""
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][token] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+
+        self._out[state].append(len(self._terms))
+        self._terms.append(term)
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        for state in queue:
+            self._fail[state] = 0
+
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+
+    def extract_entities(self, text: str) -> List[str]:
+        """Return the known terms that occur in the text (same contract as EntityExtractor)."""
+        if not text or not isinstance(text, str):
+            return []
+
+        found = set()
+        state = 0
+        for token in _tokenize(text):
+            while state and token not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(token, 0)
+            for term_index in self._out[state]:
+                found.add(self._terms[term_index])
+
+        return sorted(found)
+
+    def save(self, path) -> None:
+        """Serialize the compiled automaton as compact JSON."""
+        payload = {
+            'version': AUTOMATON_VERSION,
+            'terms': self._terms,
+            'goto': self._goto,
+            'fail': self._fail,
+            'out': self._out
+        }
+        path = Path(path)
+        try:
+            temp_file = path.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+            temp_file.replace(path)
+            logger.info(f"Saved gazetteer automaton to {path}")
+        except Exception as e:
+            logger.warning(f"Could not save gazetteer automaton: {e}")
+
+    @classmethod
+    def load(cls, path) -> Optional['GazetteerExtractor']:
+        """Reload a serialized automaton. Returns None if it is unreadable or outdated."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load gazetteer automaton: {e}")
+            return None
+
+        if payload.get('version') != AUTOMATON_VERSION:
+            return None
+
+        extractor = cls()
+        extractor._terms = payload['terms']
+        extractor._goto = payload['goto']
+        extractor._fail = payload['fail']
+        extractor._out = payload['out']
+        logger.info(f"Loaded gazetteer automaton with {len(extractor._terms)} terms from {path}")
+        return extractor
+
+    def __len__(self) -> int:
+        return len(self._terms)
@@ -1,18 +1,28 @@
 """Main orchestration for the concept extraction system."""
 
 import logging
+import os
+import queue
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Optional, List, Tuple
+from concurrent.futures import Executor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, List, Tuple
 from neo4j import GraphDatabase
 
 from .cache_manager import CacheManager
-from .entity_extractor import EntityExtractor
-from .wikidata_client import WikidataClient
+from .extraction_pool import (
+    create_extraction_executor, extract_entities_in_worker, extraction_worker_info, resident_memory_mb
+)
+from .wikidata_client import WikidataClient, WikidataEntity
+from .entity_linker import LocalEntityLinker
+from .dump_index import WikidataDumpIndex
+from .entity_memo import EntityMemoCache
 from .concept_manager import ConceptManager
 
 logger = logging.getLogger(__name__)
 
+# Uncached terms resolved per API task (wbgetentities accepts up to 50 QIDs per request)
+API_TERM_BATCH_SIZE = 50
+
 class ThreadSafeStats:
     """Thread-safe statistics collector."""
     
@@ -40,7 +50,9 @@ class ConceptExtractionSystem:
     
     def __init__(self, neo4j_uri: str, neo4j_user: str, neo4j_password: str, 
                  neo4j_database: str = "neo4j", cache_file: str = "wikidata_cache.json",
-                 max_workers: int = 4):
+                 max_workers: int = 4, wikidata_dump_index: Optional[str] = None,
+                 entity_memo_file: Optional[str] = "entity_memo.sqlite",
+                 extraction_processes: Optional[int] = None, model_name: str = "en_core_web_sm"):
         """Initialize the concept extraction system.
         
         Args:
@@ -50,11 +62,26 @@ class ConceptExtractionSystem:
             neo4j_database: Neo4j database name
             cache_file: Path to Wikidata cache file
             max_workers: Maximum number of worker threads
+            wikidata_dump_index: Path to a local dump index to use instead of the Wikidata API
+            entity_memo_file: Path to the persistent entity memo (None disables memoization)
+            extraction_processes: Number of spaCy worker processes, each loading the model
+                once (None = one per worker up to the CPU count, 0 = extract in-process)
+            model_name: spaCy model used for entity extraction
         """
         self.max_workers = max_workers
+        self.model_name = model_name
+        if extraction_processes is None:
+            extraction_processes = min(max_workers, os.cpu_count() or 1)
+        self.extraction_processes = extraction_processes
+        # Fewer workers for API calls due to rate limiting
+        self._api_workers = max(1, max_workers // 2)
+        self._extraction_worker_info: Dict[int, Dict[str, Any]] = {}
         
         # Initialize thread-safe components
         self.cache_manager = CacheManager(cache_file)
+        self.entity_memo = EntityMemoCache(entity_memo_file) if entity_memo_file else None
+        self.entity_linker = LocalEntityLinker.from_cache(self.cache_manager)
+        self.dump_index = WikidataDumpIndex(wikidata_dump_index) if wikidata_dump_index else None
         self.stats = ThreadSafeStats()
         
         # Neo4j connection with connection pooling
@@ -68,371 +95,306 @@ class ConceptExtractionSystem:
         
         # Create per-thread components
         self._wikidata_clients = {}
-        self._entity_extractors = {}
         self._lock = threading.Lock()
         
         logger.info(f"ConceptExtractionSystem initialized with {max_workers} workers")
     
-    def _get_thread_components(self) -> Tuple[EntityExtractor, WikidataClient]:
-        """Get thread-local components for current thread."""
+    def _get_wikidata_client(self) -> WikidataClient:
+        """Get the thread-local Wikidata client (without loading a spaCy model)."""
         thread_id = threading.get_ident()
         
         with self._lock:
-            if thread_id not in self._entity_extractors:
-                self._entity_extractors[thread_id] = EntityExtractor()
-                self._wikidata_clients[thread_id] = WikidataClient(self.cache_manager)
+            if thread_id not in self._wikidata_clients:
+                self._wikidata_clients[thread_id] = WikidataClient(
+                    self.cache_manager, entity_linker=self.entity_linker, dump_index=self.dump_index
+                )
         
-        return self._entity_extractors[thread_id], self._wikidata_clients[thread_id]
+        return self._wikidata_clients[thread_id]
     
     def _create_concept_with_relationship_thread_safe(self, sentence_id: str, wikidata_entity) -> bool:
         """Thread-safe concept creation using the main driver connection."""
         # Use the main driver connection which has connection pooling
         return self.concept_manager.create_concept_with_relationship(sentence_id, wikidata_entity)
     
-    def _process_sentence_batch(self, sentences_batch: List[Dict]) -> Dict[str, int]:
-        """Process a batch of sentences in a single thread."""
-        thread_id = threading.get_ident()
-        logger.debug(f"Thread {thread_id}: Starting batch of {len(sentences_batch)} sentences")
-        
-        entity_extractor, wikidata_client = self._get_thread_components()
-        
-        local_stats = {
-            'processed_sentences': 0,
-            'concepts_created': 0,
-            'entities_extracted': 0,
-            'wikidata_lookups': 0
-        }
-        
-        try:
-            for i, sentence_data in enumerate(sentences_batch):
-                sentence_id = sentence_data['sentence_id']
-                content = sentence_data['content']
-                
-                # Skip short or empty content
-                if not content or len(content.strip()) < 10:
-                    local_stats['processed_sentences'] += 1
-                    continue
-                
-                # Extract entities from sentence content
-                entities = entity_extractor.extract_entities(content)
-                local_stats['entities_extracted'] += len(entities)
-                
-                if not entities:
-                    local_stats['processed_sentences'] += 1
-                    continue
-                
-                # Try to find Wikidata match for entities (take first valid match)
-                concept_created = False
-                for entity_text in entities:
-                    local_stats['wikidata_lookups'] += 1
-                    wikidata_entity = wikidata_client.search_entity(entity_text)
-                    
-                    if wikidata_entity and wikidata_entity.qid:
-                        # Create concept and relationship
-                        if self.concept_manager.create_concept_with_relationship(sentence_id, wikidata_entity):
-                            local_stats['concepts_created'] += 1
-                            concept_created = True
-                            break  # One concept per sentence for now
-                
-                local_stats['processed_sentences'] += 1
-                
-                # Log progress every 10 sentences
-                if (i + 1) % 10 == 0:
-                    logger.debug(f"Thread {thread_id}: Processed {i + 1}/{len(sentences_batch)} sentences")
-        
-        except Exception as e:
-            logger.error(f"Thread {thread_id}: Error in batch processing: {e}")
-            raise
-        
-        logger.debug(f"Thread {thread_id}: Completed batch with stats: {local_stats}")
-        return local_stats
-    
-    def _process_single_sentence(self, sentence_data: Dict) -> Dict[str, int]:
-        """Process a single sentence in a thread."""
-        thread_id = threading.get_ident()
-        
-        local_stats = {
-            'processed_sentences': 0,
-            'concepts_created': 0,
-            'entities_extracted': 0,
-            'wikidata_lookups': 0
-        }
-        
-        try:
-            sentence_id = sentence_data['sentence_id']
-            content = sentence_data['content']
-            
-            # Skip short or empty content
-            if not content or len(content.strip()) < 10:
-                local_stats['processed_sentences'] = 1
-                return local_stats
-            
-            # Get thread-local components
-            entity_extractor, wikidata_client = self._get_thread_components()
-            
-            # Extract entities from sentence content
-            entities = entity_extractor.extract_entities(content)
-            local_stats['entities_extracted'] = len(entities)
-            
-            if not entities:
-                local_stats['processed_sentences'] = 1
-                return local_stats
-            
-            # Try to find Wikidata match for all entities (allow multiple concepts per sentence)
-            for entity_text in entities:
-                local_stats['wikidata_lookups'] += 1
-                wikidata_entity = wikidata_client.search_entity(entity_text)
-                
-                if wikidata_entity and wikidata_entity.qid:
-                    # Create concept and relationship
-                    if self.concept_manager.create_concept_with_relationship(sentence_id, wikidata_entity):
-                        local_stats['concepts_created'] += 1  # Count all concepts created
-                        # Continue processing other entities - no break
-            
-            local_stats['processed_sentences'] = 1
-            
-        except Exception as e:
-            logger.error(f"Thread {thread_id}: Error processing sentence: {e}")
-            local_stats['processed_sentences'] = 1  # Still count as processed to avoid infinite retries
-        
-        return local_stats
-    
     def process_sentences(self, batch_size: int = 50, max_sentences: Optional[int] = None, 
-                         progress_callback=None) -> Dict[str, int]:
-        """Process sentences with optimized caching strategy: cached entries first, then API calls.
+                         progress_callback=None, stream: bool = False,
+                         page_size: int = 1000) -> Dict[str, int]:
+        """Process sentences in a single extraction pass: cached entities first, then API calls.
+        
+        Entities are extracted once per sentence and grouped by entity text. Cached
+        entities are linked straight away; each remaining unique entity is resolved
+        through the API once and linked to every sentence that contains it.
         
         Args:
             batch_size: Number of sentences to process per thread batch
             max_sentences: Maximum total sentences to process (None for all)
             progress_callback: Callback function for progress updates
+            stream: Page through sentences by sentence_id instead of loading them all,
+                keeping memory bounded regardless of graph size
+            page_size: Number of sentences fetched per page in streaming mode
             
         Returns:
             Dictionary with processing statistics
         """
         logger.info("Starting optimized concept extraction process (cached entries first)...")
         
-        # Get ALL sentences without concepts at once
-        sentences = self.concept_manager.get_all_sentences_without_concepts()
-        
-        if not sentences:
-            logger.info("No sentences to process")
-            return self.stats.get_stats()
-        
-        # Apply max_sentences limit if specified
-        if max_sentences:
-            sentences = sentences[:max_sentences]
-        
-        logger.info(f"Processing {len(sentences)} sentences with optimized caching strategy...")
-        
-        # Phase 1: Process sentences with cached entities only (fast)
-        logger.info("🚀 Phase 1: Processing sentences with cached entities...")
-        cached_stats = self._process_cached_entities(sentences, progress_callback)
-        
-        # Phase 2: Process sentences that still need API calls (slower)
-        # Note: We process ALL original sentences again, but only make API calls for non-cached entities
-        logger.info("🌐 Phase 2: Processing sentences requiring API calls...")
-        api_stats = self._process_api_calls(sentences, progress_callback)
+        if stream:
+            logger.info(f"Streaming sentences in pages of {page_size}...")
+            pages = self._iter_sentence_pages(page_size, max_sentences)
+        else:
+            # Get ALL sentences without concepts at once
+            sentences = self.concept_manager.get_all_sentences_without_concepts()
+            
+            if not sentences:
+                logger.info("No sentences to process")
+                return self.stats.get_stats()
+            
+            # Apply max_sentences limit if specified
+            if max_sentences:
+                sentences = sentences[:max_sentences]
+            
+            logger.info(f"Processing {len(sentences)} sentences with optimized caching strategy...")
+            pages = [sentences]
+        
+        with create_extraction_executor(self.extraction_processes, self.model_name) as extraction_executor, \
+                ThreadPoolExecutor(max_workers=self._api_workers) as api_executor:
+            # Wait for the first worker to load the model; its memo scope keys memo lookups
+            worker_info = extraction_executor.submit(extraction_worker_info).result()
+            self._record_extraction_worker(worker_info)
+            
+            for page in pages:
+                self._process_sentence_page(page, batch_size, extraction_executor, api_executor,
+                                            worker_info['memo_scope'], progress_callback)
         
-        # Combine statistics
-        final_stats = {}
-        for key in cached_stats:
-            final_stats[key] = cached_stats[key] + api_stats.get(key, 0)
+        final_stats = self.stats.get_stats()
+        final_stats.update(self._get_extraction_worker_stats())
         
         # Add aggregated client stats
         client_stats = self._aggregate_client_stats()
         final_stats.update(client_stats)
         
+        if self.entity_memo is not None:
+            self.entity_memo.flush()
+            final_stats.update(self.entity_memo.get_stats())
+        
+        if final_stats.get('concepts_created'):
+            self.concept_manager.record_concepts_changed()
+        
         logger.info("✅ Completed optimized processing!")
         logger.info(f"Completed optimized processing. Stats: {final_stats}")
         return final_stats
     
-    def _process_cached_entities(self, sentences: List[Dict], progress_callback=None) -> Dict[str, int]:
-        """Process sentences using only cached Wikidata entities (fast phase)."""
-        logger.info("Processing cached entities phase...")
-        
-        # Use more workers for cached processing since it's fast
-        cached_workers = min(self.max_workers * 2, 16)  # More workers for cached lookups
-        
-        with ThreadPoolExecutor(max_workers=cached_workers) as executor:
-            future_to_sentence = {
-                executor.submit(self._process_single_sentence_cached_only, sentence): sentence 
-                for sentence in sentences
-            }
-            
-            completed_count = 0
-            for future in as_completed(future_to_sentence):
-                try:
-                    sentence_stats = future.result(timeout=10)  # Shorter timeout for cached
-                    
-                    # Update global statistics
-                    for key, value in sentence_stats.items():
-                        self.stats.increment(key, value)
-                    
-                    if progress_callback:
-                        progress_callback(1)
-                    
-                    completed_count += 1
-                    if completed_count % 100 == 0:
-                        percentage = (completed_count / len(sentences)) * 100
-                        logger.info(f"Cached phase: {completed_count}/{len(sentences)} ({percentage:.1f}%)")
-                        
-                except TimeoutError:
-                    sentence = future_to_sentence[future]
-                    logger.error(f"Timeout processing cached sentence: {sentence.get('sentence_id', 'unknown')}")
-                except Exception as e:
-                    sentence = future_to_sentence[future]
-                    logger.error(f"Error processing cached sentence {sentence.get('sentence_id', 'unknown')}: {e}")
+    def _process_sentence_page(self, sentences: List[Dict], batch_size: int,
+                               extraction_executor: Executor, api_executor: ThreadPoolExecutor,
+                               memo_scope: str, progress_callback=None) -> None:
+        """Extract, group and link the entities of one page of sentences."""
+        # Phase 1: extract entities once per sentence, grouped by entity text
+        logger.info(f"🔎 Extracting entities from {len(sentences)} sentences...")
+        entity_sentences: Dict[str, List[str]] = {}
+        
+        def add_entities(sentence_id: str, entities: List[str]) -> None:
+            self.stats.increment('entities_extracted', len(entities))
+            for entity_text in entities:
+                entity_sentences.setdefault(entity_text, []).append(sentence_id)
         
-        return self.stats.get_stats()
+        # Short sentences and memoized texts never reach the workers
+        to_extract = []
+        for sentence in sentences:
+            content = sentence.get('content')
+            if not content or len(content.strip()) < 10:
+                continue
+            memoized = self.entity_memo.get(memo_scope, content) if self.entity_memo is not None else None
+            if memoized is not None:
+                add_entities(sentence['sentence_id'], memoized)
+            else:
+                to_extract.append((sentence['sentence_id'], content))
+        
+        done_without_workers = len(sentences) - len(to_extract)
+        self.stats.increment('processed_sentences', done_without_workers)
+        if progress_callback and done_without_workers:
+            progress_callback(done_without_workers)
+        
+        def on_extracted(chunk: List[Tuple[str, str]], result: Tuple[Dict[str, List[str]], Dict[str, Any]]) -> None:
+            entities_by_sentence, worker_info = result
+            self._record_extraction_worker(worker_info)
+            texts = dict(chunk)
+            for sentence_id, entities in entities_by_sentence.items():
+                if self.entity_memo is not None:
+                    self.entity_memo.put(memo_scope, texts[sentence_id], entities)
+                add_entities(sentence_id, entities)
+            self.stats.increment('processed_sentences', len(chunk))
+            if progress_callback:
+                progress_callback(len(chunk))
+        
+        chunks = (to_extract[i:i + batch_size] for i in range(0, len(to_extract), batch_size))
+        self._run_bounded(extraction_executor, extract_entities_in_worker, chunks,
+                          max_in_flight=max(1, self.extraction_processes) * 2,
+                          on_result=on_extracted, phase_name="entity extraction")
+        
+        if not entity_sentences:
+            return
+        
+        # Phase 2: link entities resolvable from the cache or local index
+        logger.info(f"🚀 Linking cached entities ({len(entity_sentences)} unique entities)...")
+        wikidata_client = self._get_wikidata_client()
+        cached_links: Dict[str, Dict] = {}
+        uncached_entities = []
+        
+        for entity_text, sentence_ids in entity_sentences.items():
+            self.stats.increment('wikidata_lookups')
+            wikidata_entity = wikidata_client.search_entity_cached_only(entity_text)
+            if wikidata_entity and wikidata_entity.qid:
+                self._add_concept_links(cached_links, wikidata_entity, sentence_ids)
+            elif self.cache_manager.get_cached_concept(entity_text) is None:
+                # Not a known failure either - needs the API
+                uncached_entities.append(entity_text)
+        
+        if cached_links:
+            self.stats.increment('concepts_created',
+                                 self.concept_manager.create_concepts_batch(list(cached_links.values())))
+        
+        if not uncached_entities:
+            return
+        
+        # Phase 3: resolve each unique uncached entity once and fan out to its sentences
+        logger.info(f"🌐 Resolving {len(uncached_entities)} uncached entities via API...")
+        
+        def on_resolved(terms: List[str], resolved: Dict[str, Optional[WikidataEntity]]) -> None:
+            api_links: Dict[str, Dict] = {}
+            for entity_text, wikidata_entity in resolved.items():
+                if wikidata_entity and wikidata_entity.qid:
+                    self._add_concept_links(api_links, wikidata_entity, entity_sentences[entity_text])
+            if api_links:
+                self.stats.increment('concepts_created',
+                                     self.concept_manager.create_concepts_batch(list(api_links.values())))
+        
+        term_batches = (uncached_entities[i:i + API_TERM_BATCH_SIZE]
+                        for i in range(0, len(uncached_entities), API_TERM_BATCH_SIZE))
+        self._run_bounded(api_executor, self._resolve_entity_batch, term_batches,
+                          max_in_flight=self._api_workers * 2,
+                          on_result=on_resolved, phase_name="API resolution")
     
-    def _process_api_calls(self, sentences: List[Dict], progress_callback=None) -> Dict[str, int]:
-        """Process sentences requiring API calls (slow phase with rate limiting)."""
-        logger.info("Processing API calls phase...")
-        
-        # Use fewer workers for API calls due to rate limiting
-        api_workers = max(1, self.max_workers // 2)
-        
-        with ThreadPoolExecutor(max_workers=api_workers) as executor:
-            future_to_sentence = {
-                executor.submit(self._process_single_sentence_api_only, sentence): sentence 
-                for sentence in sentences
-            }
-            
-            completed_count = 0
-            for future in as_completed(future_to_sentence):
-                try:
-                    sentence_stats = future.result(timeout=60)  # Longer timeout for API calls
-                    
-                    # Update global statistics
-                    for key, value in sentence_stats.items():
-                        self.stats.increment(key, value)
-                    
-                    if progress_callback:
-                        progress_callback(1)
-                    
-                    completed_count += 1
-                    if completed_count % 10 == 0:
-                        percentage = (completed_count / len(sentences)) * 100
-                        logger.info(f"API phase: {completed_count}/{len(sentences)} ({percentage:.1f}%)")
-                        
-                except TimeoutError:
-                    sentence = future_to_sentence[future]
-                    logger.error(f"Timeout processing API sentence: {sentence.get('sentence_id', 'unknown')}")
-                except Exception as e:
-                    sentence = future_to_sentence[future]
-                    logger.error(f"Error processing API sentence {sentence.get('sentence_id', 'unknown')}: {e}")
-        
-        return self.stats.get_stats()
+    @staticmethod
+    def _add_concept_links(links: Dict[str, Dict], wikidata_entity: WikidataEntity,
+                           sentence_ids: Iterable[str]) -> None:
+        """Group sentence links by QID in the shape create_concepts_batch accepts."""
+        link = links.setdefault(wikidata_entity.qid, {'entity': wikidata_entity, 'sentence_ids': set()})
+        link['sentence_ids'].update(sentence_ids)
     
-    def _process_single_sentence_cached_only(self, sentence_data: Dict) -> Dict[str, int]:
-        """Process a single sentence using only cached entities (fast)."""
-        thread_id = threading.get_ident()
-        
-        local_stats = {
-            'processed_sentences': 0,
-            'concepts_created': 0,
-            'entities_extracted': 0,
-            'wikidata_lookups': 0
+    def _record_extraction_worker(self, worker_info: Dict[str, Any]) -> None:
+        """Track model load time and resident memory per extraction worker."""
+        pid = worker_info['pid']
+        if pid not in self._extraction_worker_info:
+            rss = worker_info['rss_mb']
+            logger.info(f"Extraction worker {pid}: model loaded in {worker_info['startup_seconds']:.1f}s, "
+                        f"RSS {f'{rss:.0f} MB' if rss is not None else 'unknown'}")
+        self._extraction_worker_info[pid] = worker_info
+    
+    def _get_extraction_worker_stats(self) -> Dict[str, Any]:
+        """Summarize extraction worker startup time and memory."""
+        workers = list(self._extraction_worker_info.values())
+        worker_rss = [worker['rss_mb'] for worker in workers if worker['rss_mb'] is not None]
+        main_rss = resident_memory_mb()
+        return {
+            'extraction_workers': len(workers),
+            'extraction_startup_seconds': round(max((w['startup_seconds'] for w in workers), default=0.0), 2),
+            'extraction_workers_rss_mb': round(sum(worker_rss), 1) if worker_rss else None,
+            'main_process_rss_mb': round(main_rss, 1) if main_rss is not None else None
         }
+    
+    def _resolve_entity_batch(self, terms: List[str]) -> Dict[str, Optional[WikidataEntity]]:
+        """Resolve a batch of uncached entity texts in the current thread."""
+        return self._get_wikidata_client().resolve_entities(terms)
+    
+    def _iter_sentence_pages(self, page_size: int, max_sentences: Optional[int],
+                             prefetch_pages: int = 2) -> Iterator[List[Dict]]:
+        """Yield pages of sentences fetched ahead of time by a producer thread."""
+        pages = queue.Queue(maxsize=prefetch_pages)
+        stop = threading.Event()
+        done = object()
+        
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce():
+            remaining = max_sentences
+            try:
+                for page in self.concept_manager.iter_sentence_pages_without_concepts(page_size):
+                    if remaining is not None:
+                        page = page[:remaining]
+                        remaining -= len(page)
+                    if not put(page) or remaining == 0:
+                        break
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+        
+        producer = threading.Thread(target=produce, name="sentence-page-producer", daemon=True)
+        producer.start()
         
         try:
-            sentence_id = sentence_data['sentence_id']
-            content = sentence_data['content']
-            
-            if not content or len(content.strip()) < 10:
-                local_stats['processed_sentences'] = 1
-                return local_stats
-            
-            entity_extractor, wikidata_client = self._get_thread_components()
-            entities = entity_extractor.extract_entities(content)
-            local_stats['entities_extracted'] = len(entities)
-            
-            if not entities:
-                local_stats['processed_sentences'] = 1
-                return local_stats
-            
-            # Only process entities that are cached
-            concepts_created = 0
-            for entity_text in entities:
-                local_stats['wikidata_lookups'] += 1
-                wikidata_entity = wikidata_client.search_entity_cached_only(entity_text)
-                
-                if wikidata_entity and wikidata_entity.qid:
-                    if self.concept_manager.create_concept_with_relationship(sentence_id, wikidata_entity):
-                        concepts_created += 1
-            
-            local_stats['concepts_created'] = concepts_created
-            local_stats['processed_sentences'] = 1
-            
-        except Exception as e:
-            logger.error(f"Thread {thread_id}: Error processing cached sentence: {e}")
-            local_stats['processed_sentences'] = 1
-        
-        return local_stats
+            while True:
+                item = pages.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join(timeout=5)
     
-    def _process_single_sentence_api_only(self, sentence_data: Dict) -> Dict[str, int]:
-        """Process a single sentence using API calls for non-cached entities only."""
-        thread_id = threading.get_ident()
+    def _run_bounded(self, executor: Executor, worker: Callable[[Any], Any],
+                     items: Iterable[Any], max_in_flight: int,
+                     on_result: Callable[[Any, Any], None], phase_name: str) -> int:
+        """Submit items to an executor keeping at most ``max_in_flight`` futures pending.
         
-        local_stats = {
-            'processed_sentences': 0,
-            'concepts_created': 0,
-            'entities_extracted': 0,
-            'wikidata_lookups': 0
-        }
+        ``on_result(item, result)`` is called from the submitting thread as work completes.
+        """
+        in_flight = {}
+        completed_count = 0
+        
+        def collect() -> None:
+            nonlocal completed_count
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = in_flight.pop(future)
+                try:
+                    on_result(item, future.result())
+                    completed_count += 1
+                except Exception as e:
+                    logger.error(f"Error in {phase_name}: {e}")
         
-        try:
-            sentence_id = sentence_data['sentence_id']
-            content = sentence_data['content']
-            
-            if not content or len(content.strip()) < 10:
-                local_stats['processed_sentences'] = 1
-                return local_stats
-            
-            entity_extractor, wikidata_client = self._get_thread_components()
-            entities = entity_extractor.extract_entities(content)
-            local_stats['entities_extracted'] = len(entities)
-            
-            if not entities:
-                local_stats['processed_sentences'] = 1
-                return local_stats
-            
-            # Process entities: check cache first, then API call if not cached
-            concepts_created = 0
-            for entity_text in entities:
-                local_stats['wikidata_lookups'] += 1
-                
-                # Check if entity is already cached
-                cached_entity = wikidata_client.search_entity_cached_only(entity_text)
-                if cached_entity:
-                    # Already processed in Phase 1, skip
-                    continue
-                
-                # Not cached, make API call
-                wikidata_entity = wikidata_client.search_entity(entity_text)
-                if wikidata_entity and wikidata_entity.qid:
-                    if self.concept_manager.create_concept_with_relationship(sentence_id, wikidata_entity):
-                        concepts_created += 1
-            
-            local_stats['concepts_created'] = concepts_created
-            local_stats['processed_sentences'] = 1
-            
-        except Exception as e:
-            logger.error(f"Thread {thread_id}: Error processing API-only sentence: {e}")
-            local_stats['processed_sentences'] = 1
+        for item in items:
+            if len(in_flight) >= max_in_flight:
+                collect()
+            in_flight[executor.submit(worker, item)] = item
+        
+        while in_flight:
+            collect()
         
-        return local_stats
+        logger.info(f"Completed {phase_name}: {completed_count} batches")
+        return completed_count
     
     def _aggregate_client_stats(self) -> Dict[str, int]:
         """Aggregate statistics from all Wikidata clients."""
         total_api_calls = 0
         total_cache_hits = 0
+        total_index_hits = 0
         
         with self._lock:
             for client in self._wikidata_clients.values():
                 stats = client.get_stats()
                 total_api_calls += stats['api_calls']
                 total_cache_hits += stats['cache_hits']
+                total_index_hits += stats['index_hits']
         
         total_requests = total_api_calls + total_cache_hits
         cache_hit_rate = (total_cache_hits / total_requests * 100) if total_requests > 0 else 0
@@ -440,6 +402,7 @@ class ConceptExtractionSystem:
         return {
             'api_calls': total_api_calls,
             'cache_hits': total_cache_hits,
+            'index_hits': total_index_hits,
             'cache_hit_rate': cache_hit_rate
         }
     
@@ -449,16 +412,21 @@ class ConceptExtractionSystem:
         sentences_with_concepts = self.concept_manager.get_sentences_with_concepts_count()
         cache_stats = self.cache_manager.get_stats()
         
+        memo_stats = self.entity_memo.get_stats() if self.entity_memo is not None else {}
+        
         current_stats = self.stats.get_stats()
         return {
             **current_stats,
             'total_concepts_in_db': concept_count,
             'sentences_with_concepts': sentences_with_concepts,
-            **cache_stats
+            **cache_stats,
+            **memo_stats
         }
     
     def close(self):
         """Clean up resources."""
         if hasattr(self, 'driver'):
             self.driver.close()
+        if getattr(self, 'entity_memo', None) is not None:
+            self.entity_memo.close()
         logger.info("ConceptExtractionSystem closed")
@@ -0,0 +1,180 @@
+"""Append-only progress journal for the sentence processing pipeline.
+
+Instead of rewriting the whole ``*_sentences.json`` file at every checkpoint,
+the pipeline appends status transitions as JSON lines:
+
+    {"op": "snapshot", "version": 1}
+    {"op": "sentence", "id": "<sentence_id>", "data": {...}}
+    {"op": "entities", "id": "<sentence_id>", "entities": {...}, "status": "entities_extracted"}
+    {"op": "entity_status", "entity": "<name>", "ids": [...], "status": "...", "wikidata_id": "Q..."}
+    {"op": "all_processed"}
+
+Replaying the journal rebuilds the legacy sentences structure. ``compact``
+rewrites the journal as a fresh snapshot and ``export_json`` writes the
+legacy JSON format.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_VERSION = 1
+JOURNAL_SUFFIX = '.jsonl'
+
+def _dumps(record: Dict[str, Any]) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+def _apply(sentences_data: Dict[str, Any], record: Dict[str, Any]) -> None:
+    """Apply one journal record to the sentences structure."""
+    op = record.get('op')
+
+    if op == 'snapshot':
+        sentences_data.clear()
+    elif op == 'sentence':
+        sentences_data[record['id']] = record['data']
+    elif op == 'entities':
+        sentence = sentences_data.get(record['id'])
+        if sentence is not None:
+            sentence['entities'] = record['entities']
+            sentence['status'] = record['status']
+    elif op == 'entity_status':
+        for sentence_id in record['ids']:
+            entity_data = sentences_data.get(sentence_id, {}).get('entities', {}).get(record['entity'])
+            if entity_data is not None:
+                entity_data['status'] = record['status']
+                if record.get('wikidata_id'):
+                    entity_data['wikidata_id'] = record['wikidata_id']
+    elif op == 'all_processed':
+        for sentence in sentences_data.values():
+            sentence['status'] = 'processed'
+
+def load_sentences_progress(file_path: Path) -> Dict[str, Any]:
+    """Load sentences data from a progress journal or a legacy ``*_sentences.json`` file."""
+    file_path = Path(file_path)
+    if file_path.suffix != JOURNAL_SUFFIX:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    sentences_data = {}
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # A torn final line from an interrupted run - everything before it is valid
+                logger.warning(f"Ignoring unreadable journal line {line_number} in {file_path}")
+                continue
+            _apply(sentences_data, record)
+    return sentences_data
+
+def _is_snapshot_only(file_path: Path) -> bool:
+    """Check whether a journal holds only snapshot records (i.e. it has been compacted)."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip() and not line.startswith(('{"op":"snapshot"', '{"op":"sentence"')):
+                return False
+    return True
+
+def iter_sentences_progress(file_path: Path) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (sentence_id, sentence_data) pairs from a journal or legacy JSON file.
+
+    Compacted journals are streamed line by line; journals with pending
+    transitions and legacy JSON files are loaded in full first.
+    """
+    file_path = Path(file_path)
+    if file_path.suffix != JOURNAL_SUFFIX or not _is_snapshot_only(file_path):
+        yield from load_sentences_progress(file_path).items()
+        return
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('{"op":"sentence"'):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                yield record['id'], record['data']
+
+class ProgressJournal:
+    """Append-only writer for a collection's sentence processing progress."""
+
+    def __init__(self, file_path: Path):
+        self.file_path = Path(file_path)
+        self._file = None
+
+    def start(self, sentences_data: Dict[str, Any]) -> None:
+        """Begin a new journal with a snapshot of the sentences."""
+        self.close()
+        self._write_snapshot(self.file_path, sentences_data)
+
+    def _write_snapshot(self, path: Path, sentences_data: Dict[str, Any]) -> None:
+        """Atomically write a snapshot journal."""
+        temp_file = path.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            f.write(_dumps({'op': 'snapshot', 'version': JOURNAL_VERSION}) + '\n')
+            for sentence_id, sentence_data in sentences_data.items():
+                f.write(_dumps({'op': 'sentence', 'id': sentence_id, 'data': sentence_data}) + '\n')
+        temp_file.replace(path)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        if self._file is None:
+            self._file = open(self.file_path, 'a', encoding='utf-8')
+            # Start on a fresh line if an interrupted run left a torn record behind
+            if self._file.tell() > 0:
+                with open(self.file_path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        self._file.write('\n')
+        self._file.write(_dumps(record) + '\n')
+
+    def record_entities(self, sentence_id: str, entities: Dict[str, Any], status: str) -> None:
+        """Record the entities extracted for a sentence."""
+        self._append({'op': 'entities', 'id': sentence_id, 'entities': entities, 'status': status})
+
+    def record_entity_status(self, entity_name: str, sentence_ids: Iterable[str], status: str,
+                             wikidata_id: Optional[str] = None) -> None:
+        """Record a status transition of one entity across several sentences."""
+        record = {'op': 'entity_status', 'entity': entity_name, 'ids': sorted(sentence_ids), 'status': status}
+        if wikidata_id:
+            record['wikidata_id'] = wikidata_id
+        self._append(record)
+
+    def record_all_processed(self) -> None:
+        """Record that every sentence is processed."""
+        self._append({'op': 'all_processed'})
+
+    def checkpoint(self) -> None:
+        """Make everything recorded so far durable."""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            logger.debug(f"Checkpointed progress journal: {self.file_path}")
+
+    def compact(self) -> Dict[str, Any]:
+        """Rewrite the journal as a single snapshot of the current state."""
+        self.checkpoint()
+        self.close()
+        sentences_data = load_sentences_progress(self.file_path)
+        self._write_snapshot(self.file_path, sentences_data)
+        logger.info(f"Compacted progress journal {self.file_path} ({len(sentences_data)} sentences)")
+        return sentences_data
+
+    def export_json(self, json_path: Path) -> None:
+        """Export the current state in the legacy ``*_sentences.json`` format."""
+        self.checkpoint()
+        sentences_data = load_sentences_progress(self.file_path)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(sentences_data, f, indent=2, ensure_ascii=False)
+        logger.info(f"Exported legacy sentences file: {json_path}")
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
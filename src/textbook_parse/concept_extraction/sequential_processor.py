@@ -23,6 +23,9 @@ Benefits of "null_no_api_value" Status:
 
 Example JSON Structure:
 ======================
+Progress is appended to [collection]_sentences.jsonl (see progress_journal);
+replaying the journal yields this structure:
+
 {
   "sentence_id": {
     "text": "The mitochondria is the powerhouse of the cell.",
@@ -43,26 +46,89 @@ Example JSON Structure:
 }
 """
 
-import json
 import logging
 import os
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Iterable, Iterator, Tuple
 from datetime import datetime
 
+from neo4j_utils.import_generation import bump_import_generation
+
 from .entity_extractor import EntityExtractor
 from .cache_manager import CacheManager
 from .wikidata_client import WikidataClient
-from .concept_manager import ConceptManager
+from .entity_linker import LocalEntityLinker
+from .dump_index import WikidataDumpIndex
+from .gazetteer_extractor import GazetteerExtractor
+from .entity_memo import EntityMemoCache
+from .progress_journal import ProgressJournal, load_sentences_progress, iter_sentences_progress, JOURNAL_SUFFIX
+from .concept_manager import ConceptManager, concept_merge_clause
+from ..xml_parser import clean_book_id
 from .main import ConceptExtractionSystem
 
 logger = logging.getLogger(__name__)
 
+EXTRACTION_MODES = ('spacy', 'gazetteer', 'hybrid')
+
+class EntitySentenceIndex:
+    """Inverted index from (entity status, entity name) to sentence IDs.
+    
+    Only entity instances without a wikidata_id in sentences that are not yet
+    'processed' are indexed - exactly the instances the pipeline still has to
+    work on. Status changes must go through ``move`` to keep it in sync.
+    """
+    
+    def __init__(self, sentences_data: Dict[str, Any]):
+        self._by_status: Dict[str, Dict[str, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._counts: Dict[str, int] = defaultdict(int)
+        
+        for sentence_id, sentence_data in sentences_data.items():
+            if sentence_data['status'] == 'processed':
+                continue
+            for entity_name, entity_data in sentence_data['entities'].items():
+                if not entity_data.get('wikidata_id'):
+                    self._by_status[entity_data['status']][entity_name].add(sentence_id)
+                    self._counts[entity_data['status']] += 1
+    
+    def entities(self, status: str) -> List[str]:
+        """Unique entity names that have at least one instance in the given status."""
+        return list(self._by_status[status].keys())
+    
+    def sentence_ids(self, entity_name: str, status: str) -> Set[str]:
+        """Sentence IDs whose instance of the entity is in the given status."""
+        return set(self._by_status[status].get(entity_name, ()))
+    
+    def count(self, status: str) -> int:
+        """Number of entity instances in the given status."""
+        return self._counts[status]
+    
+    def move(self, entity_name: str, sentence_ids: Set[str], old_status: str, new_status: Optional[str]) -> None:
+        """Move entity instances to a new status (None once they get a wikidata_id)."""
+        entity_sentences = self._by_status[old_status].get(entity_name)
+        if not entity_sentences:
+            return
+        
+        moved = entity_sentences & sentence_ids
+        entity_sentences -= moved
+        if not entity_sentences:
+            del self._by_status[old_status][entity_name]
+        self._counts[old_status] -= len(moved)
+        
+        if new_status is not None and moved:
+            self._by_status[new_status][entity_name].update(moved)
+            self._counts[new_status] += len(moved)
+
 class SequentialCollectionProcessor:
     """Processes textbook collections sequentially with optimized concept extraction."""
     
     def __init__(self, neo4j_uri: str, neo4j_user: str, neo4j_password: str, 
-                 neo4j_database: str = "neo4j", cache_file: str = "wikidata_cache.json", max_workers: int = 4):
+                 neo4j_database: str = "neo4j", cache_file: str = "wikidata_cache.json", max_workers: int = 4,
+                 resolve_batch_size: int = 50, wikidata_dump_index: Optional[str] = None,
+                 extraction_mode: str = "spacy", gazetteer_file: str = "concept_gazetteer.json",
+                 nlp_batch_size: int = 256, nlp_processes: int = 1,
+                 entity_memo_file: Optional[str] = "entity_memo.sqlite", concept_write_batch_size: int = 5000,
+                 export_legacy_json: bool = False):
         """Initialize the sequential processor.
         
         Args:
@@ -72,18 +138,41 @@ class SequentialCollectionProcessor:
             neo4j_database: Neo4j database name
             cache_file: Path to Wikidata cache file
             max_workers: Maximum number of workers for concept extraction
+            resolve_batch_size: Number of uncached entities resolved per Wikidata batch
+            wikidata_dump_index: Path to a local dump index to use instead of the Wikidata API
+            extraction_mode: "spacy" (full NLP), "gazetteer" (known concepts only, for re-runs)
+                or "hybrid" (gazetteer matches merged with spaCy entities for every sentence)
+            gazetteer_file: Path to the serialized gazetteer automaton
+            nlp_batch_size: Number of sentences spaCy processes per nlp.pipe batch
+            nlp_processes: Number of processes nlp.pipe uses for entity extraction
+            entity_memo_file: Path to the persistent entity memo (None disables memoization)
+            concept_write_batch_size: Number of cached (sentence, concept) links queued before a batched write
+            export_legacy_json: Also write the legacy [collection]_sentences.json file after each collection
         """
+        if extraction_mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction_mode} (expected one of {EXTRACTION_MODES})")
+        
         self.neo4j_uri = neo4j_uri
         self.neo4j_user = neo4j_user
         self.neo4j_password = neo4j_password
         self.neo4j_database = neo4j_database
         self.max_workers = max_workers
         self.cache_file = cache_file
-        
-        # Initialize components
+        self.resolve_batch_size = resolve_batch_size
+        self.extraction_mode = extraction_mode
+        self.nlp_batch_size = nlp_batch_size
+        self.nlp_processes = nlp_processes
+        self.concept_write_batch_size = concept_write_batch_size
+        self.export_legacy_json = export_legacy_json
+        
+        # Initialize components (spaCy is not loaded in gazetteer-only mode)
         self.cache_manager = CacheManager(cache_file)
-        self.entity_extractor = EntityExtractor()
-        self.wikidata_client = WikidataClient(self.cache_manager)
+        self.entity_memo = EntityMemoCache(entity_memo_file) if entity_memo_file else None
+        self.entity_extractor = EntityExtractor(memo=self.entity_memo) if extraction_mode != 'gazetteer' else None
+        self.entity_linker = LocalEntityLinker.from_cache(self.cache_manager)
+        self.dump_index = WikidataDumpIndex(wikidata_dump_index) if wikidata_dump_index else None
+        self.wikidata_client = WikidataClient(self.cache_manager, entity_linker=self.entity_linker,
+                                              dump_index=self.dump_index)
         
         # Create Neo4j driver for concept manager
         from neo4j import GraphDatabase
@@ -93,6 +182,15 @@ class SequentialCollectionProcessor:
         )
         self.concept_manager = ConceptManager(self.driver)
         
+        # Entity -> sentence index and progress journal for the collection currently being processed
+        self._entity_index = None
+        self._book_ids = {}  # collection name -> Book book_id
+        self._journal = None
+        
+        self.gazetteer = None
+        if extraction_mode != 'spacy':
+            self.gazetteer = GazetteerExtractor.from_sources(self.cache_manager, self.concept_manager, gazetteer_file)
+        
         # Statistics tracking
         self.stats = {
             'collections_processed': 0,
@@ -100,6 +198,7 @@ class SequentialCollectionProcessor:
             'entities_extracted': 0,
             'concepts_created': 0,
             'cache_hits': 0,
+            'index_hits': 0,
             'api_calls': 0
         }
         
@@ -147,6 +246,8 @@ class SequentialCollectionProcessor:
                 raise
         
         logger.info(f"🎉 All {len(collection_files)} collections processed successfully!")
+        if self.entity_memo is not None:
+            self.stats.update(self.entity_memo.get_stats())
         return self.stats
     
     def _process_single_collection_with_concepts(self, collection_name: str, force: bool = False) -> Dict[str, Any]:
@@ -160,8 +261,8 @@ class SequentialCollectionProcessor:
         """
         logger.info(f"Starting concept extraction for collection: {collection_name}")
         
-        # Create sentences file path
-        sentences_file = Path(f"{collection_name}_sentences.json")
+        # Create progress journal path
+        sentences_file = Path(f"{collection_name}_sentences{JOURNAL_SUFFIX}")
         
         # Always load sentences directly from Neo4j to ensure all sentences are processed
         logger.info(f"Loading sentences directly from Neo4j for collection: {collection_name}")
@@ -179,10 +280,12 @@ class SequentialCollectionProcessor:
                 'status': 'already_imported'
             }
         
-        # Save the sentences data to JSON file for tracking
-        self._save_sentences_file(sentences_file, sentences_data)
+        # Snapshot the sentences into the progress journal for tracking
+        journal = ProgressJournal(sentences_file)
+        journal.start(sentences_data)
         
         if not sentences_data:
+            journal.close()
             logger.info(f"No sentences found for collection: {collection_name}")
             return {
                 'sentences_processed': 0,
@@ -193,7 +296,16 @@ class SequentialCollectionProcessor:
             }
         
         # Process sentences through the pipeline
-        collection_stats = self._process_sentences_pipeline(sentences_data, collection_name, sentences_file)
+        try:
+            collection_stats = self._process_sentences_pipeline(sentences_data, collection_name, journal)
+            self.mark_concepts_imported(collection_name, collection_stats['concepts_created'])
+            if self.export_legacy_json:
+                journal.export_json(Path(f"{collection_name}_sentences.json"))
+        finally:
+            journal.close()
+            self._journal = None
+        if self.entity_memo is not None:
+            self.entity_memo.flush()
         
         logger.info(f"Collection {collection_name} concept extraction completed")
         return collection_stats
@@ -207,12 +319,10 @@ class SequentialCollectionProcessor:
         Returns:
             List of sentence dictionaries
         """
-        # Simple query to get sentences for this collection that don't have concepts
-        # All IDs now use dashes consistently
+        # Sentences carry an indexed book_id (their Book's), so this is an index seek
         query = """
-        MATCH (s:Sentence)
+        MATCH (s:Sentence {book_id: $book_id})
         WHERE s.text IS NOT NULL
-        AND s.sentence_id CONTAINS $collection_name
         AND NOT (s)-[:SENTENCE_CONTAINS_CONCEPT]->(:Concept)
         RETURN s.sentence_id as sentence_id, s.text as content
         """
@@ -228,7 +338,7 @@ class SequentialCollectionProcessor:
         
         try:
             with driver.session(database=self.neo4j_database) as session:
-                result = session.run(query, collection_name=collection_name)
+                result = session.run(query, book_id=self._resolve_book_id(collection_name))
                 
                 for record in result:
                     sentences.append({
@@ -250,12 +360,10 @@ class SequentialCollectionProcessor:
         Returns:
             Dictionary with sentence data in optimized format
         """
-        # Simple query to get ALL sentences for this collection
-        # All IDs now use dashes consistently
+        # Sentences carry an indexed book_id (their Book's), so this is an index seek
         query = """
-        MATCH (s:Sentence)
+        MATCH (s:Sentence {book_id: $book_id})
         WHERE s.text IS NOT NULL
-        AND s.sentence_id CONTAINS $collection_name
         RETURN s.sentence_id as sentence_id, s.text as text
         """
         
@@ -270,7 +378,7 @@ class SequentialCollectionProcessor:
         
         try:
             with driver.session(database=self.neo4j_database) as session:
-                result = session.run(query, collection_name=collection_name)
+                result = session.run(query, book_id=self._resolve_book_id(collection_name))
                 
                 for record in result:
                     sentence_id = record['sentence_id']
@@ -286,16 +394,23 @@ class SequentialCollectionProcessor:
         finally:
             driver.close()
         
+        if not sentences_data:
+            logger.warning(f"No sentences with book_id '{self._resolve_book_id(collection_name)}' found - databases imported before "
+                           f"book_id existed need: python scripts/setup_neo4j_schema.py --migrate-book-ids")
+        
         logger.info(f"Extracted {len(sentences_data)} sentences for collection {collection_name}")
         return sentences_data
     
-    def _process_sentences_pipeline(self, sentences_data: Dict[str, Any], collection_name: str, sentences_file: Path) -> Dict[str, Any]:
-        """Process sentences through the complete pipeline with JSON tracking.
+    def _process_sentences_pipeline(self, sentences_data: Dict[str, Any], collection_name: str, journal: ProgressJournal) -> Dict[str, Any]:
+        """Process sentences through the complete pipeline with journal tracking.
+        
+        Status transitions are appended to the journal as they happen and made
+        durable at the end of each step, so checkpoint cost follows the work done.
         
         Args:
             sentences_data: Dictionary with sentence data
             collection_name: Name of the collection
-            sentences_file: Path to the sentences JSON file
+            journal: Progress journal already started with the sentences snapshot
             
         Returns:
             Dictionary with processing statistics
@@ -305,23 +420,29 @@ class SequentialCollectionProcessor:
             'entities_extracted': 0,
             'concepts_created': 0,
             'cache_hits': 0,
+            'index_hits': 0,
             'api_calls': 0
         }
         
+        self._journal = journal
+        
         # Step 1: Extract entities for sentences that need it
         logger.info(f"Step 1: Extracting entities for {collection_name}")
         sentences_data = self._extract_entities_for_sentences(sentences_data)
         collection_stats['entities_extracted'] = sum(
             len(sentence['entities']) for sentence in sentences_data.values()
         )
-        self._save_sentences_file(sentences_file, sentences_data)
+        journal.checkpoint()
+        
+        # Build the entity -> sentence index once; later steps keep it in sync
+        self._entity_index = EntitySentenceIndex(sentences_data)
         
         # Step 2: Process cached entities
         cached_count = self._count_cached_entities(sentences_data)
         logger.info(f"Step 2: Processing {cached_count} cached entities for {collection_name}")
         cached_stats = self._process_cached_entities(sentences_data, collection_name, cached_count)
         collection_stats.update(cached_stats)
-        self._save_sentences_file(sentences_file, sentences_data)
+        journal.checkpoint()
         
         # Step 3: Process uncached entities
         uncached_count = self._count_uncached_entities(sentences_data)
@@ -329,12 +450,15 @@ class SequentialCollectionProcessor:
         api_stats = self._process_uncached_entities(sentences_data, collection_name, uncached_count)
         for key, value in api_stats.items():
             collection_stats[key] += value
-        self._save_sentences_file(sentences_file, sentences_data)
+        journal.checkpoint()
         
         # Mark all sentences as completed
         for sentence in sentences_data.values():
             sentence['status'] = 'processed'
-        self._save_sentences_file(sentences_file, sentences_data)
+        journal.record_all_processed()
+        
+        # Fold the transitions into a single snapshot for resume
+        journal.compact()
         
         collection_stats['sentences_processed'] = len(sentences_data)
         return collection_stats
@@ -348,16 +472,30 @@ class SequentialCollectionProcessor:
         Returns:
             Updated sentences data with extracted entities
         """
+        extracted = {}
+        needs_nlp = []
+        
         for sentence_id, sentence_data in sentences_data.items():
             # Skip if already processed
             if sentence_data['status'] != 'not_processed':
                 continue
-                
-            text = sentence_data['text']
-            
-            # Extract entities using spaCy
-            entities = self.entity_extractor.extract_entities(text)
             
+            # Gazetteer matches for already-known concepts
+            extracted[sentence_id] = self.gazetteer.extract_entities(sentence_data['text']) if self.gazetteer else []
+            if self.entity_extractor:
+                needs_nlp.append((sentence_id, sentence_data['text']))
+        
+        # spaCy sees every sentence (gazetteer matches never hide novel concepts); hybrid merges both
+        if needs_nlp:
+            logger.info(f"Running spaCy on {len(needs_nlp)} sentences "
+                        f"(batch size {self.nlp_batch_size}, {self.nlp_processes} process(es))")
+            nlp_entities = self.entity_extractor.extract_entities_batch(
+                needs_nlp, batch_size=self.nlp_batch_size, n_process=self.nlp_processes
+            )
+            for sentence_id, entities in nlp_entities.items():
+                extracted[sentence_id] = list(dict.fromkeys(extracted[sentence_id] + list(entities)))
+        
+        for sentence_id, entities in extracted.items():
             # Convert to optimized dictionary format
             entities_dict = {}
             for entity in entities:
@@ -365,13 +503,15 @@ class SequentialCollectionProcessor:
                     'status': 'not_processed'
                 }
             
+            sentence_data = sentences_data[sentence_id]
             sentence_data['entities'] = entities_dict
             sentence_data['status'] = 'entities_extracted'
+            self._journal.record_entities(sentence_id, entities_dict, 'entities_extracted')
         
         return sentences_data
     
     def _process_cached_entities(self, sentences_data: Dict[str, Any], collection_name: str, total_count: int) -> Dict[str, int]:
-        """Process entities that are found in cache and write to Neo4j immediately.
+        """Process entities that are found in cache and write them to Neo4j in batches.
         
         This method only processes entities with 'not_processed' status that don't already have wikidata_id.
         It handles three scenarios:
@@ -393,57 +533,78 @@ class SequentialCollectionProcessor:
         }
         
         processed_count = 0
+        entity_index = self._entity_index
+        pending_links = []
+        pending_count = 0
         
-        for sentence_id, sentence_data in sentences_data.items():
-            # Skip if already processed
-            if sentence_data['status'] == 'processed':
-                continue
-                
-            entities = sentence_data['entities']
+        # Each unique entity is looked up once, then applied to all its sentences
+        for entity_name in entity_index.entities('not_processed'):
+            sentence_ids = entity_index.sentence_ids(entity_name, 'not_processed')
             
-            for entity_name, entity_data in entities.items():
-                # Skip entities that already have wikidata_id (already processed)
-                if entity_data.get('wikidata_id'):
-                    continue
-                    
-                # Only process entities that are in 'not_processed' status
-                if entity_data['status'] != 'not_processed':
-                    continue
-                    
-                # Check cache for both data and null entries
-                cached_data = self.cache_manager.get_cached_concept(entity_name)
+            # Check cache for both data and null entries
+            cached_data = self.cache_manager.get_cached_concept(entity_name)
+            
+            if cached_data is not None:
+                # Entity found in cache
+                if cached_data:
+                    # Found in cache with data
+                    new_status = 'cache_hit'
+                    cached_entity = self.wikidata_client._create_entity_from_cache(cached_data)
+                else:
+                    # Found in cache but null (already failed lookup)
+                    new_status = 'null_no_api_value'
+                    logger.debug(f"Entity '{entity_name}' found in cache with null value (already failed lookup)")
+            else:
+                # Not found in cache, mark for API lookup
+                new_status = 'needs_api_lookup'
+            
+            for sentence_id in sentence_ids:
+                entity_data = sentences_data[sentence_id]['entities'][entity_name]
+                entity_data['status'] = new_status
                 processed_count += 1
                 
-                # Log progress every 100 entities
+                # Log progress every 1000 entities
                 if processed_count % 1000 == 0:
                     percentage = (processed_count / total_count * 100) if total_count > 0 else 0
                     logger.info(f"  Processed {processed_count}/{total_count} entities ({percentage:.1f}%)")
                 
-                if cached_data is not None:
-                    # Entity found in cache
-                    if cached_data:
-                        # Found in cache with data
-                        entity_data['status'] = 'cache_hit'
-                        entity_data['wikidata_id'] = cached_data['qid']
-                        stats['cache_hits'] += 1
-                        
-                        # Create WikidataEntity object for Neo4j
-                        cached_entity = self.wikidata_client._create_entity_from_cache(cached_data)
-                        
-                        # Write to Neo4j immediately
-                        if self.concept_manager.create_concept_with_relationship(sentence_id, cached_entity):
-                            stats['concepts_created'] += 1
-                    else:
-                        # Found in cache but null (already failed lookup)
-                        entity_data['status'] = 'null_no_api_value'
-                        logger.debug(f"Entity '{entity_name}' found in cache with null value (already failed lookup)")
-                else:
-                    # Not found in cache, mark for API lookup
-                    entity_data['status'] = 'needs_api_lookup'
+                if new_status == 'cache_hit':
+                    entity_data['wikidata_id'] = cached_data['qid']
+                    stats['cache_hits'] += 1
+            
+            entity_index.move(entity_name, sentence_ids, 'not_processed',
+                              None if new_status == 'cache_hit' else new_status)
+            self._journal.record_entity_status(entity_name, sentence_ids, new_status,
+                                               cached_data['qid'] if new_status == 'cache_hit' else None)
+            
+            # Queue the links and write them to Neo4j in chunked batches
+            if new_status == 'cache_hit':
+                pending_links.append({'entity': cached_entity, 'sentence_ids': sentence_ids})
+                pending_count += len(sentence_ids)
+                if pending_count >= self.concept_write_batch_size:
+                    stats['concepts_created'] += self._write_concept_links(pending_links, pending_count)
+                    pending_links, pending_count = [], 0
+        
+        if pending_links:
+            stats['concepts_created'] += self._write_concept_links(pending_links, pending_count)
         
         logger.info(f"Cache processing: {stats['cache_hits']} hits, {stats['concepts_created']} concepts created")
         return stats
     
+    def _write_concept_links(self, concept_links: List[Dict], link_count: int) -> int:
+        """Write queued (sentence, concept) links and report progress.
+        
+        Args:
+            concept_links: Concept groups as accepted by ConceptManager.create_concepts_batch
+            link_count: Total number of sentence links in the groups
+            
+        Returns:
+            Number of links written
+        """
+        written = self.concept_manager.create_concepts_batch(concept_links)
+        logger.info(f"  Wrote {written}/{link_count} cached concept links for {len(concept_links)} concepts")
+        return written
+    
     def _process_uncached_entities(self, sentences_data: Dict[str, Any], collection_name: str, total_count: int) -> Dict[str, int]:
         """Process entities with deduplication - single API call per unique entity.
         
@@ -461,6 +622,7 @@ class SequentialCollectionProcessor:
         stats = {
             'concepts_created': 0,
             'cache_hits': 0,
+            'index_hits': 0,
             'api_calls': 0
         }
         
@@ -469,31 +631,39 @@ class SequentialCollectionProcessor:
         logger.info(f"Found {len(unique_entities)} unique entities for API processing")
         
         processed_count = 0
+        client_stats_before = self.wikidata_client.get_stats()
+        unique_entities = sorted(unique_entities)
         
-        # Step 2: Process each unique entity once
-        for entity_name in unique_entities:
-            # Make single API call
-            wikidata_entity = self.wikidata_client.search_entity(entity_name)
-            stats['api_calls'] += 1
-            processed_count += 1
+        # Step 2: Resolve unique entities in batches (search + batched wbgetentities)
+        for start in range(0, len(unique_entities), self.resolve_batch_size):
+            entity_batch = unique_entities[start:start + self.resolve_batch_size]
+            resolved = self.wikidata_client.resolve_entities(entity_batch)
             
-            # Log progress
-            if processed_count % 100 == 0:
-                percentage = (processed_count / len(unique_entities) * 100)
-                logger.info(f"  Processed {processed_count}/{len(unique_entities)} unique entities ({percentage:.1f}%)")
+            for entity_name in entity_batch:
+                wikidata_entity = resolved.get(entity_name)
+                processed_count += 1
+                
+                # Step 3: Update ALL sentences containing this entity
+                if wikidata_entity:
+                    # Update all sentences with this entity
+                    updated_sentences = self._update_all_sentences_with_entity(
+                        sentences_data, entity_name, wikidata_entity
+                    )
+                    stats['concepts_created'] += updated_sentences
+                else:
+                    # Mark all instances as failed
+                    self._mark_all_entity_instances_failed(sentences_data, entity_name)
             
-            # Step 3: Update ALL sentences containing this entity
-            if wikidata_entity:
-                # Update all sentences with this entity
-                updated_sentences = self._update_all_sentences_with_entity(
-                    sentences_data, entity_name, wikidata_entity
-                )
-                stats['concepts_created'] += updated_sentences
-            else:
-                # Mark all instances as failed
-                self._mark_all_entity_instances_failed(sentences_data, entity_name)
+            # Log progress
+            percentage = (processed_count / len(unique_entities) * 100)
+            logger.info(f"  Processed {processed_count}/{len(unique_entities)} unique entities ({percentage:.1f}%)")
         
-        logger.info(f"API processing: {stats['api_calls']} calls, {stats['concepts_created']} concepts created")
+        client_stats_after = self.wikidata_client.get_stats()
+        stats['api_calls'] = client_stats_after['api_calls'] - client_stats_before['api_calls']
+        stats['index_hits'] = client_stats_after['index_hits'] - client_stats_before['index_hits']
+        
+        logger.info(f"API processing: {stats['api_calls']} calls, {stats['index_hits']} local index hits, "
+                    f"{stats['concepts_created']} concepts created")
         return stats
     
     def _collect_unique_uncached_entities(self, sentences_data: Dict[str, Any]) -> set:
@@ -505,20 +675,7 @@ class SequentialCollectionProcessor:
         Returns:
             Set of unique entity names that need API lookup
         """
-        unique_entities = set()
-        
-        for sentence_data in sentences_data.values():
-            if sentence_data['status'] == 'processed':
-                continue
-                
-            entities = sentence_data['entities']
-            for entity_name, entity_data in entities.items():
-                # Only collect entities that need API lookup
-                if (entity_data['status'] == 'needs_api_lookup' and 
-                    not entity_data.get('wikidata_id')):
-                    unique_entities.add(entity_name)
-        
-        return unique_entities
+        return set(self._entity_index.entities('needs_api_lookup'))
     
     def _update_all_sentences_with_entity(self, sentences_data: Dict[str, Any], 
                                         entity_name: str, wikidata_entity) -> int:
@@ -532,26 +689,17 @@ class SequentialCollectionProcessor:
         Returns:
             Number of sentences updated
         """
-        sentence_ids_to_update = []
+        # Step 1: Find all sentences whose instance still needs API lookup
+        sentence_ids = self._entity_index.sentence_ids(entity_name, 'needs_api_lookup')
+        sentence_ids_to_update = sorted(sentence_ids)
         
-        # Step 1: Find all sentences containing this entity
-        for sentence_id, sentence_data in sentences_data.items():
-            if sentence_data['status'] == 'processed':
-                continue
-                
-            entities = sentence_data['entities']
-            if entity_name in entities:
-                entity_data = entities[entity_name]
-                
-                # Only update if still needs API lookup
-                if (entity_data['status'] == 'needs_api_lookup' and 
-                    not entity_data.get('wikidata_id')):
-                    
-                    # Update entity data
-                    entity_data['status'] = 'api_lookup_complete'
-                    entity_data['wikidata_id'] = wikidata_entity.qid
-                    
-                    sentence_ids_to_update.append(sentence_id)
+        for sentence_id in sentence_ids_to_update:
+            entity_data = sentences_data[sentence_id]['entities'][entity_name]
+            entity_data['status'] = 'api_lookup_complete'
+            entity_data['wikidata_id'] = wikidata_entity.qid
+        
+        self._entity_index.move(entity_name, sentence_ids, 'needs_api_lookup', None)
+        self._journal.record_entity_status(entity_name, sentence_ids, 'api_lookup_complete', wikidata_entity.qid)
         
         # Step 2: Batch commit to database
         if sentence_ids_to_update:
@@ -573,30 +721,14 @@ class SequentialCollectionProcessor:
             return 0
         
         # Use a single transaction for all sentences
-        query = """
+        query = f"""
         // Create or merge the concept node once
-        MERGE (c:Concept {wikidata_id: $wikidata_id})
-        ON CREATE SET 
-            c.name = $name,
-            c.wikidata_name = $wikidata_name,
-            c.label = $label,
-            c.description = $description,
-            c.aliases = $aliases,
-            c.wikidata_url = $wikidata_url,
-            c.created_at = datetime()
-        ON MATCH SET
-            c.name = $name,
-            c.wikidata_name = $wikidata_name,
-            c.label = $label,
-            c.description = $description,
-            c.aliases = $aliases,
-            c.wikidata_url = $wikidata_url,
-            c.updated_at = datetime()
+        {concept_merge_clause('$concept')}
         
         // Create relationships for all sentences at once
         WITH c
         UNWIND $sentence_ids as sentence_id
-        MATCH (s:Sentence {sentence_id: sentence_id})
+        MATCH (s:Sentence {{sentence_id: sentence_id}})
         
         // Create bidirectional relationships
         MERGE (s)-[r1:SENTENCE_CONTAINS_CONCEPT]->(c)
@@ -611,13 +743,13 @@ class SequentialCollectionProcessor:
         try:
             with self.driver.session(database=self.neo4j_database) as session:
                 result = session.run(query, {
-                    'wikidata_id': wikidata_entity.qid,
-                    'name': wikidata_entity.label,
-                    'wikidata_name': wikidata_entity.label,
-                    'label': wikidata_entity.label,
-                    'description': wikidata_entity.description,
-                    'aliases': wikidata_entity.aliases,
-                    'wikidata_url': wikidata_entity.wikidata_url,
+                    'concept': {
+                        'wikidata_id': wikidata_entity.qid,
+                        'name': wikidata_entity.label,
+                        'description': wikidata_entity.description,
+                        'aliases': wikidata_entity.aliases,
+                        'wikidata_url': wikidata_entity.wikidata_url
+                    },
                     'sentence_ids': sentence_ids
                 })
                 
@@ -635,18 +767,13 @@ class SequentialCollectionProcessor:
             sentences_data: Dictionary with sentence data
             entity_name: Name of the entity that failed lookup
         """
-        for sentence_data in sentences_data.values():
-            if sentence_data['status'] == 'processed':
-                continue
-                
-            entities = sentence_data['entities']
-            if entity_name in entities:
-                entity_data = entities[entity_name]
-                
-                # Only update if still needs API lookup
-                if (entity_data['status'] == 'needs_api_lookup' and 
-                    not entity_data.get('wikidata_id')):
-                    entity_data['status'] = 'api_lookup_failed'
+        sentence_ids = self._entity_index.sentence_ids(entity_name, 'needs_api_lookup')
+        
+        for sentence_id in sentence_ids:
+            sentences_data[sentence_id]['entities'][entity_name]['status'] = 'api_lookup_failed'
+        
+        self._entity_index.move(entity_name, sentence_ids, 'needs_api_lookup', 'api_lookup_failed')
+        self._journal.record_entity_status(entity_name, sentence_ids, 'api_lookup_failed')
     
     def _count_uncached_entities(self, sentences_data: Dict[str, Any]) -> int:
         """Count entities that need API lookup (only needs_api_lookup status without wikidata_id).
@@ -657,21 +784,8 @@ class SequentialCollectionProcessor:
         Returns:
             Number of uncached entities that need API lookup
         """
-        uncached_count = 0
-        
-        for sentence_id, sentence_data in sentences_data.items():
-            # Skip if already processed
-            if sentence_data['status'] == 'processed':
-                continue
-                
-            entities = sentence_data['entities']
-            
-            for entity_name, entity_data in entities.items():
-                # Only count entities that need API lookup (exclude null cache entries and already processed)
-                if entity_data['status'] == 'needs_api_lookup' and not entity_data.get('wikidata_id'):
-                    uncached_count += 1
-        
-        return uncached_count
+        # Only entities that need API lookup (exclude null cache entries and already processed)
+        return self._entity_index.count('needs_api_lookup')
     
     def _count_cached_entities(self, sentences_data: Dict[str, Any]) -> int:
         """Count entities that will be checked for cache (only not_processed entities without wikidata_id).
@@ -682,39 +796,11 @@ class SequentialCollectionProcessor:
         Returns:
             Number of entities to check for cache
         """
-        cached_count = 0
-        
-        for sentence_id, sentence_data in sentences_data.items():
-            # Skip if already processed
-            if sentence_data['status'] == 'processed':
-                continue
-                
-            entities = sentence_data['entities']
-            
-            for entity_name, entity_data in entities.items():
-                # Only count entities that need processing (not_processed status and no wikidata_id)
-                if entity_data['status'] == 'not_processed' and not entity_data.get('wikidata_id'):
-                    cached_count += 1
-        
-        return cached_count
-    
-    def _save_sentences_file(self, file_path: Path, sentences_data: Dict[str, Any]) -> None:
-        """Save sentences data to JSON file.
-        
-        Args:
-            file_path: Path to save the file
-            sentences_data: Dictionary with sentence data
-        """
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(sentences_data, f, indent=2, ensure_ascii=False)
-            logger.debug(f"Saved sentences file: {file_path}")
-        except Exception as e:
-            logger.error(f"Error saving sentences file {file_path}: {e}")
-            raise
+        # Only entities that need processing (not_processed status and no wikidata_id)
+        return self._entity_index.count('not_processed')
     
     def _load_sentences_file(self, file_path: Path) -> Dict[str, Any]:
-        """Load sentences data from JSON file.
+        """Load sentences data from a progress journal or legacy JSON file.
         
         Args:
             file_path: Path to the file
@@ -723,50 +809,110 @@ class SequentialCollectionProcessor:
             Dictionary with sentence data
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return load_sentences_progress(file_path)
         except Exception as e:
             logger.error(f"Error loading sentences file {file_path}: {e}")
             raise
     
+    def _resolve_book_id(self, collection_name: str) -> str:
+        """Map a collection name (file name minus .collection) to its Book's book_id.
+        
+        Books are keyed by the collection slug, which usually but not always
+        equals the file name. Like the namespaced node IDs, the match goes
+        through clean_book_id; a collection whose name only appears inside a
+        single Book's namespace also resolves (the old sentence_id CONTAINS
+        behaviour).
+        
+        Args:
+            collection_name: Name of the collection
+            
+        Returns:
+            The Book's book_id (collection_name itself if no Book matches)
+        """
+        if collection_name not in self._book_ids:
+            with self.driver.session(database=self.neo4j_database) as session:
+                book_ids = [record['book_id'] for record in session.run("MATCH (b:Book) RETURN b.book_id AS book_id")
+                            if record['book_id'] is not None]
+            
+            matches = ([book_id for book_id in book_ids if book_id == collection_name] or
+                       [book_id for book_id in book_ids if clean_book_id(book_id) == collection_name])
+            if not matches:
+                containing = [book_id for book_id in book_ids if collection_name in clean_book_id(book_id)]
+                matches = containing if len(containing) == 1 else []
+            
+            if matches:
+                if matches[0] != collection_name:
+                    logger.info(f"Collection {collection_name} is Book {matches[0]}")
+                self._book_ids[collection_name] = matches[0]
+            else:
+                logger.warning(f"No Book found for collection {collection_name}, using it as book_id")
+                self._book_ids[collection_name] = collection_name
+        
+        return self._book_ids[collection_name]
+    
     def _check_concepts_imported(self, collection_name: str) -> bool:
         """Check if concepts are already imported for a collection.
         
+        The state is stored on the Book node (concepts_imported) when extraction
+        completes, so this is a single index lookup. Books imported before the
+        state existed are probed once via the book_id index and then recorded.
+        
         Args:
             collection_name: Name of the collection
             
         Returns:
             True if concepts are already imported, False otherwise
         """
-        # Query to check if any sentences in this collection have concepts
-        query = """
-        MATCH (b:Book {book_id: $collection_name})-[*1..5]->(s:Sentence)
-        WHERE s.text IS NOT NULL 
-        AND (s)-[:SENTENCE_CONTAINS_CONCEPT]->(:Concept)
-        RETURN count(s) as concept_count
+        state_query = """
+        MATCH (b:Book {book_id: $book_id})
+        RETURN b.concepts_imported as concepts_imported
+        """
+        
+        legacy_query = """
+        MATCH (s:Sentence {book_id: $book_id})
+        WHERE (s)-[:SENTENCE_CONTAINS_CONCEPT]->(:Concept)
+        RETURN s.sentence_id as sentence_id
         LIMIT 1
         """
         
-        # Create a temporary driver connection
-        from neo4j import GraphDatabase
-        driver = GraphDatabase.driver(
-            self.neo4j_uri, 
-            auth=(self.neo4j_user, self.neo4j_password)
-        )
+        book_id = self._resolve_book_id(collection_name)
+        with self.driver.session(database=self.neo4j_database) as session:
+            record = session.run(state_query, book_id=book_id).single()
+            concepts_imported = record['concepts_imported'] if record else None
+            
+            if concepts_imported is None:
+                concepts_imported = session.run(legacy_query, book_id=book_id).single() is not None
+                if concepts_imported:
+                    self.mark_concepts_imported(collection_name)
+        
+        if concepts_imported:
+            logger.info(f"Concepts already imported for collection {collection_name}")
+        else:
+            logger.info(f"No concepts found for collection {collection_name}")
+        return bool(concepts_imported)
+    
+    def mark_concepts_imported(self, collection_name: str, concepts_created: Optional[int] = None) -> None:
+        """Record on the Book node that concept extraction completed for a collection.
         
-        try:
-            with driver.session(database=self.neo4j_database) as session:
-                result = session.run(query, collection_name=collection_name)
-                record = result.single()
-                
-                if record and record['concept_count'] > 0:
-                    logger.info(f"Found {record['concept_count']} sentences with concepts for collection {collection_name}")
-                    return True
-                else:
-                    logger.info(f"No concepts found for collection {collection_name}")
-                    return False
-        finally:
-            driver.close()
+        Also bumps the import generation, since the new concept links change
+        the hierarchies readers may have cached.
+        
+        Args:
+            collection_name: Name of the collection
+            concepts_created: Number of concept links written by the run, if known
+        """
+        query = """
+        MATCH (b:Book {book_id: $book_id})
+        SET b.concepts_imported = true,
+            b.concepts_imported_at = datetime(),
+            b.concepts_created = coalesce($concepts_created, b.concepts_created)
+        """
+        
+        with self.driver.session(database=self.neo4j_database) as session:
+            session.run(query, book_id=self._resolve_book_id(collection_name),
+                        concepts_created=concepts_created).consume()
+            bump_import_generation(session)
+        logger.info(f"Recorded concepts as imported for collection {collection_name}")
     
     def _can_import_from_json(self, sentences_data: Dict[str, Any]) -> bool:
         """Check if we can import concepts from JSON file (entities have wikidata_id).
@@ -808,76 +954,90 @@ class SequentialCollectionProcessor:
         Returns:
             Dictionary with import statistics
         """
+        logger.info(f"Importing concepts from JSON for collection: {collection_name}")
+        
+        import_stats = self._bulk_import_concepts(sentences_data.items(), force=force)
         stats = {
-            'sentences_processed': 0,
-            'entities_extracted': 0,
-            'concepts_created': 0,
-            'cache_hits': 0,
+            'sentences_processed': import_stats['sentences_processed'],
+            'entities_extracted': sum(len(sentence.get('entities', {})) for sentence in sentences_data.values()),
+            'concepts_created': import_stats['concepts_imported'],
+            'cache_hits': 0,  # A JSON import does no cache lookups
             'api_calls': 0
         }
         
-        logger.info(f"Importing concepts from JSON for collection: {collection_name}")
+        logger.info(f"JSON import completed: {stats['concepts_created']} concepts created for {stats['sentences_processed']} sentences")
+        return stats
+    
+    def _bulk_import_concepts(self, sentences: Iterable[Tuple[str, Dict[str, Any]]], force: bool = False,
+                              chunk_size: int = 5000) -> Dict[str, int]:
+        """Write the concept links recorded for sentences in chunked UNWIND batches.
         
-        try:
-            with self.driver.session(database=self.neo4j_database) as session:
-                for json_sentence_id, sentence_data in sentences_data.items():
-                    entities = sentence_data.get('entities', {})
-                    stats['entities_extracted'] += len(entities)
-                    
-                    # Use the sentence_id directly from the JSON file
-                    actual_sentence_id = json_sentence_id
-                    
-                    # Verify the sentence exists in the database
-                    verify_sentence_query = """
-                    MATCH (s:Sentence {sentence_id: $sentence_id})
-                    RETURN s.sentence_id as sentence_id
-                    LIMIT 1
-                    """
-                    
-                    result = session.run(verify_sentence_query, sentence_id=actual_sentence_id)
-                    record = result.single()
-                    
-                    if not record:
-                        logger.warning(f"Could not find sentence in database with ID: {actual_sentence_id}")
-                        # Track this as a failed sentence lookup
-                        stats['sentences_processed'] += 1
-                        continue
-                    
-                    # Process each entity with a Wikidata ID
-                    for entity_name, entity_data in entities.items():
-                        if entity_data.get('wikidata_id'):
-                            wikidata_id = entity_data['wikidata_id']
-                            
-                            # Get cached data for the entity
-                            cached_data = self.cache_manager.get_cached_concept(entity_name)
-                            if cached_data:
-                                # Create WikidataEntity object
-                                wikidata_entity = self.wikidata_client._create_entity_from_cache(cached_data)
-                                
-                                # Create concept and relationship using actual sentence_id
-                                if force:
-                                    # Force create/update concept with all expected fields
-                                    if self._force_create_concept_with_relationship(actual_sentence_id, entity_name, entity_data, wikidata_entity):
-                                        stats['concepts_created'] += 1
-                                        stats['cache_hits'] += 1
-                                else:
-                                    # Normal concept creation
-                                    if self.concept_manager.create_concept_with_relationship(actual_sentence_id, wikidata_entity):
-                                        stats['concepts_created'] += 1
-                                        stats['cache_hits'] += 1
-                    
-                    stats['sentences_processed'] += 1
-                    
-                    # Progress update
-                    if stats['sentences_processed'] % 1000 == 0:
-                        logger.info(f"  Processed {stats['sentences_processed']} sentences, created {stats['concepts_created']} concepts")
+        Args:
+            sentences: Iterable of (sentence_id, sentence_data) pairs (consumed lazily)
+            force: Also refresh relationships that already exist
+            chunk_size: Number of links written per transaction
             
-            logger.info(f"JSON import completed: {stats['concepts_created']} concepts created for {stats['sentences_processed']} sentences")
-            return stats
+        Returns:
+            Dictionary with import statistics
+        """
+        stats = {
+            'sentences_processed': 0,
+            'concepts_imported': 0,
+            'relationships_created': 0,
+            'missing_sentences': 0
+        }
+        
+        link_stats = self.concept_manager.import_concept_links(
+            self._concept_link_rows(sentences, stats), chunk_size=chunk_size, touch_existing=force
+        )
+        stats['concepts_imported'] = link_stats['links_created']
+        stats['relationships_created'] = link_stats['links_created'] * 2  # Bidirectional
+        
+        missing = link_stats['missing_sentence_ids']
+        stats['missing_sentences'] = len(missing)
+        if missing:
+            logger.warning(f"{len(missing)} sentences were not found in the database and were skipped "
+                           f"(e.g. {', '.join(missing[:5])})")
+        
+        return stats
+    
+    def _concept_link_rows(self, sentences: Iterable[Tuple[str, Dict[str, Any]]],
+                           stats: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+        """Flatten sentences into (sentence_id, concept properties) rows.
+        
+        Concept properties come from the Wikidata cache when it agrees on the QID,
+        otherwise from the entity name. Each entity is looked up once per import.
+        """
+        concept_props = {}
+        
+        for sentence_id, sentence_data in sentences:
+            stats['sentences_processed'] += 1
             
-        except Exception as e:
-            logger.error(f"Error importing concepts from JSON for collection {collection_name}: {e}")
-            raise
+            for entity_name, entity_data in sentence_data.get('entities', {}).items():
+                wikidata_id = entity_data.get('wikidata_id')
+                if not wikidata_id:
+                    continue
+                
+                props = concept_props.get((entity_name, wikidata_id))
+                if props is None:
+                    cached_data = self.cache_manager.get_cached_concept(entity_name)
+                    if cached_data and cached_data.get('qid') == wikidata_id:
+                        props = {
+                            'name': cached_data.get('label', entity_name),
+                            'description': cached_data.get('description', ''),
+                            'aliases': cached_data.get('aliases', [])
+                        }
+                    else:
+                        props = {
+                            'name': entity_name,
+                            'description': entity_data.get('description', ''),
+                            'aliases': entity_data.get('aliases', [])
+                        }
+                    props['wikidata_id'] = wikidata_id
+                    props['wikidata_url'] = f"https://www.wikidata.org/wiki/{wikidata_id}"
+                    concept_props[(entity_name, wikidata_id)] = props
+                
+                yield dict(props, sentence_id=sentence_id)
     
     def _update_global_stats(self, collection_stats: Dict[str, int]) -> None:
         """Update global statistics with collection statistics.
@@ -899,96 +1059,27 @@ class SequentialCollectionProcessor:
         client_stats = self.wikidata_client.get_stats()
         self.stats.update(client_stats)
         
+        if self.entity_memo is not None:
+            self.stats.update(self.entity_memo.get_stats())
+        
         return self.stats.copy()
     
-    def import_concepts_from_sentence_file(self, sentences_file: Path) -> Dict[str, int]:
+    def import_concepts_from_sentence_file(self, sentences_file: Path, force: bool = False) -> Dict[str, int]:
         """Import concepts from a sentence file into the database.
         
+        The file is streamed and written in chunked batches; sentences missing
+        from the database are skipped and reported in aggregate.
+        
         Args:
-            sentences_file: Path to the sentence file containing extracted concepts
+            sentences_file: Path to the sentence file (progress journal or legacy JSON)
+            force: Also refresh relationships that already exist
             
         Returns:
             Dictionary with import statistics
         """
-        stats = {
-            'sentences_processed': 0,
-            'concepts_imported': 0,
-            'relationships_created': 0
-        }
-        
         try:
-            # Load sentences data
-            with open(sentences_file, 'r', encoding='utf-8') as f:
-                sentences_data = json.load(f)
-            
             logger.info(f"Importing concepts from {sentences_file}")
-            
-            with self.driver.session(database=self.neo4j_database) as session:
-                for sentence_id, sentence_data in sentences_data.items():
-                    entities = sentence_data.get('entities', {})
-                    
-                    if entities:
-                        # Process each entity with a Wikidata ID
-                        for entity_name, entity_data in entities.items():
-                            if entity_data.get('wikidata_id'):
-                                wikidata_id = entity_data['wikidata_id']
-                                
-                                # Use atomic transaction to create concept and relationships together
-                                atomic_query = """
-                                // First, verify the sentence exists
-                                MATCH (s:Sentence {sentence_id: $sentence_id})
-                                
-                                // Only proceed if sentence exists
-                                WITH s
-                                
-                                // Create or merge the concept node (use wikidata_id as unique identifier)
-                                MERGE (c:Concept {wikidata_id: $wikidata_id})
-                                ON CREATE SET 
-                                    c.name = $name,
-                                    c.wikidata_name = $name,
-                                    c.label = $name,
-                                    c.description = $description,
-                                    c.aliases = $aliases,
-                                    c.wikidata_url = $wikidata_url,
-                                    c.created_at = datetime()
-                                ON MATCH SET
-                                    c.name = $name,
-                                    c.wikidata_name = $name,
-                                    c.label = $name,
-                                    c.description = $description,
-                                    c.aliases = $aliases,
-                                    c.wikidata_url = $wikidata_url,
-                                    c.updated_at = datetime()
-                                
-                                // Create bidirectional relationships
-                                MERGE (s)-[r1:SENTENCE_CONTAINS_CONCEPT]->(c)
-                                ON CREATE SET r1.created_at = datetime()
-                                
-                                MERGE (c)-[r2:CONCEPT_BELONGS_TO_SENTENCE]->(s)
-                                ON CREATE SET r2.created_at = datetime()
-                                
-                                RETURN c.wikidata_id as created_concept_id
-                                """
-                                
-                                result = session.run(atomic_query, {
-                                    'sentence_id': sentence_id,
-                                    'name': entity_name,
-                                    'wikidata_id': wikidata_id,
-                                    'description': entity_data.get('description', ''),
-                                    'aliases': entity_data.get('aliases', []),
-                                    'wikidata_url': f"https://www.wikidata.org/wiki/{wikidata_id}"
-                                })
-                                
-                                record = result.single()
-                                if record:
-                                    stats['concepts_imported'] += 1
-                                    stats['relationships_created'] += 2  # Bidirectional
-                    
-                    stats['sentences_processed'] += 1
-                    
-                    # Progress update
-                    if stats['sentences_processed'] % 1000 == 0:
-                        logger.info(f"  Processed {stats['sentences_processed']} sentences, imported {stats['concepts_imported']} concepts")
+            stats = self._bulk_import_concepts(iter_sentences_progress(sentences_file), force=force)
             
             logger.info(f"Concept import completed: {stats['concepts_imported']} concepts imported for {stats['sentences_processed']} sentences")
             return stats
@@ -1001,80 +1092,6 @@ class SequentialCollectionProcessor:
         """Clean up resources."""
         if hasattr(self, 'driver'):
             self.driver.close()
+        if getattr(self, 'entity_memo', None) is not None:
+            self.entity_memo.close()
         logger.info("SequentialCollectionProcessor closed")
-    
-    def _force_create_concept_with_relationship(self, sentence_id: str, entity_name: str, entity_data: Dict, wikidata_entity) -> bool:
-        """Force create/update concept node and establish bidirectional relationship with sentence.
-        
-        This method bypasses existing checks and ensures all expected fields are populated.
-        
-        Args:
-            sentence_id: ID of the sentence
-            entity_name: Name of the entity/concept
-            entity_data: Entity data from JSON
-            wikidata_entity: WikidataEntity object
-            
-        Returns:
-            True if concept was created/updated successfully
-        """
-        query = """
-        // First, verify the sentence exists
-        MATCH (s:Sentence {sentence_id: $sentence_id})
-        
-        // Only proceed if sentence exists
-        WITH s
-        
-        // Force create/update the concept node with all expected fields
-        MERGE (c:Concept {wikidata_id: $wikidata_id})
-        ON CREATE SET
-            c.name = $name,
-            c.wikidata_name = $name,
-            c.label = $name,
-            c.description = $description,
-            c.aliases = $aliases,
-            c.wikidata_url = $wikidata_url,
-            c.created_at = datetime(),
-            c.updated_at = datetime()
-        ON MATCH SET
-            c.name = $name,
-            c.wikidata_name = $name,
-            c.label = $name,
-            c.description = $description,
-            c.aliases = $aliases,
-            c.wikidata_url = $wikidata_url,
-            c.updated_at = datetime()
-        
-        // Force recreate bidirectional relationships
-        MERGE (s)-[r1:SENTENCE_CONTAINS_CONCEPT]->(c)
-        ON CREATE SET r1.created_at = datetime()
-        ON MATCH SET r1.updated_at = datetime()
-        
-        MERGE (c)-[r2:CONCEPT_BELONGS_TO_SENTENCE]->(s)
-        ON CREATE SET r2.created_at = datetime()
-        ON MATCH SET r2.updated_at = datetime()
-        
-        RETURN c.wikidata_id as concept_id
-        """
-        
-        try:
-            with self.driver.session(database=self.neo4j_database) as session:
-                # Apply standard property keys for missing fields
-                description = entity_data.get('description', entity_name)
-                aliases = entity_data.get('aliases', [entity_name])
-                wikidata_url = f"https://www.wikidata.org/wiki/{wikidata_entity.qid}"
-                
-                result = session.run(query, {
-                    'sentence_id': sentence_id,
-                    'name': entity_name,
-                    'wikidata_id': wikidata_entity.qid,
-                    'description': description,
-                    'aliases': aliases,
-                    'wikidata_url': wikidata_url
-                })
-                
-                record = result.single()
-                return record is not None
-                
-        except Exception as e:
-            logger.error(f"Error force creating concept for sentence {sentence_id}: {e}")
-            return False
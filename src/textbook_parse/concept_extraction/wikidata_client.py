@@ -3,7 +3,7 @@
 import logging
 import time
 import threading
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterable, Set, Tuple
 import requests
 
 logger = logging.getLogger(__name__)
@@ -13,62 +13,152 @@ _api_lock = threading.Lock()
 _last_api_call = 0
 _min_delay = 1.0  # Minimum delay between API calls (seconds)
 
+WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
+
+# wbgetentities accepts at most 50 ids per request for regular clients
+MAX_IDS_PER_REQUEST = 50
+
+# Wikimedia disambiguation page - never a useful concept
+DISAMBIGUATION_QID = "Q4167410"
+DISAMBIGUATION_DESCRIPTION = "Wikimedia disambiguation page"
+
 class WikidataEntity:
     """Represents a Wikidata entity."""
-    
-    def __init__(self, qid: str, label: str, description: str = "", aliases: List[str] = None, wikidata_url: str = None):
+
+    def __init__(self, qid: str, label: str, description: str = "", aliases: List[str] = None, wikidata_url: str = None,
+                 instance_of: List[str] = None, subclass_of: List[str] = None):
         self.qid = qid
         self.label = label
         self.description = description
         self.aliases = aliases or []
         self.wikidata_url = wikidata_url or f"https://www.wikidata.org/wiki/{qid}"
-    
+        self.instance_of = instance_of
+        self.subclass_of = subclass_of
+
+    @property
+    def is_detailed(self) -> bool:
+        """True if the entity was resolved through wbgetentities (has claim data)."""
+        return self.instance_of is not None
+
     def to_dict(self) -> Dict:
         """Convert to dictionary for caching."""
-        return {
+        data = {
             'qid': self.qid,
             'label': self.label,
             'description': self.description,
             'aliases': self.aliases,
             'wikidata_url': self.wikidata_url
         }
+        if self.is_detailed:
+            data['instance_of'] = self.instance_of
+            data['subclass_of'] = self.subclass_of or []
+        return data
+
+def parse_entity_record(record: Dict, language: str = 'en') -> Optional[WikidataEntity]:
+    """Build a WikidataEntity from a full entity document.
+
+    Accepts the per-entity JSON returned by ``wbgetentities`` (the same shape
+    as a line of the Wikidata JSON dump). Returns None for missing entities.
+    """
+    if not record or 'missing' in record or not record.get('id'):
+        return None
+
+    qid = record['id']
+    label = record.get('labels', {}).get(language, {}).get('value', '')
+    description = record.get('descriptions', {}).get(language, {}).get('value', '')
+    aliases = [alias.get('value', '') for alias in record.get('aliases', {}).get(language, [])
+               if alias.get('value')]
+    claims = record.get('claims', {})
+
+    return WikidataEntity(
+        qid=qid,
+        label=label,
+        description=description,
+        aliases=aliases,
+        instance_of=_claim_item_ids(claims, 'P31'),
+        subclass_of=_claim_item_ids(claims, 'P279')
+    )
+
+def _claim_item_ids(claims: Dict, property_id: str) -> List[str]:
+    """Extract the item ids referenced by a property's claims."""
+    item_ids = []
+    for claim in claims.get(property_id, []):
+        value = claim.get('mainsnak', {}).get('datavalue', {}).get('value')
+        if isinstance(value, dict) and value.get('id'):
+            item_ids.append(value['id'])
+    return item_ids
+
+def _chunks(items: List[str], size: int) -> Iterable[List[str]]:
+    """Yield successive chunks of at most ``size`` items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 class WikidataClient:
-    """Thread-safe client for Wikidata API interactions."""
-    
-    def __init__(self, cache_manager):
+    """Thread-safe client for Wikidata API interactions.
+
+    Uncached terms are first linked offline through the optional
+    ``entity_linker`` (labels and aliases of already-cached QIDs). Remaining
+    terms are resolved in two stages: ``wbsearchentities`` finds candidate
+    QIDs for each term, then ``wbgetentities`` fetches details for up to 50
+    QIDs per request. QIDs that already have a detailed record in the cache
+    are not fetched again. Terms whose lookups failed are returned as None
+    but not cached, so a transient error does not become a permanent
+    negative entry.
+
+    A single term (``search_entity``) is resolved from its
+    ``wbsearchentities`` hit alone, one request instead of two.
+
+    When a ``dump_index`` (see ``dump_index.WikidataDumpIndex``) is given, both
+    stages are answered from the local dump index instead of HTTP and no
+    rate limiting applies.
+    """
+
+    def __init__(self, cache_manager, candidate_limit: int = 3, entity_linker=None, dump_index=None):
         self.cache_manager = cache_manager
+        self.candidate_limit = candidate_limit
+        self.entity_linker = entity_linker
+        self.dump_index = dump_index
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'ConceptExtractor/1.0 (Educational Research)'
         })
         self.api_calls = 0
+        self.search_calls = 0
+        self.entity_fetch_calls = 0
         self.cache_hits = 0
+        self.index_hits = 0
+        self.qid_cache_hits = 0
+        self.dump_lookups = 0
         self._stats_lock = threading.Lock()
-    
+
     def search_entity(self, term: str) -> Optional[WikidataEntity]:
         """Thread-safe search for entity in Wikidata, using cache first."""
-        # Check cache first
+        if self.dump_index is not None:
+            # Local lookups cost no round trips, so use the detailed two-stage path
+            return self.resolve_entities([term]).get(term)
+
         cached_data = self.cache_manager.get_cached_concept(term)
         if cached_data is not None:
             with self._stats_lock:
                 self.cache_hits += 1
-            if cached_data:  # Not a null cache entry
-                # Filter out cache-specific fields that aren't part of WikidataEntity
-                entity_data = {k: v for k, v in cached_data.items() 
-                              if k in ['qid', 'label', 'description', 'aliases', 'wikidata_url']}
-                return WikidataEntity(**entity_data)
-            return None
-        
-        # Make API request with global rate limiting
-        entity = self._api_search_with_rate_limit(term)
-        
+            return self._create_entity_from_cache(cached_data) if cached_data else None
+
+        linked_data = self._link_locally(term)
+        if linked_data:
+            entity = self._create_entity_from_cache(linked_data)
+        else:
+            search_results = self._search_with_rate_limit(term)
+            if search_results is None:
+                # Transient failure - leave the term uncached
+                return None
+            entity = self._select_search_result(search_results)
+            if entity and self.entity_linker is not None:
+                self.entity_linker.add_entity(entity.to_dict(), term)
+
         # Cache result (even if None)
-        cache_data = entity.to_dict() if entity else None
-        self.cache_manager.cache_concept(term, cache_data)
-        
+        self.cache_manager.cache_concept(term, entity.to_dict() if entity else None)
         return entity
-    
+
     def search_entity_cached_only(self, term: str) -> Optional[WikidataEntity]:
         """Search for entity using only cached data (no API calls)."""
         cached_data = self.cache_manager.get_cached_concept(term)
@@ -76,70 +166,245 @@ class WikidataClient:
             with self._stats_lock:
                 self.cache_hits += 1
             if cached_data:  # Not a null cache entry
-                entity_data = {k: v for k, v in cached_data.items() 
-                              if k in ['qid', 'label', 'description', 'aliases', 'wikidata_url']}
-                return WikidataEntity(**entity_data)
+                return self._create_entity_from_cache(cached_data)
             return None
-        
+
+        # The local index is offline too
+        linked_data = self._link_locally(term)
+        if linked_data:
+            return self._create_entity_from_cache(linked_data)
+
         # Return None if not in cache (no API call)
         return None
-    
-    def _api_search_with_rate_limit(self, term: str) -> Optional[WikidataEntity]:
-        """Make API request with global rate limiting across all threads."""
+
+    def _link_locally(self, term: str) -> Optional[Dict]:
+        """Look a term up in the local entity index, counting hits."""
+        if self.entity_linker is None:
+            return None
+
+        linked_data = self.entity_linker.lookup(term)
+        if linked_data:
+            with self._stats_lock:
+                self.index_hits += 1
+        return linked_data
+
+    def resolve_entities(self, terms: List[str]) -> Dict[str, Optional[WikidataEntity]]:
+        """Resolve many terms at once, using the cache first.
+
+        Args:
+            terms: Entity texts to resolve
+
+        Returns:
+            Dictionary mapping each term to its WikidataEntity (or None)
+        """
+        results = {}
+        uncached_terms = []
+        new_cache_entries = {}
+
+        for term in dict.fromkeys(terms):
+            cached_data = self.cache_manager.get_cached_concept(term)
+            if cached_data is not None:
+                with self._stats_lock:
+                    self.cache_hits += 1
+                results[term] = self._create_entity_from_cache(cached_data) if cached_data else None
+                continue
+
+            linked_data = self._link_locally(term)
+            if linked_data:
+                entity = self._create_entity_from_cache(linked_data)
+                results[term] = entity
+                new_cache_entries[term] = entity.to_dict()
+            else:
+                uncached_terms.append(term)
+
+        if not uncached_terms:
+            self.cache_manager.cache_concepts(new_cache_entries)
+            return results
+
+        # Stage 1: candidate QIDs per term (None if the search failed)
+        candidates = {term: self._search_candidates_with_rate_limit(term) for term in uncached_terms}
+
+        # Stage 2: entity details, batched and deduplicated against the cache
+        all_qids = list(dict.fromkeys(qid for qids in candidates.values() if qids for qid in qids))
+        details, failed_qids = self._get_entity_details(all_qids)
+
+        for term in uncached_terms:
+            qids = candidates[term]
+            if qids is None or failed_qids.intersection(qids):
+                # A lookup failed - the answer is unknown, so nothing is cached
+                results[term] = None
+                continue
+
+            entity = self._select_candidate(qids, details)
+            results[term] = entity
+            new_cache_entries[term] = entity.to_dict() if entity else None
+            if entity and self.entity_linker is not None:
+                self.entity_linker.add_entity(new_cache_entries[term], term)
+
+        # Cache results (even if None) in a single write
+        self.cache_manager.cache_concepts(new_cache_entries)
+
+        return results
+
+    def _select_candidate(self, qids: List[str], details: Dict[str, WikidataEntity]) -> Optional[WikidataEntity]:
+        """Pick the best-ranked candidate, skipping disambiguation pages."""
+        resolved = [details[qid] for qid in qids if qid in details]
+        for entity in resolved:
+            if DISAMBIGUATION_QID not in (entity.instance_of or []):
+                return entity
+        return resolved[0] if resolved else None
+
+    def _select_search_result(self, search_results: List[Dict]) -> Optional[WikidataEntity]:
+        """Pick the best-ranked wbsearchentities hit, skipping disambiguation pages.
+
+        A detailed cache record for the chosen QID is preferred over the hit itself.
+        """
+        results = [result for result in search_results if result.get('id')]
+        for result in results:
+            if result.get('description') != DISAMBIGUATION_DESCRIPTION:
+                break
+        else:
+            if not results:
+                return None
+            result = results[0]
+
+        cached_data = self.cache_manager.find_by_qids([result['id']]).get(result['id'])
+        if cached_data and 'instance_of' in cached_data:
+            with self._stats_lock:
+                self.qid_cache_hits += 1
+            return self._create_entity_from_cache(cached_data)
+
+        return WikidataEntity(
+            qid=result['id'],
+            label=result.get('label', ''),
+            description=result.get('description', ''),
+            aliases=list(result.get('aliases', []))
+        )
+
+    def _get_entity_details(self, qids: List[str]) -> Tuple[Dict[str, WikidataEntity], Set[str]]:
+        """Get detailed entities for QIDs, reusing detailed cache records.
+
+        Returns:
+            Tuple of (QID -> entity, QIDs whose fetch failed)
+        """
+        details = {}
+        failed_qids = set()
+
+        for qid, cached_data in self.cache_manager.find_by_qids(qids).items():
+            if 'instance_of' in cached_data:
+                details[qid] = self._create_entity_from_cache(cached_data)
+
+        if details:
+            with self._stats_lock:
+                self.qid_cache_hits += len(details)
+
+        missing_qids = [qid for qid in qids if qid not in details]
+        for chunk in _chunks(missing_qids, MAX_IDS_PER_REQUEST):
+            fetched = self._fetch_entities_with_rate_limit(chunk)
+            if fetched is None:
+                failed_qids.update(chunk)
+            else:
+                details.update(fetched)
+
+        return details, failed_qids
+
+    def _wait_for_rate_limit(self) -> None:
+        """Apply global rate limiting across all threads and count the call."""
         global _last_api_call
-        
-        # Global rate limiting
+
         with _api_lock:
             current_time = time.time()
             time_since_last_call = current_time - _last_api_call
-            
+
             if time_since_last_call < _min_delay:
                 sleep_time = _min_delay - time_since_last_call
                 time.sleep(sleep_time)
-            
+
             _last_api_call = time.time()
-            
+
             # Track API call
             with self._stats_lock:
                 self.api_calls += 1
-        
-        # Make the actual API request
-        return self._api_search(term)
-    
-    def _api_search(self, term: str) -> Optional[WikidataEntity]:
-        """Make actual API request to Wikidata."""
-        url = "https://www.wikidata.org/w/api.php"
+
+    def _search_candidates_with_rate_limit(self, term: str) -> Optional[List[str]]:
+        """Candidate QIDs for a term, best match first (None if the search failed)."""
+        if self.dump_index is not None:
+            with self._stats_lock:
+                self.dump_lookups += 1
+            return self.dump_index.search(term, self.candidate_limit)
+
+        search_results = self._search_with_rate_limit(term)
+        if search_results is None:
+            return None
+        return [result['id'] for result in search_results if result.get('id')]
+
+    def _search_with_rate_limit(self, term: str) -> Optional[List[Dict]]:
+        """Make a rate-limited wbsearchentities request."""
+        self._wait_for_rate_limit()
+        with self._stats_lock:
+            self.search_calls += 1
+        return self._search_candidates(term)
+
+    def _fetch_entities_with_rate_limit(self, qids: List[str]) -> Optional[Dict[str, WikidataEntity]]:
+        """Make a rate-limited wbgetentities request (or a local dump index fetch)."""
+        if self.dump_index is not None:
+            with self._stats_lock:
+                self.dump_lookups += 1
+            return self.dump_index.get_entities(qids)
+
+        self._wait_for_rate_limit()
+        with self._stats_lock:
+            self.entity_fetch_calls += 1
+        return self._fetch_entities(qids)
+
+    def _search_candidates(self, term: str) -> Optional[List[Dict]]:
+        """Search Wikidata for candidate entities, best match first (None on error)."""
         params = {
             'action': 'wbsearchentities',
             'search': term.strip(),
             'language': 'en',
             'format': 'json',
-            'limit': 1,
+            'limit': self.candidate_limit,
             'type': 'item'
         }
-        
+
         try:
-            response = self.session.get(url, params=params, timeout=10)
+            response = self.session.get(WIKIDATA_API_URL, params=params, timeout=10)
             response.raise_for_status()
-            
+
             data = response.json()
-            search_results = data.get('search', [])
-            
-            if search_results:
-                result = search_results[0]
-                return WikidataEntity(
-                    qid=result.get('id', ''),
-                    label=result.get('label', ''),
-                    description=result.get('description', ''),
-                    aliases=[alias for alias in result.get('aliases', [])]
-                )
-            
-            return None
-            
+            return data.get('search', [])
+
         except Exception as e:
             logger.warning(f"Error searching Wikidata for '{term}': {e}")
             return None
-    
+
+    def _fetch_entities(self, qids: List[str]) -> Optional[Dict[str, WikidataEntity]]:
+        """Fetch labels, descriptions, aliases and claims for up to 50 QIDs (None on error)."""
+        params = {
+            'action': 'wbgetentities',
+            'ids': '|'.join(qids),
+            'props': 'labels|descriptions|aliases|claims',
+            'languages': 'en',
+            'format': 'json'
+        }
+
+        try:
+            response = self.session.get(WIKIDATA_API_URL, params=params, timeout=30)
+            response.raise_for_status()
+
+            data = response.json()
+            entities = {}
+            for qid, record in data.get('entities', {}).items():
+                entity = parse_entity_record(record)
+                if entity:
+                    entities[qid] = entity
+            return entities
+
+        except Exception as e:
+            logger.warning(f"Error fetching Wikidata entities {qids[0]}..{qids[-1]}: {e}")
+            return None
+
     def _create_entity_from_cache(self, cached_data: Dict) -> WikidataEntity:
         """Create WikidataEntity object from cached data."""
         return WikidataEntity(
@@ -147,17 +412,24 @@ class WikidataClient:
             label=cached_data['label'],
             description=cached_data.get('description', ''),
             aliases=cached_data.get('aliases', []),
-            wikidata_url=cached_data.get('wikidata_url')
+            wikidata_url=cached_data.get('wikidata_url'),
+            instance_of=cached_data.get('instance_of'),
+            subclass_of=cached_data.get('subclass_of')
         )
-    
+
     def get_stats(self) -> Dict[str, int]:
         """Get thread-safe client statistics."""
         with self._stats_lock:
             total_requests = self.api_calls + self.cache_hits
             cache_hit_rate = (self.cache_hits / total_requests * 100) if total_requests > 0 else 0
-            
+
             return {
                 'api_calls': self.api_calls,
+                'search_calls': self.search_calls,
+                'entity_fetch_calls': self.entity_fetch_calls,
                 'cache_hits': self.cache_hits,
+                'index_hits': self.index_hits,
+                'qid_cache_hits': self.qid_cache_hits,
+                'dump_lookups': self.dump_lookups,
                 'cache_hit_rate': cache_hit_rate
             }
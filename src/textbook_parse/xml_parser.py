@@ -23,9 +23,18 @@ except ImportError:
 
 from neo4j_utils.nodes import Neo4jNodeCreator
 from neo4j_utils.relationships import Neo4jRelationshipCreator
+from neo4j_utils.ancestry import materialize_ancestry
 
 logger = logging.getLogger(__name__)
 
+def clean_book_id(book_id: str) -> str:
+    """Namespace prefix derived from a book_id, as used in namespaced node IDs.
+
+    For a collection without a slug the book_id is the collection file name, so
+    this also equals the collection name the concept pipeline works with.
+    """
+    return book_id.replace('.collection', '').replace(' ', '-').lower()
+
 class OpenStaxXMLParser:
     """Parser for OpenStax XML/CNXML files with dual labeling schema."""
     
@@ -671,8 +680,7 @@ class OpenStaxXMLParser:
         # Helper function to create namespaced IDs
         def create_namespaced_id(original_id: str) -> str:
             """Create a namespaced ID to prevent conflicts across textbooks."""
-            clean_book_id = book_id.replace('.collection', '').replace(' ', '-').lower()
-            return f"{clean_book_id}-{original_id}"
+            return f"{clean_book_id(book_id)}-{original_id}"
         
         # Process content hierarchy recursively
         content = collection_data.get('content', [])
@@ -808,6 +816,10 @@ class OpenStaxXMLParser:
         # Start recursive processing from the root level with processed content
         process_content_recursive(processed_content, book_id, 'book', 0)
         
+        # Every node carries its book_id so collection-scoped queries can use the book_id indexes
+        for node_type, node_data in nodes:
+            node_data.setdefault('book_id', book_id)
+        
         return nodes, relationships, document_parent_map
     
     def create_nodes_from_module(self, module_data: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
@@ -839,9 +851,9 @@ class OpenStaxXMLParser:
                 if ns_doc_id.endswith(f"_{original_document_id}"):
                     namespaced_document_id = ns_doc_id
                     # Extract book_id from namespaced ID
-                    clean_book_id = ns_doc_id.split(f"_{original_document_id}")[0]
-                    # Convert clean_book_id back to book_id format (with hyphens)
-                    book_id = clean_book_id.replace('_', '-')
+                    namespace_prefix = ns_doc_id.split(f"_{original_document_id}")[0]
+                    # Convert the namespace prefix back to book_id format (with hyphens)
+                    book_id = namespace_prefix.replace('_', '-')
                     break
             
             if not namespaced_document_id:
@@ -868,13 +880,13 @@ class OpenStaxXMLParser:
                     book_id = "unknown_book"
                 
                 # Convert book_id to clean format for namespaced ID
-                clean_book_id = book_id.replace(' ', '-').lower()
-                namespaced_document_id = f"{clean_book_id}-{original_document_id}"
+                namespace_prefix = clean_book_id(book_id)
+                namespaced_document_id = f"{namespace_prefix}-{original_document_id}"
         else:
             logger.warning(f"No document map available - creating standalone document for {original_document_id}")
             book_id = "unknown_book"
-            clean_book_id = book_id.replace(' ', '-').lower()
-            namespaced_document_id = f"{clean_book_id}-{original_document_id}"
+            namespace_prefix = clean_book_id(book_id)
+            namespaced_document_id = f"{namespace_prefix}-{original_document_id}"
         
         # logger.info(f"Found namespaced document_id: {namespaced_document_id} for original: {original_document_id}")
         
@@ -918,7 +930,7 @@ class OpenStaxXMLParser:
                     logger.warning(f"Subsection {subsection_id} missing title! Subsection data: {section_data}")
                 
                 # Create namespaced subsection ID
-                namespaced_subsection_id = f"{clean_book_id}-{subsection_id}"
+                namespaced_subsection_id = f"{namespace_prefix}-{subsection_id}"
                 
                 subsection_data = {
                     'subsection_id': namespaced_subsection_id,
@@ -939,7 +951,7 @@ class OpenStaxXMLParser:
                     if subsection_content['type'] == 'paragraph':
                         # Create namespaced paragraph ID
                         original_paragraph_id = subsection_content['paragraph_id']
-                        namespaced_paragraph_id = f"{clean_book_id}-{original_paragraph_id}"
+                        namespaced_paragraph_id = f"{namespace_prefix}-{original_paragraph_id}"
                         
                         paragraph_data = {
                             'paragraph_id': namespaced_paragraph_id,
@@ -983,7 +995,7 @@ class OpenStaxXMLParser:
                     logger.warning(f"Section {section_id} missing title! Section data: {section_data}")
                 
                 # Create namespaced section ID
-                namespaced_section_id = f"{clean_book_id}-{section_id}"
+                namespaced_section_id = f"{namespace_prefix}-{section_id}"
                 
                 section_node_data = {
                     'section_id': namespaced_section_id,
@@ -1019,7 +1031,7 @@ class OpenStaxXMLParser:
                             logger.warning(f"Subsection {subsection_id} missing title! Subsection data: {content_item}")
                         
                         # Create namespaced subsection ID
-                        namespaced_subsection_id = f"{clean_book_id}-{subsection_id}"
+                        namespaced_subsection_id = f"{namespace_prefix}-{subsection_id}"
                         
                         subsection_data = {
                             'subsection_id': namespaced_subsection_id,
@@ -1040,7 +1052,7 @@ class OpenStaxXMLParser:
                             if subsection_content['type'] == 'paragraph':
                                 # Create namespaced paragraph ID
                                 original_paragraph_id = subsection_content['paragraph_id']
-                                namespaced_paragraph_id = f"{clean_book_id}-{original_paragraph_id}"
+                                namespaced_paragraph_id = f"{namespace_prefix}-{original_paragraph_id}"
                                 
                                 paragraph_data = {
                                     'paragraph_id': namespaced_paragraph_id,
@@ -1075,7 +1087,7 @@ class OpenStaxXMLParser:
                     elif content_item['type'] == 'paragraph':
                         # Create namespaced paragraph ID
                         original_paragraph_id = content_item['paragraph_id']
-                        namespaced_paragraph_id = f"{clean_book_id}-{original_paragraph_id}"
+                        namespaced_paragraph_id = f"{namespace_prefix}-{original_paragraph_id}"
                         
                         paragraph_data = {
                             'paragraph_id': namespaced_paragraph_id,
@@ -1125,7 +1137,7 @@ class OpenStaxXMLParser:
             elif section_data['type'] == 'paragraph':
                 # Create namespaced paragraph ID for standalone paragraphs
                 original_paragraph_id = section_data['paragraph_id']
-                namespaced_paragraph_id = f"{clean_book_id}-{original_paragraph_id}"
+                namespaced_paragraph_id = f"{namespace_prefix}-{original_paragraph_id}"
                 
                 paragraph_data = {
                     'paragraph_id': namespaced_paragraph_id,
@@ -1173,6 +1185,10 @@ class OpenStaxXMLParser:
                 continue
         
         # logger.info(f"Module processing complete: {len(nodes)} nodes, {len(relationships)} relationships created for namespaced_document_id='{namespaced_document_id}' (original: '{original_document_id})')")
+        # Every node carries its book_id so collection-scoped queries can use the book_id indexes
+        for node_type, node_data in nodes:
+            node_data.setdefault('book_id', book_id)
+        
         return nodes, relationships, document_update
     
     def create_nodes_in_neo4j(self, nodes: List[Tuple[str, Dict[str, Any]]]) -> int:
@@ -1269,14 +1285,14 @@ class OpenStaxXMLParser:
         relationships = []
         
         # Convert book_id to clean format for namespaced ID
-        clean_book_id = book_id.replace(' ', '-').lower()
+        namespace_prefix = clean_book_id(book_id)
         
         for i, concept_text in enumerate(concepts):
             if not concept_text.strip():
                 continue
                 
             # Create namespaced concept ID
-            concept_id = f"{clean_book_id}-concept-{sentence_id}-{i}"
+            concept_id = f"{namespace_prefix}-concept-{sentence_id}-{i}"
             
             concept_data = {
                 'concept_id': concept_id,
@@ -1453,6 +1469,11 @@ class OpenStaxXMLParser:
                     print(f"    Created {fixes['missing_paragraphs_created']} missing paragraph nodes")
                 else:
                     print("    No orphaned nodes found")
+                
+                # The hierarchy is final now, so copy it onto paragraphs and sentences for retrieval
+                print("  Materializing sentence ancestry...")
+                properties_set = self.materialize_ancestry(book_id)
+                print(f"    Set {properties_set} ancestry properties")
             
             return True
             
@@ -1511,6 +1532,27 @@ class OpenStaxXMLParser:
             logger.error(f"Error verifying import: {e}")
             return None
 
+    def materialize_ancestry(self, book_id: str = None, database: str = None) -> int:
+        """
+        Copy ancestor IDs and titles onto Paragraph and Sentence nodes.
+        
+        Args:
+            book_id: Only materialize nodes of this book (all books if None)
+            database: Database name (uses instance database if None)
+            
+        Returns:
+            Number of properties set
+        """
+        if database is None:
+            database = self.node_creator.database
+        
+        # Ensure driver is connected
+        if not self.node_creator.driver:
+            self.node_creator._connect()
+        
+        with self.node_creator.driver.session(database=database) as session:
+            return materialize_ancestry(session, book_id)
+    
     def fix_orphaned_nodes(self, database: str = None) -> Dict[str, int]:
         """
         Fix orphaned nodes by creating missing relationships and nodes.
@@ -1562,16 +1604,10 @@ class OpenStaxXMLParser:
                 
                 # Create missing paragraph nodes
                 for paragraph_id, sentences in paragraphs_to_create.items():
-                    # Extract book_id from paragraph_id
-                    parts = paragraph_id.split('_')
-                    if len(parts) >= 4:
-                        book_id = '_'.join(parts[:-1]).replace('_', '-')
-                    else:
-                        book_id = "unknown"
-                    
                     # Create paragraph node
                     paragraph_data = {
                         'paragraph_id': paragraph_id,
+                        'book_id': sentences[0].get('book_id'),
                         'subsection_id': None,
                         'text': '',  # Will be reconstructed from sentences if needed
                         'uuid': '',
@@ -1602,6 +1638,10 @@ class OpenStaxXMLParser:
                     fixes['orphaned_sentences_fixed'] += len(sentences)
                 
                 logger.info(f"Created {fixes['missing_paragraphs_created']} missing paragraphs and fixed {fixes['orphaned_sentences_fixed']} sentence relationships")
+                
+                # Materialize the new paragraphs by ID: a collection's materialize_ancestry(book_id)
+                # skips them when their sentences carry a book_id other than the collection's
+                materialize_ancestry(session, paragraph_ids=list(paragraphs_to_create))
             
             # Fix orphaned documents by connecting them to their books
             logger.info("Fixing orphaned documents...")
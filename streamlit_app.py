@@ -265,6 +265,16 @@ def main():
                 help="Maximum attempts for Cypher query generation"
             )
             
+            # Parallel candidates control
+            cypher_candidates = st.slider(
+                "⚡ Parallel Candidates",
+                min_value=1,
+                max_value=5,
+                value=getattr(pipeline, 'cypher_candidates', 1),
+                step=1,
+                help="Cypher queries generated concurrently per attempt (first valid one is used)"
+            )
+            
             st.subheader("🎛️ Response Configuration")
             
             # Include Cypher in response
@@ -288,6 +298,7 @@ def main():
                     temperature=temperature,
                     max_results=max_results,
                     max_cypher_attempts=max_attempts,
+                    cypher_candidates=cypher_candidates,
                     include_cypher_in_response=include_cypher,
                     include_metadata=include_metadata,
                     response_style="educational"  # Default response style
@@ -303,6 +314,7 @@ def main():
                 "Temperature": getattr(pipeline, 'temperature', 0.1),
                 "Max Results": 10,  # Force default to 10
                 "Max Attempts": getattr(pipeline, 'max_cypher_attempts', 3),
+                "Parallel Candidates": getattr(pipeline, 'cypher_candidates', 1),
                 "Response Style": "educational",  # Default response style
                 "Show Cypher": getattr(pipeline, 'include_cypher_in_response', True),
                 "Show Metadata": getattr(pipeline, 'include_metadata', True)
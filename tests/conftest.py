@@ -0,0 +1,8 @@
+"""Shared test setup: make the src/ packages importable."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
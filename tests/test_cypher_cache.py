@@ -0,0 +1,42 @@
+"""Tests for the Cypher query cache tiers."""
+
+import pytest
+
+from chainlit_app.cypher_cache import CypherQueryCache
+
+SCOPE = "gpt-4o-mini:v1:abc123"
+BONE_QUERY = "MATCH (s:Sentence) WHERE s.text CONTAINS 'bone tissue' RETURN s.text"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = CypherQueryCache(str(tmp_path / "cypher_cache.sqlite"), similarity_threshold=0.5)
+    yield cache
+    cache.close()
+
+
+def test_exact_hit_returns_stored_question(cache):
+    cache.put(SCOPE, "What is bone tissue?", BONE_QUERY)
+
+    assert cache.get(SCOPE, "what is bone tissue") == (BONE_QUERY, 'exact', "what is bone tissue")
+
+
+def test_similar_hit_requires_query_literals_in_question(cache):
+    cache.put(SCOPE, "What is bone tissue made of?", BONE_QUERY)
+
+    # Same literal: the query answers the new question too
+    assert cache.get(SCOPE, "What is bone tissue composed of?") == (
+        BONE_QUERY, 'similar', "what is bone tissue made of"
+    )
+    # One noun differs: the cached query would search for the wrong term
+    assert cache.get(SCOPE, "What is muscle tissue made of?") == (None, None, None)
+
+
+def test_delete_removes_entry_from_both_tiers(cache):
+    cache.put(SCOPE, "What is bone tissue made of?", BONE_QUERY)
+    _, _, cached_question = cache.get(SCOPE, "What is bone tissue composed of?")
+
+    assert cache.delete(SCOPE, cached_question)
+    assert not cache.delete(SCOPE, cached_question)
+    assert cache.get(SCOPE, "What is bone tissue composed of?") == (None, None, None)
+    assert cache.get(SCOPE, "What is bone tissue made of?") == (None, None, None)
@@ -0,0 +1,111 @@
+"""Tests for the Wikidata dump index against a small synthetic dump."""
+
+import sqlite3
+
+import pytest
+
+from conftest import FIXTURES_DIR
+from textbook_parse.concept_extraction import dump_index
+from textbook_parse.concept_extraction.cache_manager import CacheManager
+from textbook_parse.concept_extraction.dump_index import WikidataDumpIndex, build_dump_index
+from textbook_parse.concept_extraction.wikidata_client import WikidataClient
+
+DUMP_PATH = FIXTURES_DIR / "wikidata_dump.json"
+DUMP_ITEMS = 5  # Items in the fixture; the property and array brackets are skipped
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "wikidata_index.sqlite")
+
+
+def labels(index_path):
+    with sqlite3.connect(index_path) as connection:
+        return dict(connection.execute("SELECT qid, label FROM entities").fetchall())
+
+
+def test_build_indexes_items_and_terms(index_path):
+    stats = build_dump_index(str(DUMP_PATH), index_path, workers=1, chunk_lines=2)
+
+    assert stats['entities_seen'] == DUMP_ITEMS
+    assert stats['entities_written'] == DUMP_ITEMS
+
+    index = WikidataDumpIndex(index_path)
+    # Labels rank before aliases, more sitelinks first
+    assert index.search("Cell") == ["Q7868", "Q225919"]
+    assert index.search("mitochondria") == ["Q39572"]
+    assert index.search("instance of") == []
+
+    entities = index.get_entities(["Q7868", "Q225919"])
+    assert entities["Q7868"].aliases == ["biological cell", "cells"]
+    assert entities["Q225919"].instance_of == ["Q4167410"]
+    assert index.get_stats()['complete']
+
+
+def test_interrupted_build_resumes_at_byte_offset(index_path, monkeypatch):
+    write_rows = dump_index._write_rows
+    chunks_written = []
+
+    def fail_after_first_chunk(connection, rows, end_offset, *args):
+        if chunks_written:
+            raise KeyboardInterrupt
+        write_rows(connection, rows, end_offset, *args)
+        chunks_written.append(len(rows))
+
+    monkeypatch.setattr(dump_index, "_write_rows", fail_after_first_chunk)
+    with pytest.raises(KeyboardInterrupt):
+        build_dump_index(str(DUMP_PATH), index_path, workers=1, chunk_lines=3)
+    monkeypatch.setattr(dump_index, "_write_rows", write_rows)
+
+    assert not WikidataDumpIndex(index_path).get_stats()['complete']
+
+    stats = build_dump_index(str(DUMP_PATH), index_path, workers=1, chunk_lines=3)
+
+    assert stats['entities_seen'] == DUMP_ITEMS - chunks_written[0]
+    assert stats['entities_unchanged'] == 0
+    assert len(labels(index_path)) == DUMP_ITEMS
+    assert WikidataDumpIndex(index_path).get_stats()['complete']
+
+
+def test_rescan_skips_unchanged_revisions(index_path):
+    build_dump_index(str(DUMP_PATH), index_path, workers=1)
+
+    stats = build_dump_index(str(DUMP_PATH), index_path, workers=1, restart=True)
+
+    assert stats['entities_unchanged'] == DUMP_ITEMS
+    assert stats['entities_written'] == 0
+
+
+def test_language_change_rewrites_labels(index_path):
+    build_dump_index(str(DUMP_PATH), index_path, workers=1)
+    assert labels(index_path)["Q7868"] == "cell"
+
+    stats = build_dump_index(str(DUMP_PATH), index_path, workers=1, language='de')
+
+    assert stats['entities_written'] == DUMP_ITEMS
+    assert labels(index_path)["Q7868"] == "Zelle"
+    assert WikidataDumpIndex(index_path).search("zelle") == ["Q7868"]
+    assert WikidataDumpIndex(index_path).search("cell") == []
+
+
+class OfflineSession:
+    """Fails the test on any HTTP request."""
+
+    def get(self, *args, **kwargs):
+        raise AssertionError("dump index backend must not call the Wikidata API")
+
+
+def test_client_resolves_through_dump_index(index_path, tmp_path):
+    build_dump_index(str(DUMP_PATH), index_path, workers=1)
+    client = WikidataClient(CacheManager(str(tmp_path / "wikidata_cache.json")),
+                            dump_index=WikidataDumpIndex(index_path))
+    client.session = OfflineSession()
+
+    results = client.resolve_entities(["cell", "proteins", "unknown term"])
+
+    assert results["cell"].qid == "Q7868"  # Disambiguation page skipped
+    assert results["proteins"].qid == "Q8054"
+    assert results["unknown term"] is None
+    assert client.search_entity("photosynthesis").qid == "Q11982"
+    assert client.get_stats()['api_calls'] == 0
+    assert client.get_stats()['dump_lookups'] > 0
@@ -0,0 +1,32 @@
+"""Tests for the driver-independent parts of the graph retrievers."""
+
+from chainlit_app.async_graph_retriever import AsyncGraphRetriever
+from chainlit_app.graph_retriever import GraphRetriever, merge_batched_sentences
+
+
+def sentence(sentence_id, score=None):
+    return {'sentence_id': sentence_id, 'text': f"Text of {sentence_id}", 'score': score}
+
+
+def test_merge_ranks_concept_sentences_first_and_keeps_best_score():
+    concept_sentences = [sentence('s2'), sentence('s1')]
+    term_sentences = [sentence('s3', 4.0), sentence('s1', 2.5), sentence('s4', 1.0)]
+
+    merged = merge_batched_sentences(concept_sentences, term_sentences, sentence_limit=3)
+
+    assert [(row['sentence_id'], row['score']) for row in merged] == [('s2', None), ('s1', 2.5), ('s3', 4.0)]
+    assert concept_sentences[1]['score'] is None
+
+
+def test_retrievers_share_one_hierarchy_cache():
+    connection = dict(uri="bolt://localhost:7687", username="", password="", database="neo4j")
+    retriever = GraphRetriever(**connection)
+    async_retriever = AsyncGraphRetriever(hierarchy_cache=retriever.hierarchy_cache, **connection)
+
+    context, missing_ids = async_retriever._split_cached_contexts(['s1', 's2', 's1'])
+    async_retriever._add_queried_contexts(context, [{'sentence_id': 's1', 'chapter_id': 'c1'}])
+    context, missing_ids = retriever._split_cached_contexts(['s1', 's2'])
+
+    assert context == {'s1': {'sentence_id': 's1', 'chapter_id': 'c1'}}
+    assert missing_ids == ['s2']
+    assert retriever.get_hierarchy_cache_stats()['hits'] == 1
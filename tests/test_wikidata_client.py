@@ -0,0 +1,148 @@
+"""Offline tests for WikidataClient against recorded Wikidata API responses."""
+
+import json
+
+import pytest
+import requests
+
+from conftest import FIXTURES_DIR
+from textbook_parse.concept_extraction import wikidata_client
+from textbook_parse.concept_extraction.cache_manager import CacheManager
+from textbook_parse.concept_extraction.wikidata_client import WikidataClient, MAX_IDS_PER_REQUEST
+
+RECORDED = FIXTURES_DIR / "wikidata"
+
+
+class RecordedResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Server Error")
+
+    def json(self):
+        return self.payload
+
+
+class RecordedSession:
+    """Serves recorded wbsearchentities/wbgetentities responses and logs every request."""
+
+    def __init__(self, fail_actions=()):
+        self.fail_actions = set(fail_actions)
+        self.requests = []
+        self.entities = {}
+        for path in RECORDED.glob("wbgetentities_*.json"):
+            self.entities.update(json.loads(path.read_text(encoding="utf-8"))["entities"])
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(dict(params))
+        if params["action"] in self.fail_actions:
+            return RecordedResponse({}, status_code=503)
+
+        if params["action"] == "wbsearchentities":
+            path = RECORDED / f"wbsearchentities_{params['search']}.json"
+            if not path.exists():
+                return RecordedResponse({"searchinfo": {"search": params["search"]}, "search": [], "success": 1})
+            return RecordedResponse(json.loads(path.read_text(encoding="utf-8")))
+
+        ids = params["ids"].split("|")
+        entities = {qid: self.entities.get(qid, {"id": qid, "missing": ""}) for qid in ids}
+        return RecordedResponse({"entities": entities, "success": 1})
+
+    def calls(self, action):
+        return [params for params in self.requests if params["action"] == action]
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    monkeypatch.setattr(wikidata_client, "_min_delay", 0)
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    return CacheManager(str(tmp_path / "wikidata_cache.json"))
+
+
+def make_client(cache_manager, session):
+    client = WikidataClient(cache_manager)
+    client.session = session
+    return client
+
+
+def test_resolve_entities_skips_disambiguation(cache_manager):
+    session = RecordedSession()
+    client = make_client(cache_manager, session)
+
+    results = client.resolve_entities(["cell", "mitochondrion"])
+
+    assert results["cell"].qid == "Q7868"
+    assert results["cell"].aliases == ["biological cell", "cells"]
+    assert results["mitochondrion"].qid == "Q39572"
+    assert len(session.calls("wbsearchentities")) == 2
+    assert len(session.calls("wbgetentities")) == 1
+    assert cache_manager.get_cached_concept("cell")["qid"] == "Q7868"
+
+
+def test_resolve_entities_caches_unknown_terms_as_none(cache_manager):
+    client = make_client(cache_manager, RecordedSession())
+
+    assert client.resolve_entities(["flux capacitor"]) == {"flux capacitor": None}
+    assert "flux capacitor" in cache_manager.get_all_entries()
+
+
+def test_entity_fetches_are_chunked_at_50(cache_manager):
+    session = RecordedSession()
+    client = make_client(cache_manager, session)
+    qids = [f"Q{number}" for number in range(1000, 1000 + 2 * MAX_IDS_PER_REQUEST + 20)]
+
+    client._get_entity_details(qids)
+
+    chunk_sizes = [len(params["ids"].split("|")) for params in session.calls("wbgetentities")]
+    assert chunk_sizes == [50, 50, 20]
+
+
+def test_detailed_cached_qids_are_not_fetched_again(cache_manager):
+    session = RecordedSession()
+    client = make_client(cache_manager, session)
+    cell = wikidata_client.parse_entity_record(session.entities["Q7868"])
+    cache_manager.cache_concept("biological cell", cell.to_dict())
+
+    results = client.resolve_entities(["cell"])
+
+    fetched_ids = [qid for params in session.calls("wbgetentities") for qid in params["ids"].split("|")]
+    assert results["cell"].qid == "Q7868"
+    assert fetched_ids == ["Q225919"]
+    assert client.get_stats()["qid_cache_hits"] == 1
+
+
+@pytest.mark.parametrize("failing_action", ["wbsearchentities", "wbgetentities"])
+def test_failed_lookups_are_not_cached(cache_manager, failing_action):
+    client = make_client(cache_manager, RecordedSession(fail_actions=[failing_action]))
+
+    results = client.resolve_entities(["cell", "mitochondrion"])
+
+    assert results == {"cell": None, "mitochondrion": None}
+    assert cache_manager.get_all_entries() == {}
+
+
+def test_search_entity_uses_a_single_request(cache_manager):
+    session = RecordedSession()
+    client = make_client(cache_manager, session)
+
+    entity = client.search_entity("cell")
+
+    assert entity.qid == "Q7868"
+    assert len(session.requests) == 1
+    assert client.search_entity("cell").qid == "Q7868"
+    assert len(session.requests) == 1
+
+
+def test_search_entity_failure_is_not_cached(cache_manager):
+    client = make_client(cache_manager, RecordedSession(fail_actions=["wbsearchentities"]))
+
+    assert client.search_entity("cell") is None
+    assert cache_manager.get_cached_concept("cell") is None